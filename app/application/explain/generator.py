@@ -1,21 +1,47 @@
+from typing import AsyncIterator, Optional
+
+from app.application.shared.priority import current_llm_priority
+from app.application.shared.statement import StatementCompactor
+
 from app.domain.ports.llm.llm_port import TextLLMPort
 from app.domain.ports.llm.models import LLMRequest
-from app.domain.explain.models.models import ExplainProblemStatementRequest, ExplainProblemStatementResponse
+from app.domain.explain.models.models import (
+    ExplainationMode,
+    ExplainProblemStatementRequest,
+    ExplainProblemStatementResponse,
+)
+
+_AUDIENCE = {
+    ExplainationMode.BEGINNER: "a beginner or 5 - year old child",
+    ExplainationMode.INTERMEDIATE: "a developer who knows the common data structures but not this problem",
+    ExplainationMode.ADVANCED: "an experienced competitive programmer, naming the relevant patterns and complexity bounds",
+}
 
 
 class ProblemStatementExplainer:
-    def __init__(self, llm_port: TextLLMPort):
+    def __init__(self, llm_port: TextLLMPort, compactor: Optional[StatementCompactor] = None):
         self.llm_port = llm_port
+        self.compactor = compactor if compactor is not None else StatementCompactor()
 
     async def explain_problem_statement(self, request: ExplainProblemStatementRequest) -> ExplainProblemStatementResponse:
-        llm_request = LLMRequest(
-            user_prompt=self.__prepare_user_prompt(request),
-            system_prompt=self.__prepare_system_prompt(request)
-        )
-        response = await self.llm_port.generate_text_output(llm_request)
+        response = await self.llm_port.generate_text_output(self.__prepare_llm_request(request))
         return ExplainProblemStatementResponse(
             question_slug=request.problem_statement.question_slug,
-            explaination=response
+            explaination=response.content
+        )
+
+    async def stream_explain_problem_statement(self, request: ExplainProblemStatementRequest) -> AsyncIterator[str]:
+        """Yields the explanation as text deltas while the model generates it."""
+        async for delta in self.llm_port.stream_text_output(self.__prepare_llm_request(request)):
+            yield delta
+
+    def __prepare_llm_request(self, request: ExplainProblemStatementRequest) -> LLMRequest:
+        return LLMRequest(
+            user_prompt=self.__prepare_user_prompt(request),
+            system_prompt=self.__prepare_system_prompt(request),
+            priority=current_llm_priority(),
+            feature="explain",
+            question_slug=request.problem_statement.question_slug
         )
     
     def __prepare_system_prompt(self, request: ExplainProblemStatementRequest) -> str:
@@ -23,7 +49,7 @@ class ProblemStatementExplainer:
         You are an expert teacher with several years of experience who explains the LeetCode problem statement and makes it easy to understand.
         You HAVE TO understand that very often the statement is complex and can lead to incorrect solution and approach.
         Your task is to explain the problem statement in a way that is easy to understand and helps the user to understand what he has to do.
-        Explain the problem like you are explaining to a beginner or 5 - year old child.
+        Explain the problem like you are explaining to {_AUDIENCE[request.mode]}.
         <GUIDELINES>
             - YOU ARE NOT ALLOWED to provide any code or solution to the problem.
             - YOU ARE NOT ALLOWED TO go beyond the borders of the problem
@@ -35,12 +61,12 @@ class ProblemStatementExplainer:
             - YOU ARE NOT ALLOWED to provide any code or solution to the problem.
         </OUTPUT_FORMAT>
         <PROBLEM_STATEMENT>
-        {request.problem_statement.question_content}
+        {self.compactor.compact(request.problem_statement).text}
         </PROBLEM_STATEMENT>
         """
 
     def __prepare_user_prompt(self, request: ExplainProblemStatementRequest) -> str:
         return f"""
-        Explain the problem statement like you are explaining to a beginner or 5 - year old child.
+        Explain the problem statement like you are explaining to {_AUDIENCE[request.mode]}.
         """
         
\ No newline at end of file
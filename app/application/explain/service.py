@@ -1,7 +1,12 @@
+from typing import AsyncIterator, Optional
+
+from app.application.shared.deadline import deadline
+from app.application.shared.tracing import span
+
 from app.domain.ports.api.leetcode import GetProblemDetailsPort, QuestionSlugExtractorPort
 from app.domain.shared.leetcode.models import LeetCodeProblem
 from app.application.explain.generator import ProblemStatementExplainer
-from app.domain.explain.models.models import ExplainProblemStatementRequest, ExplainationMode
+from app.domain.explain.models.models import ExplainProblemStatementRequest, ExplainProblemStatementResponse, ExplainationMode
 
 
 class ExplanationError(Exception):
@@ -14,20 +19,42 @@ class ExplanationService:
         question_slug_extractor: QuestionSlugExtractorPort,
         problem_details_port: GetProblemDetailsPort,
         problem_statement_explainer: ProblemStatementExplainer,
+        deadline_seconds: Optional[float] = None,
     ) -> None:
         self._question_slug_extractor = question_slug_extractor
         self._problem_details_port = problem_details_port
         self._problem_statement_explainer = problem_statement_explainer
+        self._deadline_seconds = deadline_seconds
 
-    async def explain(self, user_input: str) -> str:
+    async def explain(
+        self, user_input: str, mode: ExplainationMode = ExplainationMode.BEGINNER
+    ) -> ExplainProblemStatementResponse:
         try:
-            question_slug = self._question_slug_extractor.extract_question_slug(user_input)
-            problem = LeetCodeProblem.of(question_slug)
-            problem_details = self._problem_details_port.get_problem_details(problem)
-            explain_problem_statement_request = ExplainProblemStatementRequest(
-                problem_statement=problem_details,
-                mode=ExplainationMode.BEGINNER
-            )
-            return await self._problem_statement_explainer.explain_problem_statement(explain_problem_statement_request)
+            with span("explain.service", mode=mode.value), deadline(self._deadline_seconds):
+                explain_problem_statement_request = await self._prepare_request(user_input, mode)
+                return await self._problem_statement_explainer.explain_problem_statement(explain_problem_statement_request)
         except Exception as e:
             raise ExplanationError(f"Failed to generate explanation: {e}") from e
+
+    async def stream_explain(
+        self, user_input: str, mode: ExplainationMode = ExplainationMode.BEGINNER
+    ) -> AsyncIterator[str]:
+        """Streams the explanation as text deltas."""
+        try:
+            with span("explain.service", mode=mode.value, streaming=True), deadline(self._deadline_seconds):
+                explain_problem_statement_request = await self._prepare_request(user_input, mode)
+                async for delta in self._problem_statement_explainer.stream_explain_problem_statement(
+                    explain_problem_statement_request
+                ):
+                    yield delta
+        except Exception as e:
+            raise ExplanationError(f"Failed to generate explanation: {e}") from e
+
+    async def _prepare_request(self, user_input: str, mode: ExplainationMode) -> ExplainProblemStatementRequest:
+        question_slug = self._question_slug_extractor.extract_question_slug(user_input)
+        problem = LeetCodeProblem.of(question_slug)
+        problem_details = await self._problem_details_port.get_problem_details(problem)
+        return ExplainProblemStatementRequest(
+            problem_statement=problem_details,
+            mode=mode
+        )
@@ -0,0 +1,42 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+ItemT = TypeVar('ItemT')
+R = TypeVar('R')
+
+
+async def map_bounded(
+    items: Sequence[ItemT],
+    fn: Callable[[int, ItemT], Awaitable[R]],
+    concurrency: int,
+) -> AsyncIterator[Tuple[int, R]]:
+    """Runs `fn(index, item)` with at most `concurrency` calls in flight, yielding `(index, result)` as each completes.
+
+    `fn` is expected to turn per-item failures into results; an exception it lets escape stops the
+    batch and is re-raised here. Closing the iterator early cancels the calls still running.
+    """
+    completed: "asyncio.Queue[Tuple[int, Optional[R], Optional[BaseException]]]" = asyncio.Queue()
+    indices = iter(range(len(items)))
+
+    async def worker() -> None:
+        # The iterator is shared, so each index is taken by exactly one worker.
+        for index in indices:
+            try:
+                await completed.put((index, await fn(index, items[index]), None))
+            except Exception as e:
+                await completed.put((index, None, e))
+                return
+
+    workers: List[asyncio.Task] = [
+        asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, len(items))))
+    ]
+    try:
+        for _ in range(len(items)):
+            index, result, error = await completed.get()
+            if error is not None:
+                raise error
+            yield index, result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
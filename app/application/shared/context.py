@@ -0,0 +1,26 @@
+from contextvars import ContextVar
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class scoped(Generic[T]):
+    """Sets a context variable for the duration of a `with` block and restores the previous value.
+
+    The previous value is put back with set() rather than reset(token): an async generator may be
+    resumed, or closed, in a different context than the one it entered, and reset() raises there.
+    """
+    __slots__ = ("_variable", "_value", "_previous")
+
+    def __init__(self, variable: ContextVar[T], value: T):
+        self._variable = variable
+        self._value = value
+        self._previous: Optional[T] = None
+
+    def __enter__(self) -> T:
+        self._previous = self._variable.get()
+        self._variable.set(self._value)
+        return self._value
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._variable.set(self._previous)
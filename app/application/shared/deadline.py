@@ -0,0 +1,28 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from app.application.shared.context import scoped
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Bounds everything awaited inside the block (including spawned tasks) to `seconds` from now.
+
+    A nested deadline can only shorten the enclosing one. `None` leaves the current deadline as is.
+    """
+    expires_at = _deadline.get()
+    if seconds is not None:
+        limit = time.monotonic() + seconds
+        expires_at = limit if expires_at is None else min(expires_at, limit)
+    with scoped(_deadline, expires_at):
+        yield
+
+
+def remaining_seconds() -> Optional[float]:
+    """Seconds left before the current deadline (negative once it has passed), or None without one."""
+    expires_at = _deadline.get()
+    return None if expires_at is None else expires_at - time.monotonic()
@@ -0,0 +1,54 @@
+import re
+from dataclasses import dataclass
+from html import unescape
+
+_SUPERSCRIPT = re.compile(r"<sup>\s*(.*?)\s*</sup>", re.IGNORECASE | re.DOTALL)
+_SUBSCRIPT = re.compile(r"<sub>\s*(.*?)\s*</sub>", re.IGNORECASE | re.DOTALL)
+_BLOCK_TAGS = re.compile(r"<\s*/?\s*(?:br|p|li|ul|ol|pre|div|h\d)\b[^>]*>", re.IGNORECASE)
+_TAGS = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"[ \t\r\f\v ]+")
+
+
+def html_to_text(html: str) -> str:
+    """Converts LeetCode statement HTML into plain text, one block element per line.
+
+    Superscripts become `^` exponents so `10<sup>4</sup>` reads as `10^4`, subscripts become `_`.
+    """
+    if not html:
+        return ""
+    text = _SUPERSCRIPT.sub(r"^\1", html)
+    text = _SUBSCRIPT.sub(r"_\1", text)
+    text = _BLOCK_TAGS.sub("\n", text)
+    text = _TAGS.sub("", text)
+    text = _SPACES.sub(" ", unescape(text))
+    return "\n".join(line for line in (line.strip() for line in text.split("\n")) if line)
+
+
+_EXAMPLE_HEADER = re.compile(r"^Example\s*\d*\s*:", re.IGNORECASE)
+_CONSTRAINTS_HEADER = re.compile(r"^Constraints\s*:?\s*$", re.IGNORECASE)
+_FOLLOW_UP = re.compile(r"^(?:Follow[\s-]?up|Note)\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class StatementSections:
+    """A statement split into its parts; `follow_up` holds the follow-up and notes after the constraints."""
+    description: str
+    examples: str
+    constraints: str
+    follow_up: str
+
+
+def split_sections(text: str) -> StatementSections:
+    """Splits `html_to_text` output at the `Example N:`, `Constraints:` and trailing `Follow-up:` headers."""
+    parts = {"description": [], "examples": [], "constraints": [], "follow_up": []}
+    section = "description"
+    for line in text.split("\n"):
+        if _CONSTRAINTS_HEADER.match(line):
+            section = "constraints"
+            continue
+        if section == "description" and _EXAMPLE_HEADER.match(line):
+            section = "examples"
+        elif section in ("examples", "constraints") and _FOLLOW_UP.match(line):
+            section = "follow_up"
+        parts[section].append(line)
+    return StatementSections(**{name: "\n".join(lines) for name, lines in parts.items()})
@@ -0,0 +1,19 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from app.application.shared.context import scoped
+from app.domain.ports.llm.models import LLMPriority
+
+_priority: ContextVar[LLMPriority] = ContextVar("llm_priority", default=LLMPriority.INTERACTIVE)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """LLM calls made inside the block (including spawned tasks) are scheduled with `priority`."""
+    with scoped(_priority, priority):
+        yield
+
+
+def current_llm_priority() -> LLMPriority:
+    return _priority.get()
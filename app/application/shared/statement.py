@@ -0,0 +1,97 @@
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+from app.application.shared.html_text import StatementSections, html_to_text, split_sections
+from app.domain.shared.leetcode.models import LeetCodeProblemDetails
+
+logger = logging.getLogger(__name__)
+
+_CHARS_PER_TOKEN = 4
+
+
+def approximate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN
+
+
+@dataclass(frozen=True)
+class CompactStatement:
+    """Plain-text statement that replaces the raw LeetCode HTML in prompts."""
+    question_slug: str
+    sections: StatementSections
+    text: str
+    original_tokens: int
+    compact_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.compact_tokens
+
+
+@dataclass(frozen=True)
+class CompactionStats:
+    requests: int
+    computed: int
+    tokens_saved: int
+
+
+class StatementCompactor:
+    """Converts each problem's HTML once and serves the compact text to every prompt that needs it.
+
+    Entries are kept per slug (least recently used slugs are evicted first) and recomputed only
+    when the statement HTML changes. Token counts are estimated at 4 characters per token.
+    """
+
+    def __init__(self, max_slugs: int = 1024):
+        self.max_slugs = max_slugs
+        self._statements: "OrderedDict[str, Tuple[str, CompactStatement]]" = OrderedDict()
+        self._requests = 0
+        self._computed = 0
+        self._tokens_saved = 0
+
+    def compact(self, problem_details: LeetCodeProblemDetails) -> CompactStatement:
+        slug = problem_details.question_slug
+        content = problem_details.question_content or ""
+        entry = self._statements.get(slug)
+        if entry is not None and entry[0] == content:
+            self._statements.move_to_end(slug)
+            statement = entry[1]
+        else:
+            statement = _compact(slug, content)
+            self._computed += 1
+            self._statements[slug] = (content, statement)
+            self._statements.move_to_end(slug)
+            if len(self._statements) > self.max_slugs:
+                self._statements.popitem(last=False)
+
+        self._requests += 1
+        self._tokens_saved += statement.tokens_saved
+        logger.debug(
+            "Compacted problem statement",
+            extra={"context": {
+                "question_slug": slug,
+                "original_tokens": statement.original_tokens,
+                "compact_tokens": statement.compact_tokens,
+            }},
+        )
+        return statement
+
+    def stats(self) -> CompactionStats:
+        return CompactionStats(requests=self._requests, computed=self._computed, tokens_saved=self._tokens_saved)
+
+
+def _compact(slug: str, content: str) -> CompactStatement:
+    sections = split_sections(html_to_text(content))
+    blocks = [sections.description, sections.examples]
+    if sections.constraints:
+        blocks.append("Constraints:\n" + "\n".join(f"- {line}" for line in sections.constraints.split("\n")))
+    blocks.append(sections.follow_up)
+    text = "\n\n".join(block for block in blocks if block)
+    return CompactStatement(
+        question_slug=slug,
+        sections=sections,
+        text=text,
+        original_tokens=approximate_tokens(content),
+        compact_tokens=approximate_tokens(text),
+    )
@@ -0,0 +1,93 @@
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Protocol
+
+from app.application.shared.context import scoped
+
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """One timed operation; spans of a request share `trace_id` and point at their parent."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class _NullSpanExporter:
+    def export(self, span: Span) -> None:
+        pass
+
+
+_exporter: SpanExporter = _NullSpanExporter()
+
+
+def set_span_exporter(exporter: Optional[SpanExporter]) -> None:
+    """Sends finished spans to `exporter`; None disables exporting (spans are still created for log correlation)."""
+    global _exporter
+    _exporter = exporter if exporter is not None else _NullSpanExporter()
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def current_trace_id() -> Optional[str]:
+    active = _current.get()
+    return active.trace_id if active is not None else None
+
+
+class span:
+    """`with span("leetcode.fetch", question_slug=...)` times the block as a child of the current span.
+
+    Without a current span a new trace is started; `new_trace=True` always starts one (request entry points).
+    """
+    __slots__ = ("_span", "_scope")
+
+    def __init__(self, name: str, new_trace: bool = False, **attributes: Any):
+        parent = None if new_trace else _current.get()
+        self._span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=0,
+            attributes=attributes,
+        )
+        self._scope = scoped(_current, self._span)
+
+    def __enter__(self) -> Span:
+        self._scope.__enter__()
+        self._span.start_ns = time.time_ns()
+        return self._span
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._span.end_ns = time.time_ns()
+        if exc_type is not None:
+            self._span.error = exc_type.__name__
+        self._scope.__exit__(exc_type, exc_value, traceback)
+        _exporter.export(self._span)
+
+
+def trace(name: str, **attributes: Any) -> span:
+    """Starts a new trace for one user request."""
+    return span(name, new_trace=True, **attributes)
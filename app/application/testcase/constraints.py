@@ -0,0 +1,449 @@
+"""
+Deterministic parser turning a LeetCode statement into a JSON Schema (2020-12) of its input.
+
+Parameter names come from the first `Input:` line, types from the example test cases and
+bounds from the `Constraints:` section (`1 <= n <= 10^5`, `-10^9 <= nums[i] <= 10^9`,
+"lowercase English letters", "distinct", "sorted in non-decreasing order", ...).
+Results are cached per statement, so every request can afford to run it.
+"""
+
+import functools
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.application.shared.html_text import html_to_text
+from app.domain.shared.leetcode.models import LeetCodeProblemDetails
+from app.domain.testcase.models.models import ProblemInputSchema
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+Number = Union[int, float]
+
+_INPUT_LINE = re.compile(r"^Input\s*:\s*(.+)$", re.MULTILINE)
+_PARAMETER_NAME = re.compile(r"(?:^|,)\s*([A-Za-z_]\w*)\s*=(?!=)")
+_EXAMPLE_HEADER = re.compile(r"^Example\s*\d*\s*:", re.MULTILINE | re.IGNORECASE)
+_CONSTRAINTS_HEADER = re.compile(r"^Constraints\s*:?\s*$", re.MULTILINE | re.IGNORECASE)
+_SECTION_END = re.compile(r"^(?:Follow[\s-]?up|Note)\b", re.IGNORECASE)
+_COMPARISON = re.compile(r"\s*(<=|>=|==|<|>)\s*")
+_SUBJECT = re.compile(r"^([A-Za-z_]\w*)((?:\[\s*\w+\s*\])*)(\.length|\.size\(\))?$")
+_NUMBER_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)|(\S))")
+_NODE_RANGE = re.compile(r"number of (?:nodes|elements)\b.*?\bin the range\s*\[\s*([^,\]]+)\s*,\s*([^\]]+)\]", re.IGNORECASE)
+_QUOTED = re.compile(r"'([^'\s]+)'")
+_EITHER = re.compile(r"\bis\s+(?:either\s+)?('.'|-?\d+)\s+or\s+('.'|-?\d+)", re.IGNORECASE)
+
+_LENGTH_KEYWORDS = {"array": ("minItems", "maxItems"), "string": ("minLength", "maxLength")}
+_SORT_ORDERS = (
+    ("strictly increasing", "increasing"),
+    ("strictly decreasing", "decreasing"),
+    ("non-decreasing", "non-decreasing"),
+    ("non-increasing", "non-increasing"),
+    ("ascending", "non-decreasing"),
+    ("increasing", "non-decreasing"),
+    ("descending", "non-increasing"),
+    ("decreasing", "non-increasing"),
+)
+
+_Path = Tuple[str, int, bool]
+
+
+def parse_problem_constraints(problem_details: LeetCodeProblemDetails) -> ProblemInputSchema:
+    """Returns the cached input schema for a problem statement."""
+    return _parse(problem_details.question_content or "", problem_details.example_testcases or "")
+
+
+def schema_hash(schema: Dict[str, Any]) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse(question_content: str, example_testcases: str) -> ProblemInputSchema:
+    text = html_to_text(question_content)
+    warnings: List[str] = []
+
+    example_lines = [line for line in example_testcases.splitlines() if line.strip()]
+    parameters = _parameter_names(text)
+    if not parameters:
+        examples_count = len(_EXAMPLE_HEADER.findall(text)) or 1
+        arity = len(example_lines) // examples_count if len(example_lines) % examples_count == 0 else 1
+        parameters = tuple(f"arg{index}" for index in range(max(arity, 1)))
+        warnings.append("Could not find parameter names in the statement; using positional names.")
+
+    examples = _examples(example_lines, len(parameters))
+    properties: Dict[str, Dict[str, Any]] = {name: {} for name in parameters}
+    for example in examples:
+        for name, value in zip(parameters, example):
+            properties[name] = _merge(properties[name], _infer(value)) if properties[name] else _infer(value)
+
+    parser = _ConstraintParser(properties, warnings)
+    for line in _constraint_lines(text):
+        parser.apply(line)
+
+    schema = {
+        "$schema": JSON_SCHEMA_DIALECT,
+        "type": "object",
+        "properties": properties,
+        "required": list(parameters),
+        "additionalProperties": False,
+    }
+    return ProblemInputSchema(
+        parameters=parameters,
+        schema=schema,
+        schema_hash=schema_hash(schema),
+        examples=tuple(examples),
+        warnings=tuple(warnings),
+    )
+
+
+def _parameter_names(text: str) -> Tuple[str, ...]:
+    match = _INPUT_LINE.search(text)
+    if not match:
+        return ()
+    names: List[str] = []
+    for name in _PARAMETER_NAME.findall(_strip_literals(match.group(1))):
+        if name not in names:
+            names.append(name)
+    return tuple(names)
+
+
+def _strip_literals(line: str) -> str:
+    """Blanks out bracketed and quoted values so commas inside them do not split parameters."""
+    result: List[str] = []
+    depth = 0
+    quote: Optional[str] = None
+    for char in line:
+        if quote:
+            if char == quote:
+                quote = None
+            continue
+        if char in "\"'":
+            quote = char
+        elif char in "[{(":
+            depth += 1
+        elif char in "]})":
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            result.append(char)
+    return "".join(result)
+
+
+def _examples(example_lines: List[str], arity: int) -> List[Tuple[Any, ...]]:
+    values = [_decode(line) for line in example_lines]
+    return [tuple(values[start:start + arity]) for start in range(0, len(values) - arity + 1, arity)]
+
+
+def _decode(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return line.strip()
+
+
+def _infer(value: Any) -> Dict[str, Any]:
+    if value is None:
+        return {"type": "null"}
+    if isinstance(value, bool):
+        return {"type": "boolean"}
+    if isinstance(value, int):
+        return {"type": "integer"}
+    if isinstance(value, float):
+        return {"type": "number"}
+    if isinstance(value, str):
+        return {"type": "string"}
+    if isinstance(value, list):
+        items: Dict[str, Any] = {}
+        for element in value:
+            items = _merge(items, _infer(element)) if items else _infer(element)
+        return {"type": "array", "items": items}
+    return {}
+
+
+def _types(schema: Dict[str, Any]) -> List[str]:
+    declared = schema.get("type", [])
+    return [declared] if isinstance(declared, str) else list(declared)
+
+
+def _merge(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    if not left or not right:
+        return left or right
+    types = _types(left) + [t for t in _types(right) if t not in _types(left)]
+    if "number" in types and "integer" in types:
+        types.remove("integer")
+    merged: Dict[str, Any] = {"type": types[0] if len(types) == 1 else types}
+    if "array" in types:
+        merged["items"] = _merge(left.get("items", {}), right.get("items", {}))
+    return merged
+
+
+def _primary_type(schema: Dict[str, Any]) -> Optional[str]:
+    return next((t for t in _types(schema) if t != "null"), None)
+
+
+def _constraint_lines(text: str) -> List[str]:
+    match = _CONSTRAINTS_HEADER.search(text)
+    if not match:
+        return []
+    lines: List[str] = []
+    for line in text[match.end():].splitlines():
+        if _SECTION_END.match(line):
+            break
+        line = line.strip().rstrip(".").replace("≤", "<=").replace("≥", ">=").replace("−", "-")
+        if line:
+            lines.append(line)
+    return lines
+
+
+def evaluate_number(expression: str) -> Optional[Number]:
+    """Evaluates constraint bounds such as `10^4`, `-2^31`, `2^31 - 1`, `1e5` or `2 * 10^4`."""
+    tokens: List[str] = []
+    for number, symbol in _NUMBER_TOKEN.findall(expression.replace("×", "*").replace("**", "^")):
+        if symbol and symbol not in "+-*^()":
+            return None
+        tokens.append(number or symbol)
+    if not tokens:
+        return None
+    try:
+        value, position = _expression(tokens, 0)
+    except (IndexError, ValueError, OverflowError):
+        return None
+    if position != len(tokens):
+        return None
+    return int(value) if float(value).is_integer() else value
+
+
+def _expression(tokens: List[str], position: int) -> Tuple[Number, int]:
+    value, position = _term(tokens, position)
+    while position < len(tokens) and tokens[position] in "+-":
+        operator = tokens[position]
+        right, position = _term(tokens, position + 1)
+        value = value + right if operator == "+" else value - right
+    return value, position
+
+
+def _term(tokens: List[str], position: int) -> Tuple[Number, int]:
+    value, position = _factor(tokens, position)
+    while position < len(tokens) and tokens[position] == "*":
+        right, position = _factor(tokens, position + 1)
+        value *= right
+    return value, position
+
+
+def _factor(tokens: List[str], position: int) -> Tuple[Number, int]:
+    if tokens[position] == "-":
+        value, position = _factor(tokens, position + 1)
+        return -value, position
+    if tokens[position] == "(":
+        value, position = _expression(tokens, position + 1)
+        if tokens[position] != ")":
+            raise ValueError("Unbalanced parentheses")
+        position += 1
+    else:
+        value = float(tokens[position]) if any(c in tokens[position] for c in ".eE") else int(tokens[position])
+        position += 1
+    if position < len(tokens) and tokens[position] == "^":
+        exponent, position = _factor(tokens, position + 1)
+        value = value ** exponent
+    return value, position
+
+
+class _ConstraintParser:
+    """Applies constraint lines onto the per-parameter property schemas in place."""
+
+    def __init__(self, properties: Dict[str, Dict[str, Any]], warnings: List[str]):
+        self.properties = properties
+        self.warnings = warnings
+        self.aliases: Dict[str, _Path] = {}
+
+    def apply(self, line: str) -> None:
+        if self.__apply_node_range(line):
+            return
+        parts = _COMPARISON.split(line)
+        if len(parts) >= 3:
+            self.__apply_comparison(parts)
+        self.__apply_text_rules(line)
+
+    def __apply_comparison(self, parts: List[str]) -> None:
+        if len(parts) == 3 and parts[1] == "==":
+            self.__apply_alias(parts[0].strip(), parts[2].strip())
+        elif len(parts) == 5 and parts[1] in ("<=", "<") and parts[3] in ("<=", "<"):
+            low, high = self.__bound(parts[0]), self.__bound(parts[4])
+            self.__apply_bounds(parts[2], low, parts[1] == "<", high, parts[3] == "<")
+        elif len(parts) == 3 and parts[1] in ("<=", "<"):
+            low, high = self.__bound(parts[0]), self.__bound(parts[2])
+            if high is not None and low is None:
+                self.__apply_bounds(parts[0], None, False, high, parts[1] == "<")
+            elif low is not None and high is None:
+                self.__apply_bounds(parts[2], low, parts[1] == "<", None, False)
+        elif len(parts) == 3 and parts[1] in (">=", ">"):
+            self.__apply_bounds(parts[0], self.__bound(parts[2]), parts[1] == ">", None, False)
+
+    def __bound(self, expression: str) -> Optional[Number]:
+        """Evaluates a numeric bound, or resolves a reference such as `nums.length` to its maximum."""
+        value = evaluate_number(expression)
+        if value is not None:
+            return value
+        for path in self.__paths(expression.strip()):
+            target = self.__target(path)
+            keywords = self.__keywords(target, path[2]) if target is not None else None
+            if keywords and keywords[1] in target:
+                return target[keywords[1]]
+        return None
+
+    def __apply_alias(self, left: str, right: str) -> None:
+        # `m == grid.length`: later bounds on `m` apply to the length of grid.
+        for alias, reference in ((left, right), (right, left)):
+            if _SUBJECT.match(alias) and alias not in self.properties:
+                paths = self.__paths(reference)
+                if paths:
+                    self.aliases[alias] = paths[0]
+                    return
+
+    def __apply_bounds(
+        self, subjects: str, low: Optional[Number], low_strict: bool, high: Optional[Number], high_strict: bool
+    ) -> None:
+        for subject in subjects.split(","):
+            for path in self.__paths(subject.strip()):
+                target = self.__target(path)
+                keywords = self.__keywords(target, path[2]) if target is not None else None
+                if keywords is None:
+                    continue
+                is_integral = path[2] or _primary_type(target) == "integer"
+                if low is not None:
+                    if low_strict and not is_integral:
+                        target["exclusiveMinimum"] = low
+                    else:
+                        value = low + 1 if low_strict else low
+                        target[keywords[0]] = max(value, 0) if path[2] else value
+                if high is not None:
+                    if high_strict and not is_integral:
+                        target["exclusiveMaximum"] = high
+                    else:
+                        target[keywords[1]] = high - 1 if high_strict else high
+
+    def __apply_node_range(self, line: str) -> bool:
+        match = _NODE_RANGE.search(line)
+        if not match:
+            return False
+        low, high = evaluate_number(match.group(1)), evaluate_number(match.group(2))
+        if low is not None and high is not None:
+            for name in self.__array_parameters():
+                self.properties[name]["minItems"] = max(low, 0)
+                self.properties[name]["maxItems"] = high
+        return True
+
+    def __apply_text_rules(self, line: str) -> None:
+        lowered = line.lower()
+        for name, depth in self.__mentioned_subjects(line):
+            schema = self.properties[name]
+            is_array = _primary_type(schema) == "array"
+            if is_array and ("distinct" in lowered or "unique" in lowered):
+                if "answer" not in lowered and "solution" not in lowered:
+                    schema["uniqueItems"] = True
+            if is_array and ("sorted" in lowered or "order" in lowered):
+                order = next((order for phrase, order in _SORT_ORDERS if phrase in lowered), None)
+                if order:
+                    schema["x-sorted"] = order
+            if "consist" in lowered or "characters" in lowered:
+                pattern = _character_pattern(line)
+                target = self.__string_target(schema)
+                if pattern and target is not None:
+                    target["pattern"] = pattern
+            either = _EITHER.search(line)
+            if either:
+                self.__apply_either(schema, depth, either.group(1), either.group(2))
+
+    def __apply_either(self, schema: Dict[str, Any], depth: int, first: str, second: str) -> None:
+        options = [option.strip() for option in re.split(r",|\bor\b", f"{first}, {second}") if option.strip()]
+        target = schema
+        for _ in range(depth):
+            if _primary_type(target) != "array":
+                break
+            target = target.setdefault("items", {})
+        else:
+            depth = -1
+        characters = [option[1] for option in options if len(option) == 3 and option[0] == option[2] == "'"]
+        if characters and len(characters) == len(options) and _primary_type(target) == "string":
+            if depth == -1:
+                # `grid[i][j] is '0' or '1'`: the element itself is a single character.
+                target["enum"] = characters
+            else:
+                # `s[i] is '0' or '1'`: indexing into a string addresses its characters.
+                target["pattern"] = "^[" + "".join(_escape_class(c) for c in characters) + "]*$"
+            return
+        numbers = [evaluate_number(option) for option in options]
+        if all(number is not None for number in numbers) and _primary_type(target) in ("integer", "number"):
+            target["enum"] = numbers
+
+    def __mentioned_subjects(self, line: str) -> List[Tuple[str, int]]:
+        subjects: List[Tuple[str, int]] = []
+        for name in self.properties:
+            match = re.search(rf"\b{re.escape(name)}\b((?:\[\s*\w+\s*\])*)", line)
+            if match:
+                subjects.append((name, match.group(1).count("[")))
+        return subjects
+
+    def __array_parameters(self) -> List[str]:
+        return [name for name, schema in self.properties.items() if _primary_type(schema) == "array"]
+
+    @staticmethod
+    def __string_target(schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        target = schema
+        while _primary_type(target) == "array":
+            target = target.setdefault("items", {})
+        return target if _primary_type(target) == "string" else None
+
+    def __paths(self, subject: str) -> List[_Path]:
+        if subject.lower() in ("node.val", "node.value"):
+            # Linked lists and trees are serialized as arrays of node values.
+            return [(name, 1, False) for name in self.__array_parameters()]
+        if subject in self.aliases:
+            return [self.aliases[subject]]
+        match = _SUBJECT.match(subject)
+        if not match or match.group(1) not in self.properties:
+            return []
+        return [(match.group(1), match.group(2).count("["), bool(match.group(3)))]
+
+    def __target(self, path: _Path) -> Optional[Dict[str, Any]]:
+        target = self.properties[path[0]]
+        for _ in range(path[1]):
+            if _primary_type(target) != "array":
+                # `s[i]` on a string addresses a character: no numeric bounds apply.
+                return None
+            target = target.setdefault("items", {})
+        return target
+
+    @staticmethod
+    def __keywords(target: Dict[str, Any], is_length: bool) -> Optional[Tuple[str, str]]:
+        primary = _primary_type(target)
+        if is_length:
+            return _LENGTH_KEYWORDS.get(primary)
+        if primary in ("integer", "number"):
+            return ("minimum", "maximum")
+        return None
+
+
+def _character_pattern(line: str) -> Optional[str]:
+    lowered = line.lower()
+    if "symbol" in lowered or "printable" in lowered or "ascii" in lowered:
+        return None
+    classes: List[str] = []
+    if "lowercase" in lowered and "uppercase" in lowered:
+        classes.append("a-zA-Z")
+    elif "lowercase" in lowered:
+        classes.append("a-z")
+    elif "uppercase" in lowered:
+        classes.append("A-Z")
+    elif "english letters" in lowered or "letters" in lowered:
+        classes.append("a-zA-Z")
+    if "digit" in lowered:
+        classes.append("0-9")
+    if "space" in lowered:
+        classes.append(" ")
+    classes.extend(_escape_class(char) for quoted in _QUOTED.findall(line) for char in dict.fromkeys(quoted))
+    return "^[" + "".join(classes) + "]*$" if classes else None
+
+
+def _escape_class(char: str) -> str:
+    return "\\" + char if char in "]\\^-[" else char
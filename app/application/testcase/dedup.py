@@ -0,0 +1,125 @@
+import json
+from collections import Counter, OrderedDict
+from hashlib import blake2b
+from typing import Any, Iterable, List, Sequence, Set
+
+from app.application.testcase.input_format import parse_test_case_input
+from app.domain.testcase.models.models import ProblemInputSchema, TestCase
+
+_SEPARATORS = (",", ":")
+_CONTAINERS = frozenset({float, list, dict})
+_MAX_EXACT_FLOAT = 2 ** 53
+
+
+def test_case_fingerprint(content: str, parameters: Sequence[str]) -> bytes:
+    """Hashes the canonical form of a test case input.
+
+    Layout, whitespace, key order and number spelling (`2`, `2.0`, `2e0`) do not change the
+    fingerprint; arguments are hashed one by one instead of being joined into a new string.
+    """
+    values = parse_test_case_input(content, parameters) if parameters else None
+    if values is None:
+        return blake2b(" ".join(content.split()).encode("utf-8"), digest_size=16).digest()
+    return values_fingerprint(values)
+
+
+def values_fingerprint(values: Sequence[Any]) -> bytes:
+    digest = blake2b(digest_size=16)
+    for value in values:
+        digest.update(_canonical_json(value).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.digest()
+
+
+class TestCaseDeduplicator:
+    """Remembers which inputs were served per slug so new batches skip them.
+
+    History is bounded per slug and across slugs (least recently used slugs are forgotten first).
+    """
+
+    def __init__(self, history_per_slug: int = 2048, max_slugs: int = 1024):
+        self.history_per_slug = history_per_slug
+        self.max_slugs = max_slugs
+        self._history: "OrderedDict[str, OrderedDict[bytes, None]]" = OrderedDict()
+
+    def batch(self, slug: str, input_schema: ProblemInputSchema) -> "TestCaseBatch":
+        examples = {values_fingerprint(example) for example in input_schema.examples}
+        return TestCaseBatch(self, slug, input_schema.parameters, examples)
+
+    def remember(self, slug: str, fingerprints: Iterable[bytes]) -> None:
+        history = self._history.get(slug)
+        if history is None:
+            history = self._history[slug] = OrderedDict()
+            if len(self._history) > self.max_slugs:
+                self._history.popitem(last=False)
+        else:
+            self._history.move_to_end(slug)
+        for fingerprint in fingerprints:
+            history[fingerprint] = None
+            history.move_to_end(fingerprint)
+        while len(history) > self.history_per_slug:
+            history.popitem(last=False)
+
+    def was_served(self, slug: str, fingerprint: bytes) -> bool:
+        history = self._history.get(slug)
+        return history is not None and fingerprint in history
+
+
+class TestCaseBatch:
+    """Cases collected for one response; `dropped` counts rejections by reason."""
+
+    def __init__(self, deduplicator: TestCaseDeduplicator, slug: str, parameters: Sequence[str], examples: Set[bytes]):
+        self.deduplicator = deduplicator
+        self.slug = slug
+        self.parameters = parameters
+        self.examples = examples
+        self.fingerprints: List[bytes] = []
+        self.dropped: Counter = Counter()
+        self._seen: Set[bytes] = set()
+
+    def reserve(self, test_cases: List[TestCase]) -> List[TestCase]:
+        """Keeps cases that are served regardless (e.g. from the pool) so new ones cannot repeat them."""
+        for test_case in test_cases:
+            fingerprint = test_case_fingerprint(test_case.test_case_content, self.parameters)
+            self._seen.add(fingerprint)
+            self.fingerprints.append(fingerprint)
+        return test_cases
+
+    def admit(self, test_cases: List[TestCase]) -> List[TestCase]:
+        """Returns the cases that repeat neither an example, this batch, nor an earlier response."""
+        admitted: List[TestCase] = []
+        for test_case in test_cases:
+            fingerprint = test_case_fingerprint(test_case.test_case_content, self.parameters)
+            if fingerprint in self.examples:
+                self.dropped["example"] += 1
+            elif fingerprint in self._seen:
+                self.dropped["batch"] += 1
+            elif self.deduplicator.was_served(self.slug, fingerprint):
+                self.dropped["history"] += 1
+            else:
+                self._seen.add(fingerprint)
+                self.fingerprints.append(fingerprint)
+                admitted.append(test_case)
+        return admitted
+
+    def commit(self) -> None:
+        """Records everything in the batch as served."""
+        self.deduplicator.remember(self.slug, self.fingerprints)
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(_normalize(value), separators=_SEPARATORS, sort_keys=True, ensure_ascii=False)
+
+
+def _normalize(value: Any) -> Any:
+    """Turns integral floats into ints; containers without floats are returned as-is, not copied."""
+    kind = type(value)
+    if kind is float:
+        return int(value) if value.is_integer() and abs(value) < _MAX_EXACT_FLOAT else value
+    if kind is list:
+        if _CONTAINERS.isdisjoint(map(type, value)):
+            return value
+        return [_normalize(item) for item in value]
+    if kind is dict:
+        return {key: _normalize(item) for key, item in value.items()}
+    return value
@@ -1,32 +1,104 @@
+import asyncio
+import logging
+from typing import List, Optional, Tuple
 
+from app.application.shared.statement import StatementCompactor
+from app.application.testcase.constraints import parse_problem_constraints
+from app.application.testcase.dedup import test_case_fingerprint
 from app.domain.ports.llm.llm_port import StructuredOutputLLMPort
-from app.domain.ports.llm.models import LLMRequest
+from app.domain.ports.llm.models import LLMPriority, LLMRequest
 from app.domain.shared.exception.testcase.testcase_exception import TestCaseNotGeneratedException
 from app.domain.shared.leetcode.models import LeetCodeProblemDetails
-from app.domain.testcase.models.models import Difficulty, ProblemTestCases, TestCaseGenerationRequest, TestCaseGenerationResponse, difficulty_description
+from app.domain.testcase.models.models import Difficulty, ProblemTestCases, TestCase, TestCaseGenerationRequest, TestCaseGenerationResponse, difficulty_description
+
+logger = logging.getLogger(__name__)
 
 
 class TestCaseGenerator:
-    def __init__(self, llm_port: StructuredOutputLLMPort, temperature: float = 0.7):
+    """Generates test cases with the LLM; large requests are split into chunks generated concurrently.
+
+    `max_concurrency` bounds the chunks of one request; throttling across requests is the LLM scheduler's job.
+    """
+
+    def __init__(
+        self,
+        llm_port: StructuredOutputLLMPort,
+        temperature: float = 0.7,
+        chunk_size: int = 5,
+        max_concurrency: int = 4,
+        compactor: Optional[StatementCompactor] = None,
+    ):
         self.llm_port = llm_port
+        self.compactor = compactor if compactor is not None else StatementCompactor()
         self.temperature = temperature
+        self.chunk_size = max(1, chunk_size)
+        self.max_concurrency = max(1, max_concurrency)
 
     async def generate_test_cases(self, request: TestCaseGenerationRequest) -> TestCaseGenerationResponse:
+        chunks = self.__split(request.num_test_cases)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(
+                self.__generate_chunk(request, size, (part, len(chunks)), semaphore)
+                for part, size in enumerate(chunks, 1)
+            ),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if len(failures) == len(results):
+            raise TestCaseNotGeneratedException() from failures[0]
+        if failures:
+            logger.warning(
+                "Some test case chunks failed",
+                extra={"context": {"failed": len(failures), "chunks": len(chunks)}},
+            )
 
-        try:
-            llm_request = LLMRequest(
-              user_prompt=self.__prepare_user_prompt(request),
-              system_prompt=self.__prepare_system_prompt(request.difficulty)
+        return TestCaseGenerationResponse(
+            question_slug=request.problem_details.question_slug,
+            test_cases=ProblemTestCases(
+                test_cases=self.__merge(request.problem_details, results)[:request.num_test_cases]
             )
+        )
 
-            response = await self.llm_port.generate_structured_output(llm_request, ProblemTestCases)
+    async def __generate_chunk(
+        self, request: TestCaseGenerationRequest, size: int, part: Tuple[int, int], semaphore: asyncio.Semaphore
+    ) -> List[TestCase]:
+        async with semaphore:
+            try:
+                llm_request = LLMRequest(
+                  user_prompt=self.__prepare_user_prompt(request, size, part),
+                  system_prompt=self.__prepare_system_prompt(request.difficulty),
+                  priority=LLMPriority.BATCH,
+                  feature="test_cases",
+                  question_slug=request.problem_details.question_slug
+                )
 
-            return TestCaseGenerationResponse(
-                question_slug=request.problem_details.question_slug,
-                test_cases=response.content
-            )
-        except Exception as e:
-            raise TestCaseNotGeneratedException()
+                response = await self.llm_port.generate_structured_output(llm_request, ProblemTestCases)
+                return response.content.test_cases
+            except Exception as e:
+                raise TestCaseNotGeneratedException() from e
+
+    def __split(self, count: int) -> List[int]:
+        chunks = [self.chunk_size] * (count // self.chunk_size)
+        if count % self.chunk_size:
+            chunks.append(count % self.chunk_size)
+        return chunks
+
+    @staticmethod
+    def __merge(problem_details: LeetCodeProblemDetails, results: List) -> List[TestCase]:
+        """Concatenates the chunks in order, keeping the first occurrence of each input."""
+        parameters = parse_problem_constraints(problem_details).parameters
+        seen = set()
+        merged: List[TestCase] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                continue
+            for test_case in result:
+                fingerprint = test_case_fingerprint(test_case.test_case_content, parameters)
+                if fingerprint not in seen:
+                    seen.add(fingerprint)
+                    merged.append(test_case)
+        return merged
 
     def __prepare_system_prompt(self, test_case_difficulty: Difficulty) -> str:
         base_prompt = """You are an expert at generating LeetCode test cases. Your task is to:
@@ -52,13 +124,22 @@ YOU ARE NOT ALLOWED TO GENERATE EDGE CASES."""
         
         return base_prompt + "\n" + difficulty_description[test_case_difficulty]
 
-    def __prepare_user_prompt(self, request: TestCaseGenerationRequest) -> str:
-        return f"""Generate {request.num_test_cases} test cases for the problem provided in <PROBLEM_STATEMENT> section.:
+    def __prepare_user_prompt(
+        self, request: TestCaseGenerationRequest, num_test_cases: int, part: Optional[Tuple[int, int]] = None
+    ) -> str:
+        part_hint = ""
+        if part is not None and part[1] > 1:
+            # Kept after the problem statement so every chunk shares the same prompt prefix.
+            part_hint = (
+                f"This is part {part[0]} of {part[1]} of a larger request generated in parallel: "
+                "vary input sizes and value patterns so these test cases differ from the other parts.\n"
+            )
+        return f"""Generate {num_test_cases} test cases for the problem provided in <PROBLEM_STATEMENT> section.:
 YOU ARE NOT ALLOWED TO GENERATE EDGE CASES. YOU ARE NOT ALLOWED TO GENERATE TEST CASES WHICH ARE ALREADY PRESENT IN THE PROBLEM STATEMENT - <example_testcases> section.
 <PROBLEM_STATEMENT>
-{request.problem_details.question_content}
+{self.compactor.compact(request.problem_details).text}
 </PROBLEM_STATEMENT>
 <EXAMPLE_TESTCASES>
 {request.problem_details.example_testcases}
 </EXAMPLE_TESTCASES>
-"""
\ No newline at end of file
+{part_hint}"""
\ No newline at end of file
@@ -0,0 +1,53 @@
+import json
+import re
+from typing import Any, Iterable, List, Optional, Sequence
+
+_SEPARATORS = (",", ":")
+
+
+def format_test_case_input(values: Sequence[Any]) -> str:
+    """Renders one argument per line, the way LeetCode's `example_testcases` lists them."""
+    return "\n".join(json.dumps(value, separators=_SEPARATORS) for value in values)
+
+
+def parse_test_case_input(content: str, parameters: Sequence[str]) -> Optional[List[Any]]:
+    """Reads the argument values back from a test case, or returns None when they cannot be recovered.
+
+    Besides the one-value-per-line layout this accepts `nums = [1,2], target = 3` (as in the
+    statement's examples) and a JSON object keyed by parameter name, which LLMs tend to produce.
+    """
+    if not content or not content.strip() or not parameters:
+        return None
+    lines = [line for line in content.splitlines() if line.strip()]
+    if len(lines) == len(parameters):
+        values = _loads_all(lines)
+        if values is not None:
+            return values
+    try:
+        document = json.loads(content)
+    except ValueError:
+        return _parse_assignments(content, parameters)
+    if isinstance(document, dict) and all(name in document for name in parameters):
+        return [document[name] for name in parameters]
+    return [document] if len(parameters) == 1 else None
+
+
+def _parse_assignments(content: str, parameters: Sequence[str]) -> Optional[List[Any]]:
+    matches = []
+    position = 0
+    for name in parameters:
+        match = re.compile(rf"(?<![\w\"]){re.escape(name)}\s*=\s*").search(content, position)
+        if match is None:
+            return None
+        matches.append(match)
+        position = match.end()
+    bounds = [match.end() for match in matches]
+    ends = [match.start() for match in matches[1:]] + [len(content)]
+    return _loads_all(content[start:end].strip().rstrip(",").strip() for start, end in zip(bounds, ends))
+
+
+def _loads_all(texts: Iterable[str]) -> Optional[List[Any]]:
+    try:
+        return [json.loads(text) for text in texts]
+    except ValueError:
+        return None
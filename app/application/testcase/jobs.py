@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import replace
+from typing import List, Optional
+
+from app.application.shared.tracing import trace
+from app.application.testcase.service import TestCaseService
+from app.domain.ports.repository.job_repo import TestCaseJobRepositoryPort
+from app.domain.shared.exception.base import root_application_cause
+from app.domain.shared.exception.testcase.testcase_exception import TestCaseJobQueueFullException
+from app.domain.testcase.models.models import Difficulty, JobStatus, TestCaseJob
+
+logger = logging.getLogger(__name__)
+
+
+class TestCaseJobQueue:
+    """Runs test case generation in the background on a fixed pool of asyncio workers.
+
+    Jobs are persisted before they are queued; on `start` the ones a previous process left queued
+    or running are queued again, and give up after `max_attempts` interrupted runs.
+    """
+
+    def __init__(
+        self,
+        service: TestCaseService,
+        repository: TestCaseJobRepositoryPort,
+        workers: int = 2,
+        max_queued: int = 1000,
+        retention_seconds: float = 7 * 24 * 60 * 60,
+        max_attempts: int = 3,
+    ):
+        self.service = service
+        self.repository = repository
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.retention_seconds = retention_seconds
+        self.max_attempts = max_attempts
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._queued: "OrderedDict[str, None]" = OrderedDict()
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def depth(self) -> int:
+        return len(self._queued)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        purged = await self.repository.purge_finished(time.time() - self.retention_seconds)
+        resumed = 0
+        for job in await self.repository.unfinished():
+            if job.attempts >= self.max_attempts:
+                await self.repository.save(self.__failed(job, {
+                    "error": "JobInterrupted",
+                    "message": "The job was interrupted too many times.",
+                    "context": {"attempts": job.attempts},
+                }))
+                continue
+            if job.status is JobStatus.RUNNING:
+                await self.repository.save(replace(job, status=JobStatus.QUEUED, started_at=None))
+            self.__enqueue(job.job_id)
+            resumed += 1
+        self._tasks = [asyncio.create_task(self.__worker()) for _ in range(self.workers)]
+        logger.info(
+            "Started test case job workers",
+            extra={"context": {"workers": self.workers, "resumed": resumed, "purged": purged}},
+        )
+
+    async def stop(self) -> None:
+        """Cancels the workers; jobs they were running stay `running` and are resumed by the next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, user_input: str, difficulty: Difficulty, num_test_cases: int) -> TestCaseJob:
+        if self.depth >= self.max_queued:
+            raise TestCaseJobQueueFullException(queued=self.depth)
+        job = TestCaseJob(
+            job_id=uuid.uuid4().hex,
+            user_input=user_input,
+            difficulty=difficulty,
+            num_test_cases=num_test_cases,
+            created_at=time.time(),
+        )
+        await self.repository.save(job)
+        self.__enqueue(job.job_id)
+        return job
+
+    async def get(self, job_id: str) -> Optional[TestCaseJob]:
+        return await self.repository.get(job_id)
+
+    def position(self, job_id: str) -> Optional[int]:
+        """0-based place in the queue, or None when the job is not waiting."""
+        for position, queued_id in enumerate(self._queued):
+            if queued_id == job_id:
+                return position
+        return None
+
+    def __enqueue(self, job_id: str) -> None:
+        self._queued[job_id] = None
+        self._queue.put_nowait(job_id)
+
+    async def __worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            self._queued.pop(job_id, None)
+            try:
+                job = await self.repository.get(job_id)
+                if job is not None and not job.status.finished:
+                    await self.__run(job)
+            except Exception as e:
+                logger.error("Test case job failed to run: %s", e, exc_info=True, extra={"context": {"job_id": job_id}})
+
+    async def __run(self, job: TestCaseJob) -> None:
+        job = replace(job, status=JobStatus.RUNNING, started_at=time.time(), attempts=job.attempts + 1)
+        await self.repository.save(job)
+        try:
+            with trace("job.test_cases", job_id=job.job_id, difficulty=job.difficulty.value):
+                response = await self.service.generate_test_cases(job.user_input, job.difficulty, job.num_test_cases)
+        except Exception as e:
+            cause = root_application_cause(e)
+            error = {
+                "error": type(cause if cause is not None else e).__name__,
+                "message": str(cause if cause is not None else e),
+                "context": cause.context if cause is not None else {},
+            }
+            logger.error(
+                "Test case job failed: %s",
+                e,
+                exc_info=True,
+                extra={"context": {"job_id": job.job_id, **error["context"]}},
+            )
+            await self.repository.save(self.__failed(job, error))
+            return
+        await self.repository.save(replace(job, status=JobStatus.SUCCEEDED, finished_at=time.time(), result=response))
+
+    @staticmethod
+    def __failed(job: TestCaseJob, error: dict) -> TestCaseJob:
+        return replace(job, status=JobStatus.FAILED, finished_at=time.time(), error=error)
@@ -0,0 +1,326 @@
+import logging
+import math
+import re
+import string
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.application.testcase.input_format import format_test_case_input
+from app.application.testcase.pairwise import covering_array
+from app.domain.shared.exception.testcase.testcase_exception import TestCaseNotGeneratedException
+from app.domain.testcase.models.models import Difficulty, ProblemInputSchema, TestCase
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the number of generated elements (array items, string characters or matrix cells)
+# per argument; the problem's own limits still apply when they are lower.
+SIZE_CAPS: Dict[Difficulty, int] = {
+    Difficulty.EASY: 10,
+    Difficulty.MEDIUM: 1_000,
+    Difficulty.HARD: 100_000,
+}
+
+BOUNDARY_VARIANTS = frozenset({"min-length", "max-length", "min-value", "max-value", "near-min", "near-max"})
+
+_DEFAULT_INT_RANGE = (-10_000, 10_000)
+_INT64_RANGE = (int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max) - 1)
+_DEFAULT_ALPHABET = string.ascii_lowercase
+_CHARACTER_CLASS = re.compile(r"^\^\[(.*)\]\*\$$")
+_MAX_ATTEMPTS_FACTOR = 4
+_MAX_UNIQUE_SPAN = 2 ** 62
+
+
+class LocalTestCaseGenerator:
+    """Builds boundary-value (BVA) and equivalence-class (ECP) inputs from a parsed input schema.
+
+    Cases carry no expected result. Single-argument variations come first so that a failure
+    points at the class of input that caused it; pairwise combinations of those classes follow.
+    """
+
+    def __init__(self, seed: Optional[int] = None, pairwise: bool = True, strength: int = 2):
+        self._rng = np.random.default_rng(seed)
+        self.pairwise = pairwise
+        self.strength = strength
+
+    def generate(self, input_schema: ProblemInputSchema, difficulty: Difficulty, count: int) -> List[TestCase]:
+        if not input_schema.parameters:
+            raise TestCaseNotGeneratedException("Problem constraints could not be parsed into input parameters.")
+
+        sampler = _Sampler(self._rng, SIZE_CAPS[difficulty])
+        schemas = [input_schema.parameter_schema(name) for name in input_schema.parameters]
+        nominal = [sampler.sample(schema, "random") for schema in schemas]
+
+        test_cases: List[TestCase] = []
+        seen = set()
+        plan = self.__plan(sampler, input_schema.parameters, schemas)
+        attempts = count * _MAX_ATTEMPTS_FACTOR + len(schemas)
+        while len(test_cases) < count and attempts > 0:
+            attempts -= 1
+            assignment, tags = next(plan)
+            values = [
+                nominal[index] if variant == "nominal" else sampler.sample(schemas[index], variant)
+                for index, variant in enumerate(assignment)
+            ]
+            content = format_test_case_input(values)
+            if content in seen:
+                continue
+            seen.add(content)
+            test_cases.append(
+                TestCase(test_case_content=content, expected_result="", is_edge_case="boundary" in tags, tags=tags)
+            )
+
+        logger.debug(
+            "Generated test cases locally",
+            extra={"context": {"requested": count, "generated": len(test_cases), "difficulty": difficulty.value}},
+        )
+        return test_cases
+
+    def __plan(
+        self, sampler: "_Sampler", parameters: Tuple[str, ...], schemas: List[Dict[str, Any]]
+    ) -> Iterator[Tuple[Tuple[str, ...], List[str]]]:
+        """Nominal case, then one variant per argument in turn, then pairwise combinations, then random cases."""
+        width = len(schemas)
+        yield ("nominal",) * width, ["nominal"]
+
+        variants = [sampler.variants(schema) for schema in schemas]
+        for position in range(max(map(len, variants), default=0)):
+            for index, options in enumerate(variants):
+                if position < len(options):
+                    assignment = ("nominal",) * index + (options[position],) + ("nominal",) * (width - index - 1)
+                    yield assignment, _tags(assignment, parameters)
+
+        if self.pairwise and sum(1 for options in variants if options) >= 2:
+            for row in covering_array([options + ["random"] for options in variants], self.strength):
+                yield row, _tags(row, parameters, pairwise=True)
+
+        while True:
+            yield ("random",) * width, ["random"]
+
+
+def _tags(assignment: Tuple[str, ...], parameters: Tuple[str, ...], pairwise: bool = False) -> List[str]:
+    varied = [(name, variant) for name, variant in zip(parameters, assignment) if variant not in ("nominal", "random")]
+    tags = ["boundary"] if any(variant in BOUNDARY_VARIANTS for _, variant in varied) else []
+    if pairwise:
+        return tags + ["pairwise"] + [f"{name}:{variant}" for name, variant in varied]
+    name, variant = varied[0]
+    return tags + [variant, name]
+
+
+class _Sampler:
+    def __init__(self, rng: np.random.Generator, size_cap: int):
+        self._rng = rng
+        self._size_cap = size_cap
+
+    def variants(self, schema: Dict[str, Any]) -> List[str]:
+        kind = _type_of(schema)
+        if kind in ("integer", "number"):
+            if "enum" in schema:
+                return ["min-value", "max-value"]
+            low, high = _bounds(schema)
+            options = ["min-value", "max-value", "near-min", "near-max"]
+            if low < 0 < high:
+                options += ["negative", "zero", "positive"]
+            return options
+        if kind == "boolean":
+            return ["true", "false"]
+        if kind == "string":
+            return ["min-length", "max-length", "uniform"]
+        if kind == "array":
+            options = ["min-length", "max-length"]
+            items = schema.get("items", {})
+            if _type_of(items) in ("integer", "number"):
+                options += ["min-value", "max-value"]
+                if "enum" in items:
+                    return options
+                if not schema.get("uniqueItems") and not _strictly_sorted(schema):
+                    options.append("duplicates")
+                options.append("distinct")
+                if "x-sorted" not in schema:
+                    options += ["sorted", "reverse-sorted"]
+            return options
+        return []
+
+    def sample(self, schema: Dict[str, Any], variant: str) -> Any:
+        kind = _type_of(schema)
+        if kind in ("integer", "number"):
+            return self.__scalar(schema, variant)
+        if kind == "boolean":
+            return variant == "true" if variant in ("true", "false") else bool(self._rng.integers(2))
+        if kind == "string":
+            return self.__strings(schema, 1, variant)[0]
+        if kind == "array":
+            return self.__array(schema, variant, self._size_cap)
+        return None
+
+    def __scalar(self, schema: Dict[str, Any], variant: str) -> Any:
+        if "enum" in schema:
+            ordered = sorted(schema["enum"])
+            return {"min-value": ordered[0], "max-value": ordered[-1]}.get(
+                variant, ordered[self._rng.integers(len(ordered))]
+            )
+        low, high = _bounds(schema)
+        if variant in ("min-value", "max-value", "near-min", "near-max", "zero"):
+            value = {
+                "min-value": low, "max-value": high, "near-min": low + 1, "near-max": high - 1, "zero": 0,
+            }[variant]
+            return _cast(schema, min(max(value, low), high))
+        if variant == "negative":
+            high = min(high, -1)
+        elif variant == "positive":
+            low = max(low, 1)
+        return self.__numbers(schema, 1, low, high)[0]
+
+    def __numbers(self, schema: Dict[str, Any], size: int, low: float, high: float, unique: bool = False) -> List[Any]:
+        if "enum" in schema:
+            choices = np.array(schema["enum"], dtype=object)
+            return choices[self._rng.integers(len(choices), size=size)].tolist()
+        if _type_of(schema) == "number":
+            return np.round(self._rng.uniform(low, high, size=size), 5).tolist()
+        low, high = max(int(low), _INT64_RANGE[0]), min(int(high), _INT64_RANGE[1])
+        span = high - low + 1
+        # Collisions are negligible over a huge range, and `choice` cannot index past int64.
+        if unique and span <= _MAX_UNIQUE_SPAN:
+            return (self._rng.choice(span, size=min(size, span), replace=False) + low).tolist()
+        return self._rng.integers(low, high, size=size, endpoint=True, dtype=np.int64).tolist()
+
+    def __strings(self, schema: Dict[str, Any], count: int, variant: str) -> List[str]:
+        low = schema.get("minLength", 1)
+        high = max(low, min(schema.get("maxLength", self._size_cap), self._size_cap))
+        if variant == "min-length":
+            lengths = np.full(count, low)
+        elif variant == "max-length":
+            lengths = np.full(count, high)
+        else:
+            lengths = self._rng.integers(low, high, size=count, endpoint=True)
+
+        alphabet = _alphabet(schema)
+        if variant == "uniform":
+            fill = alphabet[self._rng.integers(len(alphabet))]
+            return [fill * int(length) for length in lengths]
+        if "enum" in schema:
+            return self.__numbers(schema, count, 0, 0)
+        characters = self.__characters(alphabet, int(lengths.sum()))
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        return [characters[start:end] for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+    def __characters(self, alphabet: str, size: int) -> str:
+        if alphabet.isascii():
+            codes = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+            return codes[self._rng.integers(len(codes), size=size)].tobytes().decode("ascii")
+        return "".join(np.array(list(alphabet))[self._rng.integers(len(alphabet), size=size)].tolist())
+
+    def __array(self, schema: Dict[str, Any], variant: str, size_cap: int) -> List[Any]:
+        items = schema.get("items", {})
+        nested = _type_of(items) == "array"
+        # A matrix shares the cap between its dimensions.
+        dimension_cap = max(1, math.isqrt(size_cap)) if nested else size_cap
+        low = schema.get("minItems", 1)
+        high = max(low, min(schema.get("maxItems", dimension_cap), dimension_cap))
+        if variant == "min-length":
+            size = low
+        elif variant == "max-length":
+            size = high
+        else:
+            size = int(self._rng.integers(low, high, endpoint=True))
+
+        if nested:
+            row_variant = variant if variant in ("min-length", "max-length") else "random"
+            first = self.__array(items, row_variant, dimension_cap)
+            rows = [first] + [self.__array(items, row_variant, dimension_cap) for _ in range(size - 1)]
+            # Grids are rectangular: every row takes the first row's width.
+            width = len(first)
+            return [row[:width] + first[len(row):] for row in rows] if size else []
+
+        kind = _type_of(items)
+        if kind == "string":
+            values = self.__strings(items, size, "random")
+            return self.__distinct_strings(items, values, size) if schema.get("uniqueItems") else values
+        if kind not in ("integer", "number"):
+            return [self.sample(items, "random") for _ in range(size)]
+
+        item_low, item_high = _bounds(items)
+        if "enum" in items:
+            item_low, item_high = min(items["enum"]), max(items["enum"])
+        unique = "enum" not in items and (
+            bool(schema.get("uniqueItems")) or _strictly_sorted(schema) or variant == "distinct"
+        )
+        if variant in ("min-value", "max-value") and not unique:
+            values = [item_low if variant == "min-value" else item_high] * size
+        elif variant in ("min-value", "max-value"):
+            # Distinct values still have to hug the bound, so sample from a narrow window next to it.
+            if variant == "min-value":
+                window = (item_low, min(item_high, item_low + 2 * size))
+            else:
+                window = (max(item_low, item_high - 2 * size), item_high)
+            values = self.__numbers(items, size, *window, unique=True)
+            bound = item_low if variant == "min-value" else item_high
+            if values and bound not in values:
+                values[0] = bound
+        elif variant == "duplicates":
+            pool = self.__numbers(items, max(1, size // 4), item_low, item_high)
+            values = np.array(pool, dtype=object)[self._rng.integers(len(pool), size=size)].tolist()
+        else:
+            values = self.__numbers(items, size, item_low, item_high, unique=unique)
+
+        order = schema.get("x-sorted") or {"sorted": "non-decreasing", "reverse-sorted": "non-increasing"}.get(variant)
+        if order:
+            values.sort(reverse=order in ("decreasing", "non-increasing"))
+        return values
+
+    def __distinct_strings(self, items: Dict[str, Any], values: List[str], size: int) -> List[str]:
+        """Drops repeated strings and samples replacements until `size` distinct ones exist.
+
+        A small string space (short strings over a narrow alphabet) can run out; the array is then
+        shorter than asked and the validator rejects the case.
+        """
+        distinct = list(dict.fromkeys(values))
+        attempts = _MAX_ATTEMPTS_FACTOR
+        while len(distinct) < size and attempts > 0:
+            attempts -= 1
+            distinct = list(dict.fromkeys(distinct + self.__strings(items, size - len(distinct), "random")))
+        return distinct[:size]
+
+
+def _type_of(schema: Dict[str, Any]) -> Optional[str]:
+    kind = schema.get("type")
+    if isinstance(kind, list):
+        return next((t for t in kind if t != "null"), None)
+    return kind
+
+
+def _bounds(schema: Dict[str, Any]) -> Tuple[Any, Any]:
+    low = schema.get("minimum", _DEFAULT_INT_RANGE[0])
+    high = schema.get("maximum", _DEFAULT_INT_RANGE[1])
+    if "exclusiveMinimum" in schema:
+        low = schema["exclusiveMinimum"] + 1
+    if "exclusiveMaximum" in schema:
+        high = schema["exclusiveMaximum"] - 1
+    return low, max(low, high)
+
+
+def _cast(schema: Dict[str, Any], value: Any) -> Any:
+    return int(value) if _type_of(schema) == "integer" else float(value)
+
+
+def _strictly_sorted(schema: Dict[str, Any]) -> bool:
+    return schema.get("x-sorted") in ("increasing", "decreasing")
+
+
+def _alphabet(schema: Dict[str, Any]) -> str:
+    match = _CHARACTER_CLASS.match(schema.get("pattern", ""))
+    if not match:
+        return _DEFAULT_ALPHABET
+    body, characters, index = match.group(1), [], 0
+    while index < len(body):
+        char = body[index]
+        if char == "\\" and index + 1 < len(body):
+            characters.append(body[index + 1])
+            index += 2
+        elif index + 2 < len(body) and body[index + 1] == "-":
+            characters.extend(chr(code) for code in range(ord(char), ord(body[index + 2]) + 1))
+            index += 3
+        else:
+            characters.append(char)
+            index += 1
+    return "".join(dict.fromkeys(characters)) or _DEFAULT_ALPHABET
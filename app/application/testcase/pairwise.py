@@ -0,0 +1,115 @@
+from itertools import combinations, product
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+Interaction = Tuple[Tuple[int, Any], ...]
+
+
+def covering_array(domains: Sequence[Sequence[Any]], strength: int = 2) -> List[Tuple[Any, ...]]:
+    """Builds a t-way covering array with IPOG (in-parameter-order-general).
+
+    Every combination of `strength` parameters sees every combination of their values in at
+    least one row; for more than `strength` parameters this takes far fewer rows than the
+    Cartesian product.
+    """
+    if strength < 1:
+        raise ValueError("Strength must be at least 1")
+    if not domains or any(len(domain) == 0 for domain in domains):
+        return []
+    # IPOG starts from the product of the first t parameters, so the largest domains go first.
+    order = sorted(range(len(domains)), key=lambda parameter: -len(domains[parameter]))
+    position = {parameter: index for index, parameter in enumerate(order)}
+    rows = _ipog([len(domains[parameter]) for parameter in order], min(strength, len(domains)))
+    return [
+        tuple(domains[parameter][row[position[parameter]]] for parameter in range(len(domains)))
+        for row in rows
+    ]
+
+
+def missing_interactions(
+    rows: Sequence[Sequence[Any]], domains: Sequence[Sequence[Any]], strength: int = 2
+) -> List[Interaction]:
+    """Lists every t-way value combination absent from `rows`; empty means full coverage."""
+    strength = min(strength, len(domains))
+    missing: List[Interaction] = []
+    for parameters in combinations(range(len(domains)), strength):
+        seen = {tuple(row[parameter] for parameter in parameters) for row in rows}
+        for values in product(*(domains[parameter] for parameter in parameters)):
+            if values not in seen:
+                missing.append(tuple(zip(parameters, values)))
+    return missing
+
+
+def covers_all_interactions(
+    rows: Sequence[Sequence[Any]], domains: Sequence[Sequence[Any]], strength: int = 2
+) -> bool:
+    return not missing_interactions(rows, domains, strength)
+
+
+def _ipog(sizes: List[int], strength: int) -> List[Tuple[int, ...]]:
+    # Rows hold value indices; None marks a don't-care that vertical growth may still claim.
+    rows: List[List[Optional[int]]] = [list(row) for row in product(*(range(size) for size in sizes[:strength]))]
+    for parameter in range(strength, len(sizes)):
+        uncovered = _uncovered(sizes, parameter, strength)
+        _grow_horizontally(rows, parameter, sizes[parameter], uncovered)
+        _grow_vertically(rows, parameter, uncovered)
+    return [tuple(0 if value is None else value for value in row) for row in rows]
+
+
+def _uncovered(sizes: List[int], parameter: int, strength: int) -> Dict[Tuple[int, ...], Set[Tuple[int, ...]]]:
+    """Maps each (t-1)-subset of earlier parameters to the value tuples still to cover with `parameter`."""
+    return {
+        others: set(product(*(range(sizes[other]) for other in others), range(sizes[parameter])))
+        for others in combinations(range(parameter), strength - 1)
+    }
+
+
+def _grow_horizontally(
+    rows: List[List[Optional[int]]],
+    parameter: int,
+    size: int,
+    uncovered: Dict[Tuple[int, ...], Set[Tuple[int, ...]]],
+) -> None:
+    usage = [0] * size
+    for row in rows:
+        best_value, best_score = 0, None
+        for value in range(size):
+            gain = sum(1 for others, missing in uncovered.items() if _key(row, others, value) in missing)
+            # Ties go to the value used least so far, which keeps the new column from copying an old one.
+            score = (gain, -usage[value])
+            if best_score is None or score > best_score:
+                best_value, best_score = value, score
+        usage[best_value] += 1
+        row.append(best_value)
+        for others, missing in uncovered.items():
+            missing.discard(_key(row, others, best_value))
+
+
+def _grow_vertically(
+    rows: List[List[Optional[int]]],
+    parameter: int,
+    uncovered: Dict[Tuple[int, ...], Set[Tuple[int, ...]]],
+) -> None:
+    for others, missing in uncovered.items():
+        positions = others + (parameter,)
+        for values in sorted(missing):
+            if values not in missing:
+                continue
+            target = next((row for row in rows if _fits(row, positions, values)), None)
+            if target is None:
+                target = [None] * (parameter + 1)
+                rows.append(target)
+            for position, value in zip(positions, values):
+                target[position] = value
+            # Claiming don't-cares can complete tuples of other parameter subsets as well.
+            for covered_others, covered in uncovered.items():
+                covered.discard(_key(target, covered_others, target[parameter]))
+
+
+def _key(row: List[Optional[int]], others: Tuple[int, ...], value: int) -> Optional[Tuple[int, ...]]:
+    values = tuple(row[other] for other in others)
+    return None if None in values else values + (value,)
+
+
+def _fits(row: List[Optional[int]], positions: Tuple[int, ...], values: Tuple[int, ...]) -> bool:
+    return all(row[position] is None or row[position] == value for position, value in zip(positions, values))
+
@@ -1,35 +1,177 @@
+import logging
+from typing import Dict, List, Optional
+
+from app.application.shared.deadline import deadline
+from app.application.shared.tracing import span
+from app.application.testcase.constraints import parse_problem_constraints
+from app.application.testcase.dedup import TestCaseBatch, TestCaseDeduplicator
 from app.application.testcase.generator import TestCaseGenerator
+from app.application.testcase.local_generator import LocalTestCaseGenerator
+from app.application.testcase.validation import TestCaseValidator
 from app.domain.ports.api.leetcode import GetProblemDetailsPort, QuestionSlugExtractorPort
-from app.domain.shared.leetcode.models import LeetCodeProblem
-from app.domain.testcase.models.models import Difficulty, TestCaseGenerationRequest, TestCaseGenerationResponse
+from app.domain.ports.repository.test_case_repo import TestCaseRepositoryPort
+from app.domain.shared.exception.testcase.testcase_exception import TestCaseNotGeneratedException
+from app.domain.shared.leetcode.models import LeetCodeProblem, LeetCodeProblemDetails
+from app.domain.testcase.models.models import (
+    Difficulty,
+    ProblemInputSchema,
+    ProblemTestCases,
+    TestCase,
+    TestCaseGenerationRequest,
+    TestCaseGenerationResponse,
+    TestCaseSource,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class TestCaseService:
-    def __init__(self, 
+    def __init__(self,
                  slug_extractor: QuestionSlugExtractorPort,
                  problem_fetcher: GetProblemDetailsPort,
-                 test_case_generator: TestCaseGenerator):
+                 test_case_generator: TestCaseGenerator,
+                 test_case_repository: TestCaseRepositoryPort,
+                 local_generator: Optional[LocalTestCaseGenerator] = None,
+                 sources: Optional[Dict[Difficulty, TestCaseSource]] = None,
+                 validator: Optional[TestCaseValidator] = None,
+                 deduplicator: Optional[TestCaseDeduplicator] = None,
+                 max_replacement_rounds: int = 2,
+                 deadline_seconds: Optional[float] = None):
         self.slug_extractor = slug_extractor
         self.problem_fetcher = problem_fetcher
         self.test_case_generator = test_case_generator
-    
+        self.test_case_repository = test_case_repository
+        self.local_generator = local_generator if local_generator is not None else LocalTestCaseGenerator()
+        self.sources = sources if sources is not None else {}
+        self.validator = validator if validator is not None else TestCaseValidator()
+        self.deduplicator = deduplicator if deduplicator is not None else TestCaseDeduplicator()
+        self.max_replacement_rounds = max_replacement_rounds
+        self.deadline_seconds = deadline_seconds
+
     async def generate_test_cases(
-        self, 
+        self,
         user_input: str,
         difficulty: Difficulty,
         num_test_cases: int = 1
     ) -> TestCaseGenerationResponse:
+        with span("test_cases.service", difficulty=difficulty.value, requested=num_test_cases), \
+                deadline(self.deadline_seconds):
+            return await self.__generate_test_cases(user_input, difficulty, num_test_cases)
 
+    async def __generate_test_cases(
+        self,
+        user_input: str,
+        difficulty: Difficulty,
+        num_test_cases: int
+    ) -> TestCaseGenerationResponse:
         problem_slug = self.slug_extractor.extract_question_slug(user_input)
         problem = LeetCodeProblem.of(problem_slug)
 
-        problem_details = self.problem_fetcher.get_problem_details(problem)
+        problem_details = await self.problem_fetcher.get_problem_details(problem)
+        input_schema = parse_problem_constraints(problem_details)
+
+        batch = self.deduplicator.batch(problem_details.question_slug, input_schema)
+        pooled = batch.reserve(await self.test_case_repository.fetch(
+            problem_details.question_slug, input_schema.schema_hash, difficulty, num_test_cases
+        ))
+        shortfall = num_test_cases - len(pooled)
+        source = self.sources.get(difficulty, TestCaseSource.LLM)
+
+        local: List[TestCase] = []
+        if shortfall > 0 and source is TestCaseSource.LOCAL:
+            local = batch.admit(self.__generate_locally(input_schema, difficulty, shortfall))
+        elif shortfall > 1 and source is TestCaseSource.HYBRID:
+            # Boundary cases come from the local engine; the LLM covers the normal ones it is prompted for.
+            local = batch.admit(self.__generate_locally(input_schema, difficulty, shortfall // 2))
 
-        request = TestCaseGenerationRequest(
-            user_message=user_input,
-            problem_details=problem_details,
-            difficulty=difficulty,
-            num_test_cases=num_test_cases
+        generated: List[TestCase] = []
+        if shortfall - len(local) > 0 and source is not TestCaseSource.LOCAL:
+            try:
+                generated = await self.__generate_with_llm(
+                    user_input, problem_details, input_schema, difficulty, shortfall - len(local), batch
+                )
+            except TestCaseNotGeneratedException:
+                if source is not TestCaseSource.HYBRID:
+                    raise
+                logger.warning(
+                    "LLM generation failed; filling the request locally",
+                    extra={"context": {"question_slug": problem_details.question_slug}},
+                )
+                local += batch.admit(self.__generate_locally(input_schema, difficulty, shortfall - len(local)))
+
+        batch.commit()
+        if batch.dropped:
+            logger.info(
+                "Dropped duplicate test cases",
+                extra={"context": {"question_slug": problem_details.question_slug, "dropped": dict(batch.dropped)}},
+            )
+        return TestCaseGenerationResponse(
+            question_slug=problem_details.question_slug,
+            test_cases=ProblemTestCases(test_cases=pooled + generated + local)
         )
-        
-        return await self.test_case_generator.generate_test_cases(request)
\ No newline at end of file
+
+    def __generate_locally(self, input_schema: ProblemInputSchema, difficulty: Difficulty, count: int) -> List[TestCase]:
+        """Local cases go through the same validator as LLM ones; a case the sampler got wrong is dropped."""
+        report = self.validator.validate(input_schema, self.local_generator.generate(input_schema, difficulty, count))
+        if report.rejected:
+            logger.warning(
+                "Rejected locally generated test cases",
+                extra={"context": {
+                    "schema_hash": input_schema.schema_hash,
+                    "rejected": [reason for _, reason in report.rejected],
+                }},
+            )
+        return report.valid
+
+    async def __generate_with_llm(
+        self,
+        user_input: str,
+        problem_details: LeetCodeProblemDetails,
+        input_schema: ProblemInputSchema,
+        difficulty: Difficulty,
+        num_test_cases: int,
+        batch: TestCaseBatch
+    ) -> List[TestCase]:
+        """Generates, validates and deduplicates; only the slots that were dropped are asked for again."""
+        generated: List[TestCase] = []
+        for round_number in range(self.max_replacement_rounds + 1):
+            request = TestCaseGenerationRequest(
+                user_message=user_input,
+                problem_details=problem_details,
+                difficulty=difficulty,
+                num_test_cases=num_test_cases - len(generated)
+            )
+            try:
+                response = await self.test_case_generator.generate_test_cases(request)
+            except TestCaseNotGeneratedException:
+                if round_number == 0:
+                    raise
+                break
+
+            report = self.validator.validate(input_schema, response.test_cases.test_cases)
+            logger.info(
+                "Validated generated test cases",
+                extra={"context": {
+                    "question_slug": problem_details.question_slug,
+                    "valid": len(report.valid),
+                    "repaired": report.repaired,
+                    "rejected": [reason for _, reason in report.rejected],
+                    "elapsed_ms": round(report.elapsed_ms, 3),
+                }},
+            )
+            generated += batch.admit(report.valid)
+            if len(generated) >= num_test_cases:
+                break
+
+        generated = generated[:num_test_cases]
+        try:
+            await self.test_case_repository.save_many(
+                problem_details.question_slug, input_schema.schema_hash, difficulty, generated
+            )
+        except Exception as e:
+            logger.warning(
+                "Could not store generated test cases: %s",
+                e,
+                extra={"context": {"question_slug": problem_details.question_slug}},
+            )
+        return generated
@@ -0,0 +1,275 @@
+import copy
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from jsonschema import Draft202012Validator
+
+from app.application.testcase.input_format import format_test_case_input, parse_test_case_input
+from app.domain.testcase.models.models import ProblemInputSchema, TestCase
+
+logger = logging.getLogger(__name__)
+
+_NUMBER_KEYWORDS = frozenset({"type", "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "enum"})
+_STRING_KEYWORDS = frozenset({"type", "minLength", "maxLength", "pattern", "enum"})
+_ARRAY_KEYWORDS = frozenset({"type", "items", "minItems", "maxItems", "uniqueItems", "x-sorted"})
+_MAX_MESSAGE_LENGTH = 200
+_FALLBACK = object()
+
+_Check = Callable[[Any], Optional[str]]
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    """Outcome of validating one batch; `rejected` pairs each dropped case with the reason."""
+    valid: List[TestCase]
+    rejected: List[Tuple[TestCase, str]] = field(default_factory=list)
+    repaired: int = 0
+    elapsed_ms: float = 0.0
+    skipped: bool = False
+
+
+class TestCaseValidator:
+    """Checks generated inputs against the problem's input schema before they are served or pooled.
+
+    Validators are compiled once per `schema_hash`. Cases in another supported layout are repaired
+    into the canonical one-value-per-line form; cases that break the schema are rejected, since
+    changing their values would invalidate the expected result that came with them.
+    """
+
+    def __init__(self, max_schemas: int = 256):
+        self.max_schemas = max_schemas
+        self._compiled: "OrderedDict[str, _CompiledSchema]" = OrderedDict()
+
+    def validate(self, input_schema: ProblemInputSchema, test_cases: List[TestCase]) -> ValidationReport:
+        started = time.perf_counter()
+        if not input_schema.parameters:
+            return ValidationReport(valid=list(test_cases), skipped=True)
+
+        compiled = self.__compiled(input_schema)
+        valid: List[TestCase] = []
+        rejected: List[Tuple[TestCase, str]] = []
+        repaired = 0
+        for test_case in test_cases:
+            values = parse_test_case_input(test_case.test_case_content, input_schema.parameters)
+            if values is None or len(values) != len(input_schema.parameters):
+                rejected.append((test_case, f"expected {len(input_schema.parameters)} argument(s)"))
+                continue
+            error = compiled.first_error(dict(zip(input_schema.parameters, values)))
+            if error is not None:
+                rejected.append((test_case, error))
+                continue
+            content = format_test_case_input(values)
+            if content != test_case.test_case_content:
+                test_case = test_case.model_copy(update={"test_case_content": content})
+                repaired += 1
+            valid.append(test_case)
+
+        return ValidationReport(
+            valid=valid,
+            rejected=rejected,
+            repaired=repaired,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    def __compiled(self, input_schema: ProblemInputSchema) -> "_CompiledSchema":
+        compiled = self._compiled.get(input_schema.schema_hash)
+        if compiled is not None:
+            self._compiled.move_to_end(input_schema.schema_hash)
+            return compiled
+        compiled = _CompiledSchema(input_schema.schema)
+        self._compiled[input_schema.schema_hash] = compiled
+        if len(self._compiled) > self.max_schemas:
+            self._compiled.popitem(last=False)
+        return compiled
+
+
+class _CompiledSchema:
+    """A Draft 2020-12 validator for the input object plus compiled checks for its arguments.
+
+    Arguments built from plain types, bounds, lengths, patterns and enums are checked by
+    closures compiled once from the schema (NumPy for numeric arrays), so 10^5-element inputs
+    stay cheap; anything else is left to jsonschema.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        schema = copy.deepcopy(schema)
+        self._checks: Dict[str, _Check] = {}
+        for name, property_schema in schema.get("properties", {}).items():
+            check = _compile(property_schema)
+            if check is not None:
+                self._checks[name] = check
+                schema["properties"][name] = {}
+        self._validator = Draft202012Validator(schema)
+
+    def first_error(self, instance: Dict[str, Any]) -> Optional[str]:
+        error = next(self._validator.iter_errors(instance), None)
+        if error is not None:
+            path = "/".join(str(part) for part in error.absolute_path) or "input"
+            return _truncate(f"{path}: {error.message}")
+        for name, check in self._checks.items():
+            message = check(instance.get(name))
+            if message is not None:
+                return _truncate(f"{name}{message}" if message.startswith("[") else f"{name}: {message}")
+        return None
+
+
+def _compile(schema: Dict[str, Any]) -> Optional[_Check]:
+    kind = schema.get("type")
+    if kind in ("integer", "number") and set(schema) <= _NUMBER_KEYWORDS:
+        return _compile_number(schema)
+    if kind == "string" and set(schema) <= _STRING_KEYWORDS:
+        return _compile_string(schema)
+    if kind == "boolean" and set(schema) == {"type"}:
+        return lambda value: None if isinstance(value, bool) else f"{value!r} is not a boolean"
+    if kind == "array" and set(schema) <= _ARRAY_KEYWORDS:
+        return _compile_array(schema)
+    return None
+
+
+def _compile_number(schema: Dict[str, Any]) -> _Check:
+    integer = schema["type"] == "integer"
+    enum = set(schema["enum"]) if "enum" in schema else None
+
+    def check(value: Any) -> Optional[str]:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return f"{value!r} is not of type {schema['type']}"
+        if integer and isinstance(value, float) and not value.is_integer():
+            return f"{value!r} is not an integer"
+        if enum is not None and value not in enum:
+            return f"{value!r} is not one of {schema['enum']}"
+        return _bounds_error(schema, value, value)
+
+    return check
+
+
+def _compile_string(schema: Dict[str, Any]) -> _Check:
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+    enum = set(schema["enum"]) if "enum" in schema else None
+    low, high = schema.get("minLength", 0), schema.get("maxLength")
+
+    def check(value: Any) -> Optional[str]:
+        if not isinstance(value, str):
+            return f"{value!r} is not of type string"
+        if enum is not None and value not in enum:
+            return f"{value!r} is not one of {schema['enum']}"
+        if len(value) < low or (high is not None and len(value) > high):
+            return f"length {len(value)} is outside [{low}, {high}]"
+        if pattern is not None and not pattern.search(value):
+            return f"{value!r} does not match {schema['pattern']}"
+        return None
+
+    return check
+
+
+def _compile_array(schema: Dict[str, Any]) -> Optional[_Check]:
+    items = schema.get("items", {})
+    numeric = items.get("type") in ("integer", "number") and set(items) <= _NUMBER_KEYWORDS
+    item_check = _compile(items) if items else (lambda value: None)
+    if item_check is None:
+        return None
+    low, high = schema.get("minItems", 0), schema.get("maxItems")
+    unique = bool(schema.get("uniqueItems"))
+    order = schema.get("x-sorted")
+    numeric_items = _compile_numeric_items(items, unique, order) if numeric else None
+
+    def check(values: Any) -> Optional[str]:
+        if not isinstance(values, list):
+            return f"{_preview(values)} is not of type array"
+        if len(values) < low or (high is not None and len(values) > high):
+            return f"length {len(values)} is outside [{low}, {high}]"
+        if not values:
+            return None
+        if numeric_items is not None:
+            message = numeric_items(values)
+            if message is not _FALLBACK:
+                return message
+        for index, value in enumerate(values):
+            message = item_check(value)
+            if message is not None:
+                return f"[{index}]{message}" if message.startswith("[") else f"[{index}]: {message}"
+        if unique and len({json.dumps(value, sort_keys=True) for value in values}) != len(values):
+            return "items must be unique"
+        if order is not None and not _is_ordered_pairs(values, order):
+            return f"items must be sorted ({order})"
+        return None
+
+    return check
+
+
+def _compile_numeric_items(items: Dict[str, Any], unique: bool, order: Optional[str]) -> Callable[[List[Any]], Any]:
+    """Checks a flat numeric array in a few vectorised passes; returns _FALLBACK for mixed content."""
+    integer = items["type"] == "integer"
+    enum = np.array(items["enum"]) if "enum" in items else None
+
+    def check(values: List[Any]) -> Any:
+        if bool in map(type, values):
+            return _FALLBACK
+        try:
+            array = np.asarray(values)
+        except ValueError:
+            return _FALLBACK
+        if array.ndim != 1 or array.dtype.kind not in "iuf":
+            return _FALLBACK
+        if integer and array.dtype.kind == "f" and not np.all(np.mod(array, 1) == 0):
+            return "items must be integers"
+        if enum is not None and not np.isin(array, enum).all():
+            return f"items must be one of {items['enum']}"
+        message = _bounds_error(items, array.min(), array.max())
+        if message is not None:
+            return f"items: {message}"
+        if unique and np.unique(array).size != array.size:
+            return "items must be unique"
+        if order is not None and not _is_ordered(np.diff(array), order):
+            return f"items must be sorted ({order})"
+        return None
+
+    return check
+
+
+def _bounds_error(schema: Dict[str, Any], smallest: Any, largest: Any) -> Optional[str]:
+    if "minimum" in schema and smallest < schema["minimum"]:
+        return f"{smallest} is less than the minimum of {schema['minimum']}"
+    if "maximum" in schema and largest > schema["maximum"]:
+        return f"{largest} is greater than the maximum of {schema['maximum']}"
+    if "exclusiveMinimum" in schema and smallest <= schema["exclusiveMinimum"]:
+        return f"{smallest} is not greater than {schema['exclusiveMinimum']}"
+    if "exclusiveMaximum" in schema and largest >= schema["exclusiveMaximum"]:
+        return f"{largest} is not less than {schema['exclusiveMaximum']}"
+    return None
+
+
+def _is_ordered(steps: np.ndarray, order: str) -> bool:
+    if order == "increasing":
+        return bool(np.all(steps > 0))
+    if order == "decreasing":
+        return bool(np.all(steps < 0))
+    if order == "non-increasing":
+        return bool(np.all(steps <= 0))
+    return bool(np.all(steps >= 0))
+
+
+def _is_ordered_pairs(values: List[Any], order: str) -> bool:
+    try:
+        if order == "increasing":
+            return all(a < b for a, b in zip(values, values[1:]))
+        if order == "decreasing":
+            return all(a > b for a, b in zip(values, values[1:]))
+        if order == "non-increasing":
+            return all(a >= b for a, b in zip(values, values[1:]))
+        return all(a <= b for a, b in zip(values, values[1:]))
+    except TypeError:
+        return False
+
+
+def _preview(value: Any) -> str:
+    return _truncate(repr(value))
+
+
+def _truncate(message: str) -> str:
+    return message if len(message) <= _MAX_MESSAGE_LENGTH else message[:_MAX_MESSAGE_LENGTH - 1] + "…"
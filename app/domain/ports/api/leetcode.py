@@ -4,7 +4,7 @@ from cattrs import Converter
 
 class GetProblemDetailsPort(ABC):
     @abstractmethod
-    def get_problem_details(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails: 
+    async def get_problem_details(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails:
         """
         Fetches problem details by its title slug.
 
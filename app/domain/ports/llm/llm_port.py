@@ -1,5 +1,5 @@
 #Abstract, base class for LLM Providers
-from typing import Generic, Type, TypeVar
+from typing import AsyncIterator, Generic, Type, TypeVar
 from pydantic import BaseModel
 from .models import LLMRequest, LLMResponse
 from typing import Protocol
@@ -7,7 +7,9 @@ from typing import Protocol
 T = TypeVar('T', bound=BaseModel)
 
 class TextLLMPort(Protocol):
-    async def generate_text_output(self, request: LLMRequest) -> str: ...
+    async def generate_text_output(self, request: LLMRequest) -> LLMResponse[str]: ...
+
+    def stream_text_output(self, request: LLMRequest) -> AsyncIterator[str]: ...
 
 class StructuredOutputLLMPort(Protocol, Generic[T]):
     async def generate_structured_output(self, request: LLMRequest, response_format: Type[T]) -> LLMResponse[T]: ...
\ No newline at end of file
@@ -1,17 +1,42 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import Generic, Optional, TypeVar
 from pydantic import BaseModel
 
 T = TypeVar('T', bound=BaseModel)
+C = TypeVar('C')
 
 
+class LLMPriority(Enum):
+    """Scheduling class of a request; lower values are served first."""
+    INTERACTIVE = 0
+    BATCH = 1
+
 @dataclass
 class LLMRequest:
     user_prompt: str
     system_prompt: Optional[str]
+    priority: LLMPriority = LLMPriority.INTERACTIVE
+    feature: Optional[str] = None
+    question_slug: Optional[str] = None
+
+@dataclass(frozen=True)
+class LLMUsage:
+    """Tokens billed for one call; `cached_tokens` is the part of the prompt served from the provider's cache."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    cost_usd: float = 0.0
+    latency_ms: float = 0.0
+    cache_hit: bool = False
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
 
 @dataclass
-class LLMResponse(Generic[T]):
-    content: T
+class LLMResponse(Generic[C]):
+    content: C
     model_name: Optional[str] = None
-    provider: Optional[str] = None
\ No newline at end of file
+    provider: Optional[str] = None
+    usage: Optional[LLMUsage] = None
\ No newline at end of file
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.testcase.models.models import TestCaseJob
+
+
+class TestCaseJobRepositoryPort(ABC):
+    @abstractmethod
+    async def save(self, job: TestCaseJob) -> None:
+        """Inserts the job or replaces its stored state."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[TestCaseJob]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unfinished(self) -> List[TestCaseJob]:
+        """
+        Returns queued and running jobs, oldest first; used to resume work after a restart.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge_finished(self, before: float) -> int:
+        """
+        Deletes jobs that finished before the given epoch time.
+
+        Returns:
+            The number of deleted jobs.
+        """
+        raise NotImplementedError
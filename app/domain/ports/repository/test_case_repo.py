@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import List
+from app.domain.testcase.models.models import Difficulty, TestCase
+
+
+class TestCaseRepositoryPort(ABC):
+    @abstractmethod
+    async def fetch(self, slug: str, schema_hash: str, difficulty: Difficulty, count: int) -> List[TestCase]:
+        """
+        Fetches a random sample of previously generated test cases.
+
+        Args:
+            slug: The question slug the cases were generated for.
+            schema_hash: SHA-256 identifying the problem's input schema.
+            difficulty: The difficulty the cases were generated for.
+            count: The maximum number of cases to return.
+
+        Returns:
+            Up to `count` stored test cases; fewer if the pool is smaller.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_many(self, slug: str, schema_hash: str, difficulty: Difficulty, cases: List[TestCase]) -> int:
+        """
+        Persists generated test cases, ignoring inputs already stored for the slug and schema.
+
+        Returns:
+            The number of newly stored cases.
+        """
+        raise NotImplementedError
@@ -12,3 +12,14 @@ class BaseApplicationException(Exception, ABC):
 
     def __str__(self) -> str:
         return self.message
+
+
+def root_application_cause(error: BaseException) -> Optional[BaseApplicationException]:
+    """The last application exception in the cause chain, i.e. the most specific one a wrapper hides."""
+    root: Optional[BaseApplicationException] = None
+    current: Optional[BaseException] = error
+    while current is not None:
+        if isinstance(current, BaseApplicationException):
+            root = current
+        current = current.__cause__
+    return root
@@ -36,4 +36,43 @@ class EmptyResponseException(LLMException):
     """Raised when the response is empty."""
 
     def __init__(self, provider: str, message: str = "The LLM returned an empty response."):
-        super().__init__(provider, message)
\ No newline at end of file
+        super().__init__(provider, message)
+
+
+class LLMCapacityExceededException(LLMException):
+    """Raised when the rate-limit queue is full and the request is shed instead of waiting."""
+
+    def __init__(
+        self,
+        provider: str,
+        queued: int,
+        message: str = "The AI service is busy right now. Please try again in a moment.",
+    ):
+        super().__init__(provider, message)
+        self.context.update({"queued": queued})
+
+
+class LLMDeadlineExceededException(LLMException):
+    """Raised when the request's deadline leaves no time for another attempt."""
+
+    def __init__(
+        self,
+        provider: str,
+        attempts: int,
+        message: str = "The AI service took too long to respond. Please try again.",
+    ):
+        super().__init__(provider, message)
+        self.context.update({"attempts": attempts})
+
+
+class LLMCassetteMissException(LLMException):
+    """Raised in replay mode when no recorded response matches the request."""
+
+    def __init__(
+        self,
+        provider: str,
+        cassette_key: str,
+        message: str = "No recorded AI response matches this request.",
+    ):
+        super().__init__(provider, message)
+        self.context.update({"cassette_key": cassette_key})
@@ -14,4 +14,12 @@ class TestCaseNotGeneratedException(TestCaseException):
     """Raised when test cases are not generated."""
 
     def __init__(self, message: str = "Could not generate test cases."):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+
+class TestCaseJobQueueFullException(TestCaseException):
+    """Raised when a background job is submitted while the job queue is at capacity."""
+
+    def __init__(self, queued: int, message: str = "Too many background jobs are waiting. Please try again later."):
+        super().__init__(message)
+        self.context.update({"queued": queued})
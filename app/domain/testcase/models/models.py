@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 from pydantic import BaseModel, Field
 from app.domain.shared.leetcode.models import LeetCodeProblemDetails
 
@@ -10,10 +10,16 @@ class Difficulty(Enum):
     MEDIUM = "MEDIUM"
     HARD = "HARD"
 
+class TestCaseSource(Enum):
+    LLM = "llm"
+    LOCAL = "local"
+    HYBRID = "hybrid"
+
 class TestCase(BaseModel):
     test_case_content: str
     expected_result: str
     is_edge_case: bool = False
+    tags: List[str] = Field(default_factory=list)
 
 class EdgeTestCase(TestCase):
     is_edge_case: Literal[True] = True
@@ -31,8 +37,6 @@ class TestCaseGenerationRequest(BaseModel):
     def __post_init__(self):
         if self.num_test_cases < 1:
             raise ValueError("Number of test cases must be at least 1")
-        if self.num_test_cases > 10:
-            self.num_test_cases = 10
         if self.difficulty not in Difficulty:
             raise ValueError("Invalid difficulty level")
         if self.problem_details is None:
@@ -62,3 +66,44 @@ difficulty_description = {
 - Include intricate cases that test deep understanding"""
 }
 
+@dataclass(frozen=True)
+class ProblemInputSchema:
+    """JSON Schema (2020-12) of a problem's input, derived locally from its statement.
+
+    `schema` is shared between callers through a cache and must be treated as read-only.
+    """
+    parameters: Tuple[str, ...]
+    schema: Dict[str, Any]
+    schema_hash: str
+    examples: Tuple[Tuple[Any, ...], ...] = ()
+    warnings: Tuple[str, ...] = ()
+
+    def parameter_schema(self, name: str) -> Dict[str, Any]:
+        return self.schema["properties"].get(name, {})
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+@dataclass(frozen=True)
+class TestCaseJob:
+    """A background test case generation; `error` holds the failure's class name, message and context."""
+    job_id: str
+    user_input: str
+    difficulty: Difficulty
+    num_test_cases: int
+    created_at: float
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[TestCaseGenerationResponse] = None
+    error: Optional[Dict[str, Any]] = None
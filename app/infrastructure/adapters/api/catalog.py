@@ -0,0 +1,141 @@
+import logging
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, List, Optional, override
+
+from app.domain.ports.api.leetcode import GetProblemDetailsPort
+from app.domain.shared.exception.api.api_exception import LeetCodeProblemNotFoundError
+from app.domain.shared.leetcode.models import LeetCodeProblem, LeetCodeProblemDetails
+from app.infrastructure.persistence.sqlite import SqliteDatabase
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS problems (
+    question_slug TEXT PRIMARY KEY,
+    question_title TEXT NOT NULL,
+    question_content TEXT NOT NULL,
+    example_testcases TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_UPSERT = """
+INSERT INTO problems (question_slug, question_title, question_content, example_testcases, difficulty, updated_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(question_slug) DO UPDATE SET
+    question_title = excluded.question_title,
+    question_content = excluded.question_content,
+    example_testcases = excluded.example_testcases,
+    difficulty = excluded.difficulty,
+    updated_at = excluded.updated_at
+"""
+
+# Snapshot records may use either the Alfa API field names or our own.
+_FIELD_ALIASES = {
+    "question_slug": ("titleSlug", "question_slug"),
+    "question_title": ("questionTitle", "title", "question_title"),
+    "question_content": ("question", "content", "question_content"),
+    "example_testcases": ("exampleTestcases", "example_testcases"),
+    "difficulty": ("difficulty",),
+}
+
+
+def problem_details_from_record(record: Dict[str, Any]) -> LeetCodeProblemDetails:
+    """Maps a snapshot record onto LeetCodeProblemDetails.
+
+    Raises:
+        ValueError: If the record has no slug or no question content.
+    """
+    values: Dict[str, str] = {}
+    for field_name, aliases in _FIELD_ALIASES.items():
+        values[field_name] = next((record[alias] for alias in aliases if record.get(alias) is not None), "")
+    if not values["question_slug"] or not values["question_content"]:
+        raise ValueError("Snapshot record must contain a slug and question content")
+    return LeetCodeProblemDetails(**values)
+
+
+class SqliteProblemCatalog:
+    """Local, indexed store of LeetCode problem statements."""
+
+    def __init__(self, database: SqliteDatabase):
+        self.database = database
+
+    @classmethod
+    def open(cls, path: str) -> "SqliteProblemCatalog":
+        return cls(SqliteDatabase(path, schema=_SCHEMA))
+
+    async def get(self, question_slug: str) -> Optional[LeetCodeProblemDetails]:
+        return await self.database.run(lambda connection: self.__get(connection, question_slug))
+
+    async def save(self, details: LeetCodeProblemDetails) -> None:
+        await self.database.run(lambda connection: self.__upsert(connection, [details]))
+
+    def save_many(self, problems: Iterable[LeetCodeProblemDetails]) -> int:
+        """Bulk upsert in a single transaction; blocking, meant for the import CLI."""
+        return self.database.run_sync(lambda connection: self.__upsert(connection, problems))
+
+    def count(self) -> int:
+        return self.database.run_sync(
+            lambda connection: connection.execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+        )
+
+    def close(self) -> None:
+        self.database.close()
+
+    @staticmethod
+    def __get(connection: sqlite3.Connection, question_slug: str) -> Optional[LeetCodeProblemDetails]:
+        row = connection.execute(
+            "SELECT question_slug, question_title, question_content, example_testcases, difficulty "
+            "FROM problems WHERE question_slug = ?",
+            (question_slug,),
+        ).fetchone()
+        return LeetCodeProblemDetails(*row) if row else None
+
+    @staticmethod
+    def __upsert(connection: sqlite3.Connection, problems: Iterable[LeetCodeProblemDetails]) -> int:
+        now = time.time()
+        rows: List[tuple] = [
+            (
+                problem.question_slug,
+                problem.question_title,
+                problem.question_content,
+                problem.example_testcases,
+                problem.difficulty,
+                now,
+            )
+            for problem in problems
+        ]
+        connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+
+class SqliteCatalogGetProblemDetailsAdapter(GetProblemDetailsPort):
+    """Serves problems from the local catalog, reading through to a fallback port on a miss.
+
+    Problems fetched from the fallback are written back, so each slug crosses the network once.
+    """
+
+    def __init__(self, catalog: SqliteProblemCatalog, fallback: Optional[GetProblemDetailsPort] = None):
+        self.catalog = catalog
+        self.fallback = fallback
+
+    @override
+    async def get_problem_details(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails:
+        question_slug = problem.question_slug.question_slug
+        details = await self.catalog.get(question_slug)
+        if details is not None:
+            return details
+        if self.fallback is None:
+            raise LeetCodeProblemNotFoundError(question_slug=question_slug)
+        details = await self.fallback.get_problem_details(problem)
+        try:
+            await self.catalog.save(details)
+        except sqlite3.Error as e:
+            logger.warning(
+                "Could not write problem back to the local catalog: %s",
+                e,
+                extra={"context": {"question_slug": question_slug}},
+            )
+        return details
@@ -0,0 +1,46 @@
+from typing import Optional
+
+import httpx
+
+from app.infrastructure.config.config import HttpClientSettings
+
+
+class PooledAsyncHttpClient:
+    """Owns a single long-lived, connection-pooled httpx.AsyncClient shared by outbound adapters."""
+
+    def __init__(
+        self,
+        settings: Optional[HttpClientSettings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.settings = settings or HttpClientSettings()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Returns the pooled client, opening it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = self.__build_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def __build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=self.settings.connect_timeout,
+                read=self.settings.read_timeout,
+                write=self.settings.write_timeout,
+                pool=self.settings.pool_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive_connections,
+                keepalive_expiry=self.settings.keepalive_expiry,
+            ),
+            transport=self._transport,
+        )
@@ -1,6 +1,6 @@
 import os
-from sqlite3 import paramstyle
-from typing import Dict, Final, override
+from typing import override
+from app.application.shared.tracing import span
 from app.domain.ports.api.leetcode import GetProblemDetailsPort, QuestionSlugExtractorPort
 from app.domain.shared.exception.api.api_exception import (
     LeetCodeApiError,
@@ -9,43 +9,45 @@ from app.domain.shared.exception.api.api_exception import (
     LeetCodeProblemNotFoundError,
 )
 from app.domain.shared.leetcode.models import LeetCodeProblem, LeetCodeProblemDetails, LeetCodeProblemSlug
-import requests
+from app.infrastructure.adapters.api.http_client import PooledAsyncHttpClient
 import re
 from cattrs import Converter
 from dotenv import load_dotenv
-import functools
 
 class AlfaLCGetProblemDetailsAdapter(GetProblemDetailsPort):
 
-    def __init__(self):
-        # TODO: Implement this
+    def __init__(self, http_client: PooledAsyncHttpClient):
         load_dotenv()
         if not os.getenv("ALFA_LEETCODE_API_URL"):
             raise LeetCodeApiError("ALFA_LEETCODE_API_URL is not set")
         api_url = os.getenv("ALFA_LEETCODE_API_URL")
         self.get_problem_details_endpoint = api_url + "/select"
+        self.http_client = http_client
+        self.converter = self.__prepare_converter()
 
     @override
-    @functools.lru_cache(maxsize=40)
-    def get_problem_details(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails:
-        converter = self.__prepare_converter()
+    async def get_problem_details(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails:
         try:
             payload = {'titleSlug': problem.question_slug.question_slug}
-            request = requests.get(self.get_problem_details_endpoint, params=payload)
-            if request.status_code != 200:
+            with span("leetcode.fetch", question_slug=problem.question_slug.question_slug) as fetch:
+                response = await self.http_client.client.get(self.get_problem_details_endpoint, params=payload)
+                fetch.set_attribute("http.status_code", response.status_code)
+            if response.status_code != 200:
                 raise LeetCodeApiRequestError(
                     endpoint=self.get_problem_details_endpoint,
                     question_slug=problem.question_slug.question_slug,
-                    status_code=request.status_code,
-                    response_text=request.text,
+                    status_code=response.status_code,
+                    response_text=response.text,
                 )
-            return converter.structure(request.json(), LeetCodeProblemDetails)
+            return self.converter.structure(response.json(), LeetCodeProblemDetails)
+        except LeetCodeApiError:
+            raise
         except Exception as e:
             raise LeetCodeApiUnexpectedError(
                 endpoint=self.get_problem_details_endpoint,
                 question_slug=problem.question_slug.question_slug,
                 original_exception=e,
-            )
+            ) from e
 
     def __prepare_converter(self) -> Converter:
         converter = Converter()
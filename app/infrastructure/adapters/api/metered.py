@@ -0,0 +1,31 @@
+from typing import override
+
+from app.domain.ports.api.leetcode import GetProblemDetailsPort, QuestionSlugExtractorPort
+from app.domain.shared.leetcode.models import LeetCodeProblem, LeetCodeProblemDetails, LeetCodeProblemSlug
+from app.infrastructure.observability.metrics import stage_timer
+
+
+class MeteredQuestionSlugExtractorAdapter(QuestionSlugExtractorPort):
+    """Records each extraction under the `slug_extraction` stage of `feature`."""
+
+    def __init__(self, delegate: QuestionSlugExtractorPort, feature: str):
+        self.delegate = delegate
+        self.feature = feature
+
+    @override
+    def extract_question_slug(self, user_input: str) -> LeetCodeProblemSlug:
+        with stage_timer("slug_extraction", self.feature):
+            return self.delegate.extract_question_slug(user_input)
+
+
+class MeteredGetProblemDetailsAdapter(GetProblemDetailsPort):
+    """Records each fetch (cache hits included) under the `problem_fetch` stage of `feature`."""
+
+    def __init__(self, delegate: GetProblemDetailsPort, feature: str):
+        self.delegate = delegate
+        self.feature = feature
+
+    @override
+    async def get_problem_details(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails:
+        with stage_timer("problem_fetch", self.feature):
+            return await self.delegate.get_problem_details(problem)
@@ -0,0 +1,226 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.application.shared.tracing import span
+from app.domain.ports.llm.models import LLMRequest, LLMResponse, LLMUsage
+from app.domain.shared.exception.llm.llm_exception import LLMCassetteMissException, LLMProviderError
+from app.infrastructure.adapters.llm.openai import BaseOpenAIAdapter
+from app.infrastructure.cache.llm_response import llm_cache_key
+from app.infrastructure.persistence.sqlite import SqliteDatabase
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T', bound=BaseModel)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cassettes (
+    cassette_key CHAR(64) NOT NULL,
+    seq INTEGER NOT NULL,
+    model_name TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (cassette_key, seq)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class Cassette:
+    """One recorded LLM call; `content` is the text or the structured output's JSON."""
+    content: str
+    chunks: List[str] = field(default_factory=list)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+    first_chunk_ms: float = 0.0
+
+
+class CassetteStore:
+    """Recorded calls keyed like the LLM response cache, zlib-compressed in one SQLite table.
+
+    Repeated identical requests are recorded as a sequence (seq 0, 1, ...) and replayed in the same
+    order, wrapping around when a run makes more calls than were recorded.
+    """
+
+    def __init__(self, database: SqliteDatabase):
+        self.database = database
+        self._sequence: Dict[str, int] = {}
+
+    @classmethod
+    def open(cls, path: str) -> "CassetteStore":
+        return cls(SqliteDatabase(path, schema=_SCHEMA))
+
+    def next_seq(self, key: str) -> int:
+        seq = self._sequence.get(key, 0)
+        self._sequence[key] = seq + 1
+        return seq
+
+    async def save(self, key: str, seq: int, model_name: str, cassette: Cassette) -> None:
+        payload = zlib.compress(json.dumps(asdict(cassette), separators=(",", ":")).encode("utf-8"))
+        await self.database.run(lambda connection: connection.execute(
+            "INSERT OR REPLACE INTO llm_cassettes (cassette_key, seq, model_name, payload, recorded_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, seq, model_name, payload, time.time()),
+        ))
+
+    async def load(self, key: str, seq: int) -> Optional[Cassette]:
+        payload = await self.database.run(lambda connection: self.__load(connection, key, seq))
+        if payload is None:
+            return None
+        return Cassette(**json.loads(zlib.decompress(payload)))
+
+    def close(self) -> None:
+        self.database.close()
+
+    @staticmethod
+    def __load(connection: sqlite3.Connection, key: str, seq: int) -> Optional[bytes]:
+        row = connection.execute(
+            "SELECT payload FROM llm_cassettes WHERE cassette_key = ? AND seq = ?", (key, seq)
+        ).fetchone()
+        if row is None and seq > 0:
+            recorded = connection.execute(
+                "SELECT COUNT(*) FROM llm_cassettes WHERE cassette_key = ?", (key,)
+            ).fetchone()[0]
+            if recorded:
+                row = connection.execute(
+                    "SELECT payload FROM llm_cassettes WHERE cassette_key = ? ORDER BY seq LIMIT 1 OFFSET ?",
+                    (key, seq % recorded),
+                ).fetchone()
+        return row[0] if row is not None else None
+
+
+class CassetteLLMAdapter:
+    """Implements TextLLMPort and StructuredOutputLLMPort from recorded calls.
+
+    With a `delegate` every call goes to OpenAI and is written to the store (record mode); without one
+    calls are answered from the store only (replay mode), optionally sleeping `latency_scale` times
+    the recorded latency. Keys match `BaseOpenAIAdapter`'s cache keys for the same model and parameters.
+    """
+
+    PROVIDER = "CASSETTE"
+
+    def __init__(
+        self,
+        store: CassetteStore,
+        model_name: str,
+        generation_params: Optional[Dict[str, Any]] = None,
+        delegate: Optional[BaseOpenAIAdapter] = None,
+        latency_scale: float = 0.0,
+    ):
+        self.store = store
+        self.model_name = model_name
+        self.generation_params = generation_params if generation_params is not None else {}
+        self.delegate = delegate
+        self.latency_scale = latency_scale
+
+    @classmethod
+    def recording(cls, store: CassetteStore, delegate: BaseOpenAIAdapter) -> "CassetteLLMAdapter":
+        return cls(store, delegate.model_name, delegate._get_generation_params(), delegate=delegate)
+
+    async def generate_text_output(self, request: LLMRequest) -> LLMResponse[str]:
+        key, seq = self.__key(request)
+        if self.delegate is None:
+            cassette = await self.__replay(request, key, seq)
+            return self.__response(cassette.content, cassette)
+        started = time.perf_counter()
+        response = await self.delegate.generate_text_output(request)
+        await self.__record(key, seq, self.__cassette(response.content, response.usage, started))
+        return response
+
+    async def stream_text_output(self, request: LLMRequest) -> AsyncIterator[str]:
+        key, seq = self.__key(request)
+        if self.delegate is None:
+            cassette = await self.__replay(request, key, seq, streaming=True)
+            chunks = cassette.chunks or [cassette.content]
+            await self.__sleep(cassette.first_chunk_ms)
+            gap_ms = (cassette.latency_ms - cassette.first_chunk_ms) / max(1, len(chunks) - 1)
+            for index, chunk in enumerate(chunks):
+                if index:
+                    await self.__sleep(gap_ms)
+                yield chunk
+            return
+        started = time.perf_counter()
+        first_chunk_ms = 0.0
+        chunks: List[str] = []
+        async for delta in self.delegate.stream_text_output(request):
+            if not chunks:
+                first_chunk_ms = (time.perf_counter() - started) * 1000
+            chunks.append(delta)
+            yield delta
+        # Only complete streams are recorded; a consumer that stops early never gets here.
+        cassette = self.__cassette("".join(chunks), None, started)
+        await self.__record(key, seq, Cassette(
+            content=cassette.content, chunks=chunks, latency_ms=cassette.latency_ms, first_chunk_ms=first_chunk_ms
+        ))
+
+    async def generate_structured_output(self, request: LLMRequest, response_format: Type[T]) -> LLMResponse[T]:
+        key, seq = self.__key(request, response_format)
+        if self.delegate is None:
+            cassette = await self.__replay(request, key, seq)
+            return self.__response(response_format.model_validate_json(cassette.content), cassette)
+        started = time.perf_counter()
+        response = await self.delegate.generate_structured_output(request, response_format)
+        await self.__record(key, seq, self.__cassette(response.content.model_dump_json(), response.usage, started))
+        return response
+
+    def __key(self, request: LLMRequest, response_format: Optional[Type[BaseModel]] = None) -> Tuple[str, int]:
+        key = llm_cache_key(
+            provider=BaseOpenAIAdapter.PROVIDER,
+            model_name=self.model_name,
+            generation_params=self.generation_params,
+            system_prompt=request.system_prompt,
+            user_prompt=request.user_prompt,
+            response_format=response_format,
+        )
+        return key, self.store.next_seq(key)
+
+    async def __replay(self, request: LLMRequest, key: str, seq: int, streaming: bool = False) -> Cassette:
+        with span("llm.call", model=self.model_name, feature=request.feature or "unknown", cassette="replay"):
+            try:
+                cassette = await self.store.load(key, seq)
+            except sqlite3.Error as e:
+                raise LLMProviderError(provider=self.PROVIDER) from e
+            if cassette is None:
+                logger.warning(
+                    "No cassette recorded for LLM request",
+                    extra={"context": {"cassette_key": key, "feature": request.feature, "question_slug": request.question_slug}},
+                )
+                raise LLMCassetteMissException(provider=self.PROVIDER, cassette_key=key)
+            if not streaming:
+                await self.__sleep(cassette.latency_ms)
+            return cassette
+
+    async def __record(self, key: str, seq: int, cassette: Cassette) -> None:
+        try:
+            await self.store.save(key, seq, self.model_name, cassette)
+        except sqlite3.Error as e:
+            logger.warning("Cassette write failed: %s", e, extra={"context": {"cassette_key": key}})
+
+    async def __sleep(self, milliseconds: float) -> None:
+        if self.latency_scale > 0 and milliseconds > 0:
+            await asyncio.sleep(milliseconds * self.latency_scale / 1000)
+
+    def __response(self, content: Any, cassette: Cassette) -> LLMResponse:
+        usage = LLMUsage(
+            prompt_tokens=cassette.prompt_tokens,
+            completion_tokens=cassette.completion_tokens,
+            latency_ms=cassette.latency_ms * self.latency_scale,
+        )
+        return LLMResponse(content=content, model_name=self.model_name, provider=self.PROVIDER, usage=usage)
+
+    @staticmethod
+    def __cassette(content: str, usage: Optional[LLMUsage], started: float) -> Cassette:
+        return Cassette(
+            content=content,
+            prompt_tokens=usage.prompt_tokens if usage is not None else 0,
+            completion_tokens=usage.completion_tokens if usage is not None else 0,
+            latency_ms=(time.perf_counter() - started) * 1000,
+        )
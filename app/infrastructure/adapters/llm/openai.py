@@ -1,71 +1,268 @@
-from typing import Dict, List, Type, TypeVar, Final, Any
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type, TypeVar, Final, Any
 from pydantic import BaseModel
+from app.application.shared.tracing import Span, span
 from app.domain.shared.exception.llm.llm_exception import (
     EmptyResponseException,
     LLMException,
     LLMProviderError,
     StructuredOutputNotGeneratedException,
 )
-from app.domain.ports.llm.models import LLMRequest, LLMResponse
+from app.domain.ports.llm.models import LLMRequest, LLMResponse, LLMUsage
+from app.infrastructure.cache.llm_response import LLMResponseCache, llm_cache_key
+from app.infrastructure.adapters.llm.retry import Retrier
+from app.infrastructure.adapters.llm.scheduler import LLMScheduler, NullLLMScheduler, Reservation, estimate_tokens
+from app.infrastructure.cache.single_flight import SingleFlight
+from app.infrastructure.cache.stats import CacheStats
+from app.infrastructure.observability.metrics import LLMCallTimer
+from app.infrastructure.observability.usage import ModelPricing, NullUsageTracker, UsageTracker, usage_cost
 from openai import APIError, AsyncOpenAI
 from abc import ABC, abstractmethod
 
 
 T = TypeVar('T', bound=BaseModel)
 
+
+@dataclass(frozen=True)
+class LLMModelSpec:
+    """Model and generation parameters of an adapter; cache and cassette keys are derived from them."""
+    model_name: str
+    generation_params: Dict[str, Any] = field(default_factory=dict)
+
+
 class BaseOpenAIAdapter(ABC):
 
     PROVIDER: Final[str] = "OPENAI"
 
-    def __init__(self, client: AsyncOpenAI, model_name: str):
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model_name: str,
+        response_cache: Optional[LLMResponseCache] = None,
+        cache_enabled: bool = True,
+        scheduler: Optional[LLMScheduler] = None,
+        expected_output_tokens: int = 1024,
+        retrier: Optional[Retrier] = None,
+        usage_tracker: Optional[UsageTracker] = None,
+        pricing: Optional[Dict[str, ModelPricing]] = None,
+    ):
         self.model_name = model_name
         self.client = client
+        self.response_cache = response_cache if cache_enabled else None
+        self.scheduler = scheduler if scheduler is not None else NullLLMScheduler()
+        self.expected_output_tokens = expected_output_tokens
+        self.retrier = retrier if retrier is not None else Retrier(provider=self.PROVIDER)
+        self.usage_tracker = usage_tracker if usage_tracker is not None else NullUsageTracker()
+        self.pricing = pricing
+        self._single_flight: SingleFlight[str, Tuple[str, Optional[LLMUsage]]] = SingleFlight()
 
     @abstractmethod
     def _get_generation_params(self) -> Dict[str, Any]:
         """Returns model-specific generation parameters."""
         pass
 
-    async def generate_text_output(self, request: LLMRequest) -> str:
+    @property
+    def spec(self) -> LLMModelSpec:
+        return LLMModelSpec(self.model_name, self._get_generation_params())
+
+    async def generate_text_output(self, request: LLMRequest) -> LLMResponse[str]:
+        if self.response_cache is None:
+            return await self._generate_text_output(request)
+        cache_key = self._cache_key(request)
+        cached = await self.response_cache.get(cache_key)
+        if cached is not None:
+            return self.__response(cached, self.__record_cache_hit(request))
+        content, usage = await self._single_flight.do(
+            cache_key, lambda: self.__generate_and_cache(cache_key, self._generate_text_output(request), str)
+        )
+        return self.__response(content, usage)
+
+    async def stream_text_output(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Yields completion deltas as they arrive; a cache hit is yielded as a single chunk."""
+        cache_key = self._cache_key(request) if self.response_cache is not None else None
+        if cache_key is not None:
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                self.__record_cache_hit(request)
+                yield cached
+                return
+        chunks: List[str] = []
+        async for delta in self._stream_text_output(request):
+            chunks.append(delta)
+            yield delta
+        if not chunks:
+            raise EmptyResponseException(provider=self.PROVIDER)
+        if cache_key is not None:
+            await self.response_cache.set(cache_key, "".join(chunks))
+
+    async def generate_structured_output(
+        self, request: LLMRequest, response_format: Type[T]
+    ) -> LLMResponse[T]:
+        if self.response_cache is None:
+            return await self._generate_structured_output(request, response_format)
+        cache_key = self._cache_key(request, response_format)
+        cached = await self.response_cache.get(cache_key)
+        if cached is not None:
+            usage = self.__record_cache_hit(request)
+        else:
+            cached, usage = await self._single_flight.do(
+                cache_key,
+                lambda: self.__generate_and_cache(
+                    cache_key,
+                    self._generate_structured_output(request, response_format),
+                    lambda content: content.model_dump_json(),
+                ),
+            )
+        # Every caller gets its own parsed copy, including the ones that joined an in-flight call.
+        return self.__response(response_format.model_validate_json(cached), usage)
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Response cache counters, with the concurrent misses this adapter coalesced into one call."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.stats(coalesced=self._single_flight.coalesced)
+
+    async def _generate_text_output(self, request: LLMRequest) -> LLMResponse[str]:
         messages = self.__prepare_messages(request)
-        try:
+        started = time.perf_counter()
+
+        async def attempt(timeout: Optional[float], reservation: Reservation):
             response = await self.client.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
+                timeout=timeout,
                 **self._get_generation_params(),
             )
-            if not response.choices or not response.choices[0].message.content:
-                raise EmptyResponseException(provider=self.PROVIDER)
-            return response.choices[0].message.content
-        except APIError as e:
+            reservation.settle(_total_tokens(response.usage))
+            return response
+
+        try:
+            with LLMCallTimer(request.feature, self.model_name), self.__span(request) as call:
+                response = await self.retrier.call(attempt, lambda: self.__admit(request))
+        except (APIError, asyncio.TimeoutError) as e:
             raise LLMProviderError(provider=self.PROVIDER) from e
+        usage = self.__record_usage(request, response.usage, started, call)
+        if not response.choices or not response.choices[0].message.content:
+            raise EmptyResponseException(provider=self.PROVIDER)
+        return self.__response(response.choices[0].message.content, usage)
 
-    async def generate_structured_output(
+    async def _stream_text_output(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Opening the stream is retried; once deltas have been yielded a failure is final."""
+        messages = self.__prepare_messages(request)
+        started = time.perf_counter()
+
+        async def attempt(timeout: Optional[float], reservation: Reservation):
+            stream = await self.client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},
+                timeout=timeout,
+                **self._get_generation_params(),
+            )
+            return stream, reservation
+
+        try:
+            with LLMCallTimer(request.feature, self.model_name), self.__span(request) as call:
+                stream, reservation = await self.retrier.call(attempt, lambda: self.__admit(request))
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    if chunk.usage is not None:
+                        reservation.settle(_total_tokens(chunk.usage))
+                        self.__record_usage(request, chunk.usage, started, call)
+        except (APIError, asyncio.TimeoutError) as e:
+            raise LLMProviderError(provider=self.PROVIDER) from e
+
+    async def _generate_structured_output(
         self, request: LLMRequest, response_format: Type[T]
     ) -> LLMResponse[T]:
         messages = self.__prepare_messages(request)
-        try:
+        started = time.perf_counter()
+
+        async def attempt(timeout: Optional[float], reservation: Reservation):
             response = await self.client.responses.parse(
                 model=self.model_name,
                 input=messages,
                 text_format=response_format,
+                timeout=timeout,
                 **self._get_generation_params(),
             )
-            if response.error or not response.output:
-                raise StructuredOutputNotGeneratedException(
-                    provider=self.PROVIDER,
-                    response_format_name=response_format.__name__,
-                )
-            return LLMResponse(
-                content=response.output_parsed,
-                model_name=self.model_name,
-                provider=self.PROVIDER,
-            )
+            reservation.settle(_total_tokens(response.usage))
+            return response
+
+        try:
+            with LLMCallTimer(request.feature, self.model_name), self.__span(request) as call:
+                response = await self.retrier.call(attempt, lambda: self.__admit(request))
+        except LLMException:
+            raise
         except Exception as e:
             raise StructuredOutputNotGeneratedException(
                 provider=self.PROVIDER,
                 response_format_name=response_format.__name__,
             ) from e
+        usage = self.__record_usage(request, response.usage, started, call)
+        if response.error or not response.output:
+            raise StructuredOutputNotGeneratedException(
+                provider=self.PROVIDER,
+                response_format_name=response_format.__name__,
+            )
+        return self.__response(response.output_parsed, usage)
+
+    def _cache_key(self, request: LLMRequest, response_format: Optional[Type[BaseModel]] = None) -> str:
+        return llm_cache_key(
+            provider=self.PROVIDER,
+            model_name=self.model_name,
+            generation_params=self._get_generation_params(),
+            system_prompt=request.system_prompt,
+            user_prompt=request.user_prompt,
+            response_format=response_format,
+        )
+
+    def __span(self, request: LLMRequest) -> span:
+        return span("llm.call", model=self.model_name, feature=request.feature or "unknown")
+
+    async def __admit(self, request: LLMRequest) -> Reservation:
+        return await self.scheduler.admit(estimate_tokens(request, self.expected_output_tokens), request.priority)
+
+    async def __generate_and_cache(self, cache_key: str, generation, serialize) -> Tuple[str, Optional[LLMUsage]]:
+        response = await generation
+        value = serialize(response.content)
+        await self.response_cache.set(cache_key, value)
+        return value, response.usage
+
+    def __response(self, content: Any, usage: Optional[LLMUsage]) -> LLMResponse:
+        return LLMResponse(content=content, model_name=self.model_name, provider=self.PROVIDER, usage=usage)
+
+    def __record_usage(
+        self, request: LLMRequest, usage: Any, started: float, call: Optional[Span] = None
+    ) -> Optional[LLMUsage]:
+        """Reads chat-completions or responses-API usage, prices it and adds it to the tracker."""
+        if usage is None:
+            return None
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or getattr(usage, "input_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", 0) or 0
+        details = getattr(usage, "prompt_tokens_details", None) or getattr(usage, "input_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", 0) or 0
+        recorded = LLMUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            cost_usd=usage_cost(self.model_name, prompt_tokens, completion_tokens, cached_tokens, self.pricing),
+            latency_ms=(time.perf_counter() - started) * 1000,
+        )
+        self.usage_tracker.record(request, self.model_name, recorded)
+        if call is not None:
+            call.set_attribute("prompt_tokens", prompt_tokens)
+            call.set_attribute("completion_tokens", completion_tokens)
+        return recorded
+
+    def __record_cache_hit(self, request: LLMRequest) -> LLMUsage:
+        usage = LLMUsage(cache_hit=True)
+        self.usage_tracker.record(request, self.model_name, usage)
+        return usage
 
     @staticmethod
     def __prepare_messages(request: LLMRequest) -> List[Dict[str, str]]:
@@ -74,16 +271,42 @@ class BaseOpenAIAdapter(ABC):
             {"role": "user", "content": request.user_prompt}
         ]
 
+def _total_tokens(usage: Any) -> Optional[int]:
+    return getattr(usage, "total_tokens", None)
+
 class OpenAIAdapter(BaseOpenAIAdapter):
 
     def _get_generation_params(self) -> Dict[str, Any]:
         return {}
 
 class OpenAITemperatureConfigurableAdapter(BaseOpenAIAdapter):
-    
-    def __init__(self, client: AsyncOpenAI, model_name: str, temperature: float = 0.5):
-        super().__init__(client, model_name)
+    """Temperature-sampled adapter; responses are not cached unless explicitly enabled."""
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model_name: str,
+        temperature: float = 0.5,
+        response_cache: Optional[LLMResponseCache] = None,
+        cache_enabled: bool = False,
+        scheduler: Optional[LLMScheduler] = None,
+        expected_output_tokens: int = 1024,
+        retrier: Optional[Retrier] = None,
+        usage_tracker: Optional[UsageTracker] = None,
+        pricing: Optional[Dict[str, ModelPricing]] = None,
+    ):
+        super().__init__(
+            client,
+            model_name,
+            response_cache=response_cache,
+            cache_enabled=cache_enabled,
+            scheduler=scheduler,
+            expected_output_tokens=expected_output_tokens,
+            retrier=retrier,
+            usage_tracker=usage_tracker,
+            pricing=pricing,
+        )
         self.temperature = temperature
 
     def _get_generation_params(self) -> Dict[str, Any]:
-        return {"temperature": self.temperature}
\ No newline at end of file
+        return {"temperature": self.temperature}
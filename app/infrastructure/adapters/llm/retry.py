@@ -0,0 +1,159 @@
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from openai import APIConnectionError, APIStatusError
+
+from app.application.shared.deadline import remaining_seconds
+from app.domain.shared.exception.llm.llm_exception import LLMDeadlineExceededException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+_RETRYABLE_STATUS = frozenset({408, 409, 429})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter: attempt n waits uniform(0, min(max_delay, base_delay * 2^(n-1)))."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    attempt_timeout: Optional[float] = 60.0
+    min_attempt_seconds: float = 2.0
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    calls: int
+    attempts: int
+    retries: int
+    deadline_exceeded: int
+    retry_seconds: float
+    attempts_per_call: Dict[int, int]
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Timeouts, dropped connections, rate limits and 5xx are transient; other errors would fail again."""
+    if isinstance(error, (asyncio.TimeoutError, APIConnectionError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code in _RETRYABLE_STATUS or error.status_code >= 500
+    return False
+
+
+class Retrier:
+    """Runs an LLM call under the current deadline, retrying transient failures.
+
+    Each attempt gets `attempt_timeout` or whatever is left of the deadline, whichever is less.
+    A retry is only scheduled when the backoff still leaves `min_attempt_seconds` before the
+    deadline; otherwise LLMDeadlineExceededException is raised instead of starting an attempt
+    that cannot finish.
+
+    The attempt's timer starts once `admit` (waiting for the rate-limit scheduler) has returned,
+    so time spent queued never times an attempt out and sends it to the back of the queue again;
+    it only counts against the deadline.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        provider: str = "OPENAI",
+        rng: Optional[random.Random] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.provider = provider
+        self._rng = rng if rng is not None else random.Random()
+        self._sleep = sleep
+        self._calls = 0
+        self._attempts: Counter = Counter()
+        self._deadline_exceeded = 0
+        self._retry_seconds = 0.0
+
+    async def call(
+        self,
+        operation: Callable[[Optional[float], A], Awaitable[T]],
+        admit: Callable[[], Awaitable[A]],
+    ) -> T:
+        """`operation` receives the attempt's timeout, which it should pass to the client, and `admit`'s result."""
+        self._calls += 1
+        attempt = 0
+        started = time.monotonic()
+        try:
+            while True:
+                attempt += 1
+                admission = await self.__admit(admit, attempt)
+                timeout = self.__attempt_timeout(attempt)
+                try:
+                    return await asyncio.wait_for(operation(timeout, admission), timeout)
+                except Exception as e:
+                    if not is_retryable(e) or attempt >= self.policy.max_attempts:
+                        raise
+                    delay = self.__backoff(attempt, e)
+                    remaining = remaining_seconds()
+                    if remaining is not None and remaining - delay < self.policy.min_attempt_seconds:
+                        self._deadline_exceeded += 1
+                        raise LLMDeadlineExceededException(provider=self.provider, attempts=attempt) from e
+                    logger.warning(
+                        "Retrying LLM call after a transient error: %s",
+                        type(e).__name__,
+                        extra={"context": {"provider": self.provider, "attempt": attempt, "delay": round(delay, 3)}},
+                    )
+                    await self._sleep(delay)
+        finally:
+            self._attempts[attempt] += 1
+            if attempt > 1:
+                self._retry_seconds += time.monotonic() - started
+
+    def stats(self) -> RetryStats:
+        return RetryStats(
+            calls=self._calls,
+            attempts=sum(attempts * count for attempts, count in self._attempts.items()),
+            retries=sum((attempts - 1) * count for attempts, count in self._attempts.items()),
+            deadline_exceeded=self._deadline_exceeded,
+            retry_seconds=self._retry_seconds,
+            attempts_per_call=dict(self._attempts),
+        )
+
+    async def __admit(self, admit: Callable[[], Awaitable[A]], attempt: int) -> A:
+        self.__attempt_timeout(attempt)
+        try:
+            return await asyncio.wait_for(admit(), remaining_seconds())
+        except asyncio.TimeoutError:
+            self._deadline_exceeded += 1
+            raise LLMDeadlineExceededException(provider=self.provider, attempts=attempt - 1) from None
+
+    def __attempt_timeout(self, attempt: int) -> Optional[float]:
+        remaining = remaining_seconds()
+        if remaining is None:
+            return self.policy.attempt_timeout
+        if remaining < self.policy.min_attempt_seconds:
+            self._deadline_exceeded += 1
+            raise LLMDeadlineExceededException(provider=self.provider, attempts=attempt - 1)
+        if self.policy.attempt_timeout is None:
+            return remaining
+        return min(self.policy.attempt_timeout, remaining)
+
+    def __backoff(self, attempt: int, error: BaseException) -> float:
+        ceiling = min(self.policy.max_delay, self.policy.base_delay * 2 ** (attempt - 1))
+        delay = self._rng.uniform(0, ceiling)
+        retry_after = _retry_after(error)
+        return max(delay, min(retry_after, self.policy.max_delay)) if retry_after is not None else delay
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Honours the provider's Retry-After hint on 429/503 responses."""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,180 @@
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from app.domain.ports.llm.models import LLMPriority, LLMRequest
+from app.domain.shared.exception.llm.llm_exception import LLMCapacityExceededException
+
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(request: LLMRequest, max_output_tokens: int) -> int:
+    """Cheap upper-bound guess of a call's total tokens, used to budget it before it is sent."""
+    prompt_chars = len(request.user_prompt) + len(request.system_prompt or "")
+    return prompt_chars // _CHARS_PER_TOKEN + max_output_tokens
+
+
+class TokenBucket:
+    """Continuously refilling bucket; the level may go negative when actual usage exceeds the estimate."""
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._level = capacity
+        self._updated = clock()
+
+    @property
+    def level(self) -> float:
+        self.__refill()
+        return self._level
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until `amount` can be taken; 0 if it can be taken now."""
+        missing = min(amount, self.capacity) - self.level
+        return 0.0 if missing <= 0 else missing / self.refill_per_second
+
+    def take(self, amount: float) -> None:
+        self.__refill()
+        self._level -= amount
+
+    def give_back(self, amount: float) -> None:
+        self.__refill()
+        self._level = min(self.capacity, self._level + amount)
+
+    def __refill(self) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    granted: int
+    rejected: int
+    queued: int
+    waited_seconds: float
+    tokens_reconciled: int
+
+
+class Reservation:
+    """Budget taken for one call; `settle` reconciles it with the usage the provider reported."""
+
+    def __init__(self, scheduler: Optional["LLMScheduler"], estimated_tokens: int):
+        self._scheduler = scheduler
+        self.estimated_tokens = estimated_tokens
+        self.actual_tokens: Optional[int] = None
+
+    def settle(self, actual_tokens: Optional[int]) -> None:
+        if actual_tokens is None or self.actual_tokens is not None:
+            return
+        self.actual_tokens = actual_tokens
+        if self._scheduler is not None:
+            self._scheduler._reconcile(self.estimated_tokens, actual_tokens)
+
+
+class LLMScheduler:
+    """Process-wide admission control for LLM calls.
+
+    Every call takes one request from the RPM bucket and its estimated tokens from the TPM
+    bucket. Calls that cannot start immediately wait in a priority queue (interactive before
+    batch, FIFO within a class); when `max_queue` calls are already waiting, new ones are shed
+    with LLMCapacityExceededException instead of piling up behind the provider's 429s.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_queue: int = 100,
+        provider: str = "OPENAI",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60, clock)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60, clock)
+        self.max_queue = max_queue
+        self.provider = provider
+        self._clock = clock
+        self._queue: List[Tuple[int, int, asyncio.Future, int]] = []
+        self._sequence = itertools.count()
+        self._pump: Optional[asyncio.Task] = None
+        self._granted = 0
+        self._rejected = 0
+        self._waited = 0.0
+        self._reconciled = 0
+
+    async def admit(self, estimated_tokens: int, priority: LLMPriority) -> Reservation:
+        """Waits for the call's turn; callers start timing the provider request only after this returns."""
+        await self.__acquire(estimated_tokens, priority)
+        return Reservation(self, estimated_tokens)
+
+    def stats(self) -> SchedulerStats:
+        return SchedulerStats(
+            granted=self._granted,
+            rejected=self._rejected,
+            queued=sum(1 for *_, future, _ in self._queue if not future.done()),
+            waited_seconds=self._waited,
+            tokens_reconciled=self._reconciled,
+        )
+
+    async def __acquire(self, estimated_tokens: int, priority: LLMPriority) -> None:
+        if not self._queue and self.__delay(estimated_tokens) == 0:
+            self.__grant(estimated_tokens)
+            return
+        if len(self._queue) >= self.max_queue:
+            self._rejected += 1
+            raise LLMCapacityExceededException(provider=self.provider, queued=len(self._queue))
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority.value, next(self._sequence), future, estimated_tokens))
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self.__drain())
+        started = self._clock()
+        try:
+            await future
+        finally:
+            self._waited += self._clock() - started
+
+    async def __drain(self) -> None:
+        while self._queue:
+            _, _, future, estimated_tokens = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            delay = self.__delay(estimated_tokens)
+            if delay > 0:
+                # Re-check the head after sleeping: a higher-priority call may have arrived.
+                await asyncio.sleep(delay)
+                continue
+            heapq.heappop(self._queue)
+            self.__grant(estimated_tokens)
+            future.set_result(None)
+
+    def __delay(self, estimated_tokens: int) -> float:
+        return max(self.requests.delay_for(1), self.tokens.delay_for(estimated_tokens))
+
+    def __grant(self, estimated_tokens: int) -> None:
+        self.requests.take(1)
+        self.tokens.take(min(estimated_tokens, self.tokens.capacity))
+        self._granted += 1
+
+    def _reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        difference = min(estimated_tokens, self.tokens.capacity) - actual_tokens
+        if difference > 0:
+            self.tokens.give_back(difference)
+        elif difference < 0:
+            self.tokens.take(-difference)
+        self._reconciled += actual_tokens
+
+
+class NullLLMScheduler(LLMScheduler):
+    """Unlimited scheduler: every call starts immediately and nothing is tracked."""
+
+    def __init__(self):
+        super().__init__(requests_per_minute=1, tokens_per_minute=1)
+
+    async def admit(self, estimated_tokens: int, priority: LLMPriority) -> Reservation:
+        return Reservation(None, estimated_tokens)
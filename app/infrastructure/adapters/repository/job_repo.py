@@ -0,0 +1,104 @@
+import json
+import sqlite3
+from typing import List, Optional, override
+
+from app.domain.ports.repository.job_repo import TestCaseJobRepositoryPort
+from app.domain.testcase.models.models import Difficulty, JobStatus, TestCaseGenerationResponse, TestCaseJob
+from app.infrastructure.persistence.sqlite import SqliteDatabase
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS test_case_jobs (
+    job_id CHAR(32) PRIMARY KEY,
+    status TEXT NOT NULL,
+    user_input TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    num_test_cases INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    result_json TEXT,
+    error_json TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_jobs_status_created ON test_case_jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS ix_jobs_finished_at ON test_case_jobs (finished_at);
+"""
+
+_COLUMNS = (
+    "job_id, status, user_input, difficulty, num_test_cases, attempts, "
+    "created_at, started_at, finished_at, result_json, error_json"
+)
+
+
+class SqliteTestCaseJobRepository(TestCaseJobRepositoryPort):
+    """Background job state and results, one row per job."""
+
+    def __init__(self, database: SqliteDatabase):
+        self.database = database
+
+    @classmethod
+    def open(cls, path: str) -> "SqliteTestCaseJobRepository":
+        return cls(SqliteDatabase(path, schema=_SCHEMA))
+
+    @override
+    async def save(self, job: TestCaseJob) -> None:
+        row = (
+            job.job_id,
+            job.status.value,
+            job.user_input,
+            job.difficulty.value,
+            job.num_test_cases,
+            job.attempts,
+            job.created_at,
+            job.started_at,
+            job.finished_at,
+            job.result.model_dump_json() if job.result is not None else None,
+            json.dumps(job.error, default=str) if job.error is not None else None,
+        )
+        await self.database.run(lambda connection: connection.execute(
+            f"INSERT OR REPLACE INTO test_case_jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row
+        ))
+
+    @override
+    async def get(self, job_id: str) -> Optional[TestCaseJob]:
+        row = await self.database.run(lambda connection: connection.execute(
+            f"SELECT {_COLUMNS} FROM test_case_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone())
+        return self.__job(row) if row is not None else None
+
+    @override
+    async def unfinished(self) -> List[TestCaseJob]:
+        rows = await self.database.run(lambda connection: connection.execute(
+            f"SELECT {_COLUMNS} FROM test_case_jobs WHERE status IN (?, ?) ORDER BY created_at",
+            (JobStatus.QUEUED.value, JobStatus.RUNNING.value),
+        ).fetchall())
+        return [self.__job(row) for row in rows]
+
+    @override
+    async def purge_finished(self, before: float) -> int:
+        return await self.database.run(lambda connection: self.__purge(connection, before))
+
+    def close(self) -> None:
+        self.database.close()
+
+    @staticmethod
+    def __purge(connection: sqlite3.Connection, before: float) -> int:
+        return connection.execute("DELETE FROM test_case_jobs WHERE finished_at < ?", (before,)).rowcount
+
+    @staticmethod
+    def __job(row: tuple) -> TestCaseJob:
+        (job_id, status, user_input, difficulty, num_test_cases, attempts,
+         created_at, started_at, finished_at, result_json, error_json) = row
+        return TestCaseJob(
+            job_id=job_id,
+            user_input=user_input,
+            difficulty=Difficulty(difficulty),
+            num_test_cases=num_test_cases,
+            created_at=created_at,
+            status=JobStatus(status),
+            attempts=attempts,
+            started_at=started_at,
+            finished_at=finished_at,
+            result=TestCaseGenerationResponse.model_validate_json(result_json) if result_json is not None else None,
+            error=json.loads(error_json) if error_json is not None else None,
+        )
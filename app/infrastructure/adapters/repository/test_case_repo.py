@@ -0,0 +1,104 @@
+import json
+import sqlite3
+from typing import List, override
+
+from app.domain.ports.repository.test_case_repo import TestCaseRepositoryPort
+from app.domain.testcase.models.models import Difficulty, TestCase
+from app.infrastructure.persistence.sqlite import SqliteDatabase
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS test_cases (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    slug TEXT NOT NULL,
+    schema_hash CHAR(64) NOT NULL,
+    difficulty TEXT NOT NULL,
+    tag TEXT NOT NULL DEFAULT '[]',
+    input_json TEXT NOT NULL,
+    expected_result TEXT NOT NULL,
+    is_edge_case INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (slug, schema_hash, difficulty, input_json)
+);
+CREATE INDEX IF NOT EXISTS ix_cases_slug_hash ON test_cases (slug, schema_hash, difficulty);
+"""
+
+
+class SqliteTestCaseRepository(TestCaseRepositoryPort):
+    """Pool of generated test cases, one row per case, shared across users."""
+
+    def __init__(self, database: SqliteDatabase):
+        self.database = database
+
+    @classmethod
+    def open(cls, path: str) -> "SqliteTestCaseRepository":
+        return cls(SqliteDatabase(path, schema=_SCHEMA))
+
+    @override
+    async def fetch(self, slug: str, schema_hash: str, difficulty: Difficulty, count: int) -> List[TestCase]:
+        if count < 1:
+            return []
+        return await self.database.run(lambda connection: self.__fetch(connection, slug, schema_hash, difficulty, count))
+
+    @override
+    async def save_many(self, slug: str, schema_hash: str, difficulty: Difficulty, cases: List[TestCase]) -> int:
+        if not cases:
+            return 0
+        return await self.database.run(lambda connection: self.__save_many(connection, slug, schema_hash, difficulty, cases))
+
+    def close(self) -> None:
+        self.database.close()
+
+    @staticmethod
+    def __fetch(
+        connection: sqlite3.Connection, slug: str, schema_hash: str, difficulty: Difficulty, count: int
+    ) -> List[TestCase]:
+        rows = connection.execute(
+            "SELECT input_json, expected_result, is_edge_case, tag FROM test_cases "
+            "WHERE slug = ? AND schema_hash = ? AND difficulty = ? ORDER BY RANDOM() LIMIT ?",
+            (slug, schema_hash, difficulty.value, count),
+        ).fetchall()
+        return [
+            TestCase(
+                test_case_content=input_json,
+                expected_result=expected_result,
+                is_edge_case=bool(is_edge_case),
+                tags=json.loads(tag),
+            )
+            for input_json, expected_result, is_edge_case, tag in rows
+        ]
+
+    @staticmethod
+    def __save_many(
+        connection: sqlite3.Connection, slug: str, schema_hash: str, difficulty: Difficulty, cases: List[TestCase]
+    ) -> int:
+        before = connection.total_changes
+        connection.executemany(
+            "INSERT OR IGNORE INTO test_cases "
+            "(slug, schema_hash, difficulty, tag, input_json, expected_result, is_edge_case) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    slug,
+                    schema_hash,
+                    difficulty.value,
+                    json.dumps(case.tags),
+                    case.test_case_content,
+                    case.expected_result,
+                    int(case.is_edge_case),
+                )
+                for case in cases
+            ],
+        )
+        return connection.total_changes - before
+
+
+class NullTestCaseRepository(TestCaseRepositoryPort):
+    """Opt-out repository: never serves from the pool and never stores anything."""
+
+    @override
+    async def fetch(self, slug: str, schema_hash: str, difficulty: Difficulty, count: int) -> List[TestCase]:
+        return []
+
+    @override
+    async def save_many(self, slug: str, schema_hash: str, difficulty: Difficulty, cases: List[TestCase]) -> int:
+        return 0
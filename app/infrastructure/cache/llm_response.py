@@ -0,0 +1,208 @@
+import functools
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol, Tuple, Type
+
+from pydantic import BaseModel
+
+from app.infrastructure.cache.stats import CacheStats
+from app.infrastructure.persistence.sqlite import SqliteDatabase
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache(Protocol):
+    async def get(self, key: str) -> Optional[str]: ...
+
+    async def set(self, key: str, value: str) -> None: ...
+
+    def stats(self, coalesced: int = 0) -> CacheStats: ...
+
+
+@functools.lru_cache(maxsize=64)
+def _response_format_fingerprint(response_format: Type[BaseModel]) -> str:
+    schema = json.dumps(response_format.model_json_schema(), sort_keys=True, separators=(",", ":"))
+    return f"{response_format.__name__}:{hashlib.sha256(schema.encode('utf-8')).hexdigest()}"
+
+
+def llm_cache_key(
+    provider: str,
+    model_name: str,
+    generation_params: Dict[str, Any],
+    system_prompt: Optional[str],
+    user_prompt: str,
+    response_format: Optional[Type[BaseModel]] = None,
+) -> str:
+    """Content address of an LLM call: SHA-256 over every field that determines its output."""
+    payload = json.dumps(
+        [
+            provider,
+            model_name,
+            generation_params,
+            system_prompt,
+            user_prompt,
+            _response_format_fingerprint(response_format) if response_format else None,
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class InMemoryLLMResponseCache:
+    """Process-local LRU with a TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 24 * 60 * 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self.__remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        if key in self._entries:
+            self.__remove(key)
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+        self._size_bytes += len(value)
+        while len(self._entries) > self.max_entries:
+            self.__remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def stats(self, coalesced: int = 0) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            coalesced=coalesced,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+        )
+
+    def __remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self._size_bytes -= len(value)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    cache_key CHAR(64) PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_llm_responses_last_access ON llm_responses (last_access);
+CREATE INDEX IF NOT EXISTS ix_llm_responses_expires_at ON llm_responses (expires_at);
+"""
+
+
+class SqliteLLMResponseCache:
+    """On-disk cache that survives restarts; least recently used rows are evicted past max_entries.
+
+    Storage errors degrade to cache misses instead of failing the LLM call.
+    """
+
+    def __init__(self, database: SqliteDatabase, max_entries: int = 10_000, ttl_seconds: float = 7 * 24 * 60 * 60):
+        self.database = database
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = 0
+
+    @classmethod
+    def open(cls, path: str, max_entries: int = 10_000, ttl_seconds: float = 7 * 24 * 60 * 60) -> "SqliteLLMResponseCache":
+        return cls(SqliteDatabase(path, schema=_SCHEMA), max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            value, expired = await self.database.run(lambda connection: self.__get(connection, key))
+        except sqlite3.Error as e:
+            logger.warning("LLM response cache read failed: %s", e)
+            value, expired = None, False
+        if value is None:
+            self.misses += 1
+            self.expirations += int(expired)
+            return None
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        try:
+            evicted, entries = await self.database.run(lambda connection: self.__set(connection, key, value))
+        except sqlite3.Error as e:
+            logger.warning("LLM response cache write failed: %s", e)
+            return
+        self.evictions += evicted
+        self._entries = entries
+
+    def stats(self, coalesced: int = 0) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            coalesced=coalesced,
+            entries=self._entries,
+            size_bytes=0,
+        )
+
+    def close(self) -> None:
+        self.database.close()
+
+    @staticmethod
+    def __get(connection: sqlite3.Connection, key: str) -> Tuple[Optional[str], bool]:
+        now = time.time()
+        row = connection.execute(
+            "SELECT value, expires_at FROM llm_responses WHERE cache_key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None, False
+        value, expires_at = row
+        if expires_at <= now:
+            connection.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+            return None, True
+        connection.execute("UPDATE llm_responses SET last_access = ? WHERE cache_key = ?", (now, key))
+        return value, False
+
+    def __set(self, connection: sqlite3.Connection, key: str, value: str) -> Tuple[int, int]:
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO llm_responses (cache_key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+            (key, value, now + self.ttl_seconds, now),
+        )
+        connection.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+        entries = connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        excess = entries - self.max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM llm_responses WHERE cache_key IN "
+                "(SELECT cache_key FROM llm_responses ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+        return max(excess, 0), min(entries, self.max_entries)
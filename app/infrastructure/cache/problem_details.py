@@ -0,0 +1,135 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple, override
+
+from app.domain.ports.api.leetcode import GetProblemDetailsPort
+from app.domain.shared.leetcode.models import LeetCodeProblem, LeetCodeProblemDetails
+from app.infrastructure.cache.single_flight import SingleFlight
+from app.infrastructure.cache.stats import CacheStats
+from app.infrastructure.config.config import ProblemCacheSettings
+
+
+@dataclass(frozen=True)
+class _Entry:
+    details: LeetCodeProblemDetails
+    expires_at: float
+    size_bytes: int
+
+
+def problem_details_size(details: LeetCodeProblemDetails) -> int:
+    """Approximates the memory held by a problem, dominated by the question_content HTML."""
+    return sum(
+        len(value.encode("utf-8"))
+        for value in (
+            details.question_slug,
+            details.question_title,
+            details.question_content,
+            details.example_testcases,
+            details.difficulty,
+        )
+        if value
+    )
+
+
+class ProblemDetailsCache:
+    """Bounded LRU of problem details with a TTL and byte-size accounting.
+
+    Only touched from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, settings: Optional[ProblemCacheSettings] = None):
+        self.settings = settings or ProblemCacheSettings()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, question_slug: str) -> Optional[LeetCodeProblemDetails]:
+        entry = self._entries.get(question_slug)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self.__remove(question_slug)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(question_slug)
+        self.hits += 1
+        return entry.details
+
+    def put(self, question_slug: str, details: LeetCodeProblemDetails) -> None:
+        size_bytes = problem_details_size(details)
+        if size_bytes > self.settings.max_bytes:
+            return
+        if question_slug in self._entries:
+            self.__remove(question_slug)
+        self._entries[question_slug] = _Entry(
+            details=details,
+            expires_at=time.monotonic() + self.settings.ttl_seconds,
+            size_bytes=size_bytes,
+        )
+        self._size_bytes += size_bytes
+        while (
+            len(self._entries) > self.settings.max_entries
+            or self._size_bytes > self.settings.max_bytes
+        ):
+            oldest_slug, _ = self.__oldest()
+            self.__remove(oldest_slug)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def stats(self, coalesced: int = 0) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            coalesced=coalesced,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+        )
+
+    def __oldest(self) -> Tuple[str, _Entry]:
+        return next(iter(self._entries.items()))
+
+    def __remove(self, question_slug: str) -> None:
+        entry = self._entries.pop(question_slug)
+        self._size_bytes -= entry.size_bytes
+
+
+class CachingGetProblemDetailsAdapter(GetProblemDetailsPort):
+    """Process-wide read-through cache in front of any GetProblemDetailsPort.
+
+    Concurrent misses for the same slug are coalesced into one upstream call.
+    """
+
+    def __init__(self, delegate: GetProblemDetailsPort, cache: Optional[ProblemDetailsCache] = None):
+        self.delegate = delegate
+        self.cache = cache if cache is not None else ProblemDetailsCache()
+        self._single_flight: SingleFlight[str, LeetCodeProblemDetails] = SingleFlight()
+
+    @override
+    async def get_problem_details(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails:
+        question_slug = problem.question_slug.question_slug
+        cached = self.cache.get(question_slug)
+        if cached is not None:
+            return cached
+        return await self._single_flight.do(question_slug, lambda: self.__load(problem))
+
+    def stats(self) -> CacheStats:
+        return self.cache.stats(coalesced=self._single_flight.coalesced)
+
+    async def __load(self, problem: LeetCodeProblem) -> LeetCodeProblemDetails:
+        details = await self.delegate.get_problem_details(problem)
+        self.cache.put(problem.question_slug.question_slug, details)
+        return details
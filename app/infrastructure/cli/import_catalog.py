@@ -0,0 +1,103 @@
+"""
+Bulk-imports a snapshot of LeetCode problems into the local SQLite catalog.
+
+The snapshot is either a JSON array of problem records, a JSON object holding that array
+under "problems" / "questions", or NDJSON with one record per line. Records may use the
+Alfa API field names (titleSlug, questionTitle, question, exampleTestcases, difficulty).
+"""
+
+import argparse
+import json
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+from app.domain.shared.leetcode.models import LeetCodeProblemDetails
+from app.infrastructure.adapters.api.catalog import SqliteProblemCatalog, problem_details_from_record
+from app.infrastructure.config.config import ProblemCatalogSettings
+
+BATCH_SIZE = 500
+
+
+def iter_snapshot_records(path: Path) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yields the snapshot's records; an NDJSON line that is not valid JSON is reported and yielded as None."""
+    with path.open("r", encoding="utf-8") as snapshot:
+        head = snapshot.read(1)
+        while head and head.isspace():
+            head = snapshot.read(1)
+        snapshot.seek(0)
+        if head == "[":
+            yield from json.load(snapshot)
+            return
+        first_line = snapshot.readline()
+        try:
+            first_record = json.loads(first_line)
+        except json.JSONDecodeError:
+            snapshot.seek(0)
+            first_record = json.load(snapshot)
+        container = first_record.get("problems") or first_record.get("questions")
+        if isinstance(container, list):
+            yield from container
+            return
+        yield first_record
+        for line_number, line in enumerate(snapshot, 2):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"⚠️  Skipping line {line_number}: {e.msg}", file=sys.stderr)
+                record = None
+            yield record
+
+
+def import_snapshot(catalog: SqliteProblemCatalog, path: Path) -> tuple[int, int]:
+    """Imports the snapshot in batches and returns the (imported, skipped) counts."""
+    imported = skipped = 0
+    records = iter_snapshot_records(path)
+    while batch := list(islice(records, BATCH_SIZE)):
+        problems: List[LeetCodeProblemDetails] = []
+        for record in batch:
+            if record is None:
+                skipped += 1
+                continue
+            try:
+                problems.append(problem_details_from_record(record))
+            except (TypeError, ValueError, AttributeError):
+                skipped += 1
+        imported += catalog.save_many(problems)
+    return imported, skipped
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Import a LeetCode problem snapshot into the local catalog.")
+    parser.add_argument("snapshot", type=Path, help="JSON or NDJSON snapshot file")
+    parser.add_argument("--db", default=ProblemCatalogSettings.from_env().path, help="Catalog database path")
+    args = parser.parse_args(argv)
+
+    if not args.snapshot.exists():
+        print(f"❌ Snapshot not found: {args.snapshot}")
+        return 1
+
+    catalog = SqliteProblemCatalog.open(args.db)
+    started = time.perf_counter()
+    try:
+        imported, skipped = import_snapshot(catalog, args.snapshot)
+        total = catalog.count()
+    except json.JSONDecodeError as e:
+        print(f"❌ Snapshot is not valid JSON or NDJSON: {e.msg} at line {e.lineno}, column {e.colno}")
+        return 1
+    finally:
+        catalog.close()
+    elapsed = time.perf_counter() - started
+    print(f"✅ Imported {imported} problems ({skipped} skipped) in {elapsed:.2f}s. Catalog now holds {total}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
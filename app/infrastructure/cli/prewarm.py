@@ -0,0 +1,227 @@
+"""
+Pre-warms the persistent caches for a list of problems, typically right after a deploy.
+
+For every slug it fills the problem catalog, the LLM response cache with one explanation per
+ExplainationMode, and the test case pool for every Difficulty. Work runs `--concurrency` tasks
+at a time at batch LLM priority, through the same rate-limit scheduler as the app. Finished
+tasks are appended to a state file, so an interrupted run resumes where it stopped; tasks
+whose results are already stored cost no LLM call (cache hit / full pool) either way.
+
+The slug file holds one slug or title per line; blank lines, `#` comments and anything after a
+comma or tab (e.g. the hit count in "two-sum,1532" exported from traffic logs) are ignored.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Set, TextIO, Tuple
+
+from dotenv import load_dotenv
+
+from app.application.shared.batch import map_bounded
+from app.application.shared.priority import llm_priority
+from app.application.shared.tracing import trace
+from app.domain.explain.models.models import ExplainationMode
+from app.domain.ports.llm.models import LLMPriority
+from app.domain.shared.exception.base import root_application_cause
+from app.domain.shared.leetcode.models import LeetCodeProblem
+from app.domain.testcase.models.models import Difficulty
+from app.infrastructure.adapters.api.leetcode import SimpleQuestionSlugExtractorAdapter
+from app.infrastructure.config.config import LLMCacheSettings, ProblemCatalogSettings, TestCasePoolSettings
+from app.infrastructure.factories.service_factory import ServiceFactory
+
+DETAILS = "details"
+EXPLAIN = "explain"
+TEST_CASES = "test_cases"
+
+
+@dataclass(frozen=True)
+class PrewarmTask:
+    entry: str
+    kind: str
+    option: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}:{self.option}" if self.option else self.kind
+
+
+def read_entries(source: TextIO, top: Optional[int] = None) -> List[str]:
+    """Slugs or titles in file order, deduplicated, at most `top` of them."""
+    entries: List[str] = []
+    seen: Set[str] = set()
+    for line in source:
+        entry = line.split("#", 1)[0].split(",", 1)[0].split("\t", 1)[0].strip()
+        if entry and entry not in seen:
+            seen.add(entry)
+            entries.append(entry)
+            if top is not None and len(entries) >= top:
+                break
+    return entries
+
+
+def plan_tasks(entries: List[str], features: List[str], modes: List[ExplainationMode], difficulties: List[Difficulty]) -> List[PrewarmTask]:
+    tasks: List[PrewarmTask] = []
+    for entry in entries:
+        if DETAILS in features:
+            tasks.append(PrewarmTask(entry, DETAILS))
+        if EXPLAIN in features:
+            tasks.extend(PrewarmTask(entry, EXPLAIN, mode.value) for mode in modes)
+        if TEST_CASES in features:
+            tasks.extend(PrewarmTask(entry, TEST_CASES, difficulty.value) for difficulty in difficulties)
+    return tasks
+
+
+class PrewarmState:
+    """Append-only JSON lines of finished tasks; a line is flushed as soon as its task succeeds."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.done: Set[Tuple[str, str]] = set()
+        if path.exists():
+            with path.open("r", encoding="utf-8") as state:
+                for line in state:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.done.add((record["entry"], record["task"]))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a", encoding="utf-8")
+
+    def is_done(self, task: PrewarmTask) -> bool:
+        return (task.entry, task.key) in self.done
+
+    def mark_done(self, task: PrewarmTask) -> None:
+        self.done.add((task.entry, task.key))
+        self._file.write(json.dumps({"entry": task.entry, "task": task.key, "at": time.time()}) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def run_task(task: PrewarmTask, count: int) -> None:
+    with trace(f"prewarm.{task.kind}", entry=task.entry), llm_priority(LLMPriority.BATCH):
+        if task.kind == DETAILS:
+            slug = SimpleQuestionSlugExtractorAdapter().extract_question_slug(task.entry)
+            await ServiceFactory.get_problem_details_port().get_problem_details(LeetCodeProblem.of(slug))
+        elif task.kind == EXPLAIN:
+            await ServiceFactory.get_explanation_service().explain(task.entry, ExplainationMode(task.option))
+        else:
+            await ServiceFactory.get_test_case_service().generate_test_cases(task.entry, Difficulty(task.option), count)
+
+
+async def prewarm(tasks: List[PrewarmTask], state: PrewarmState, concurrency: int, count: int) -> Tuple[int, int]:
+    """Runs the tasks and returns the (succeeded, failed) counts."""
+
+    async def run(index: int, task: PrewarmTask) -> Tuple[PrewarmTask, Optional[BaseException], float]:
+        started = time.perf_counter()
+        try:
+            await run_task(task, count)
+        except Exception as e:
+            return task, e, time.perf_counter() - started
+        return task, None, time.perf_counter() - started
+
+    succeeded = failed = 0
+    async for _, (task, error, elapsed) in map_bounded(tasks, run, concurrency):
+        finished = succeeded + failed + 1
+        if error is None:
+            succeeded += 1
+            state.mark_done(task)
+            print(f"[{finished}/{len(tasks)}] ✅ {task.entry} {task.key} ({elapsed:.2f}s)")
+        else:
+            failed += 1
+            cause = root_application_cause(error)
+            print(f"[{finished}/{len(tasks)}] ❌ {task.entry} {task.key}: {cause if cause is not None else repr(error)}")
+    return succeeded, failed
+
+
+def _disabled_features(features: List[str]) -> List[str]:
+    """Features whose results would not outlive this process with the current configuration."""
+    disabled = []
+    if DETAILS in features and not ProblemCatalogSettings.from_env().enabled:
+        disabled.append(DETAILS)
+    if EXPLAIN in features and LLMCacheSettings.from_env().backend != "sqlite":
+        disabled.append(EXPLAIN)
+    if TEST_CASES in features and not TestCasePoolSettings.from_env().enabled:
+        disabled.append(TEST_CASES)
+    return disabled
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Pre-warm the problem catalog, explanation cache and test case pool.")
+    parser.add_argument("slugs", help="File with one slug or title per line ('-' for stdin)")
+    parser.add_argument("--top", type=int, help="Only the first N entries")
+    parser.add_argument("--features", default=",".join([DETAILS, EXPLAIN, TEST_CASES]), help="Comma-separated subset of details,explain,test_cases")
+    parser.add_argument("--modes", default=",".join(mode.value for mode in ExplainationMode), help="Explanation modes to warm")
+    parser.add_argument("--difficulties", default=",".join(d.value for d in Difficulty), help="Test case difficulties to warm")
+    parser.add_argument("--count", type=int, default=10, help="Test cases to pool per difficulty")
+    parser.add_argument("--concurrency", type=int, default=4, help="Tasks run at once")
+    parser.add_argument("--requests-per-minute", type=int, help="LLM request budget for this run (default: LLM_REQUESTS_PER_MINUTE)")
+    parser.add_argument("--tokens-per-minute", type=int, help="LLM token budget for this run (default: LLM_TOKENS_PER_MINUTE)")
+    parser.add_argument("--state", type=Path, default=Path("data/prewarm_state.jsonl"), help="Progress file used to resume")
+    parser.add_argument("--restart", action="store_true", help="Ignore and clear the progress file")
+    args = parser.parse_args(argv)
+
+    try:
+        features = [feature.strip() for feature in args.features.split(",") if feature.strip()]
+        modes = [ExplainationMode(mode.strip().lower()) for mode in args.modes.split(",") if mode.strip()]
+        difficulties = [Difficulty(d.strip().upper()) for d in args.difficulties.split(",") if d.strip()]
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    unknown = set(features) - {DETAILS, EXPLAIN, TEST_CASES}
+    if unknown:
+        print(f"❌ Unknown features: {', '.join(sorted(unknown))}")
+        return 2
+    for feature in _disabled_features(features):
+        print(f"⚠️  Skipping {feature}: its results are not persisted with the current configuration.")
+        features.remove(feature)
+
+    # The run gets its own scheduler; give it a share of the account budget so the live app keeps the rest.
+    if args.requests_per_minute is not None:
+        os.environ["LLM_REQUESTS_PER_MINUTE"] = str(args.requests_per_minute)
+    if args.tokens_per_minute is not None:
+        os.environ["LLM_TOKENS_PER_MINUTE"] = str(args.tokens_per_minute)
+
+    if args.slugs == "-":
+        entries = read_entries(sys.stdin, args.top)
+    else:
+        if not Path(args.slugs).exists():
+            print(f"❌ Slug file not found: {args.slugs}")
+            return 1
+        with open(args.slugs, "r", encoding="utf-8") as source:
+            entries = read_entries(source, args.top)
+
+    if args.restart and args.state.exists():
+        args.state.unlink()
+    state = PrewarmState(args.state)
+    planned = plan_tasks(entries, features, modes, difficulties)
+    tasks = [task for task in planned if not state.is_done(task)]
+    print(f"🔥 {len(entries)} problems, {len(planned)} tasks, {len(planned) - len(tasks)} already warm.")
+
+    async def run() -> Tuple[int, int]:
+        try:
+            return await prewarm(tasks, state, args.concurrency, args.count)
+        finally:
+            await ServiceFactory.aclose()
+
+    started = time.perf_counter()
+    try:
+        succeeded, failed = asyncio.run(run()) if tasks else (0, 0)
+    except KeyboardInterrupt:
+        print(f"⏸️  Interrupted; progress is saved in {args.state}.")
+        return 130
+    finally:
+        state.close()
+    print(f"✅ Warmed {succeeded} tasks ({failed} failed) in {time.perf_counter() - started:.2f}s.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+import os
+from dataclasses import dataclass
+
+
+def _env_str(name: str, default: str) -> str:
+    value = os.getenv(name)
+    return value if value not in (None, "") else default
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class HttpClientSettings:
+    """Timeouts and pool limits for the shared outbound HTTP client."""
+
+    connect_timeout: float = 3.0
+    read_timeout: float = 10.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "HttpClientSettings":
+        return cls(
+            connect_timeout=_env_float("HTTP_CONNECT_TIMEOUT", cls.connect_timeout),
+            read_timeout=_env_float("HTTP_READ_TIMEOUT", cls.read_timeout),
+            write_timeout=_env_float("HTTP_WRITE_TIMEOUT", cls.write_timeout),
+            pool_timeout=_env_float("HTTP_POOL_TIMEOUT", cls.pool_timeout),
+            max_connections=_env_int("HTTP_MAX_CONNECTIONS", cls.max_connections),
+            max_keepalive_connections=_env_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", cls.max_keepalive_connections),
+            keepalive_expiry=_env_float("HTTP_KEEPALIVE_EXPIRY", cls.keepalive_expiry),
+        )
+
+
+@dataclass(frozen=True)
+class ProblemCacheSettings:
+    """Bounds for the process-wide problem-details cache."""
+
+    max_entries: int = 512
+    max_bytes: int = 32 * 1024 * 1024
+    ttl_seconds: float = 6 * 60 * 60
+
+    @classmethod
+    def from_env(cls) -> "ProblemCacheSettings":
+        return cls(
+            max_entries=_env_int("PROBLEM_CACHE_MAX_ENTRIES", cls.max_entries),
+            max_bytes=_env_int("PROBLEM_CACHE_MAX_BYTES", cls.max_bytes),
+            ttl_seconds=_env_float("PROBLEM_CACHE_TTL_SECONDS", cls.ttl_seconds),
+        )
+
+
+@dataclass(frozen=True)
+class ProblemCatalogSettings:
+    """Location of the local SQLite problem catalog; disabled means always fetch upstream."""
+
+    enabled: bool = True
+    path: str = "data/problem_catalog.db"
+
+    @classmethod
+    def from_env(cls) -> "ProblemCatalogSettings":
+        return cls(
+            enabled=_env_bool("PROBLEM_CATALOG_ENABLED", cls.enabled),
+            path=_env_str("PROBLEM_CATALOG_PATH", cls.path),
+        )
+
+
+@dataclass(frozen=True)
+class TestCasePoolSettings:
+    """Location of the shared test-case pool; disabled opts out through NullTestCaseRepository."""
+
+    enabled: bool = True
+    path: str = "data/test_cases.db"
+
+    @classmethod
+    def from_env(cls) -> "TestCasePoolSettings":
+        return cls(
+            enabled=_env_bool("TEST_CASE_POOL_ENABLED", cls.enabled),
+            path=_env_str("TEST_CASE_POOL_PATH", cls.path),
+        )
+
+
+@dataclass(frozen=True)
+class LLMCacheSettings:
+    """Backend for the content-addressed LLM response cache: "sqlite", "memory" or "none"."""
+
+    backend: str = "sqlite"
+    path: str = "data/llm_cache.db"
+    max_entries: int = 10_000
+    ttl_seconds: float = 7 * 24 * 60 * 60
+
+    @classmethod
+    def from_env(cls) -> "LLMCacheSettings":
+        return cls(
+            backend=_env_str("LLM_CACHE_BACKEND", cls.backend).lower(),
+            path=_env_str("LLM_CACHE_PATH", cls.path),
+            max_entries=_env_int("LLM_CACHE_MAX_ENTRIES", cls.max_entries),
+            ttl_seconds=_env_float("LLM_CACHE_TTL_SECONDS", cls.ttl_seconds),
+        )
+
+
+@dataclass(frozen=True)
+class LLMModeSettings:
+    """"live" calls OpenAI, "record" calls it and writes cassettes, "replay" answers from cassettes only."""
+
+    mode: str = "live"
+    cassette_path: str = "data/llm_cassettes.db"
+    replay_latency_scale: float = 0.0
+
+    @classmethod
+    def from_env(cls) -> "LLMModeSettings":
+        return cls(
+            mode=_env_str("LLM_MODE", cls.mode).lower(),
+            cassette_path=_env_str("LLM_CASSETTE_PATH", cls.cassette_path),
+            replay_latency_scale=_env_float("LLM_REPLAY_LATENCY_SCALE", cls.replay_latency_scale),
+        )
+
+
+@dataclass(frozen=True)
+class TestCaseSourceSettings:
+    """Generation source per difficulty: "llm", "local" (boundary/equivalence engine) or "hybrid"."""
+
+    easy: str = "llm"
+    medium: str = "llm"
+    hard: str = "llm"
+
+    @classmethod
+    def from_env(cls) -> "TestCaseSourceSettings":
+        return cls(
+            easy=_env_str("TEST_CASE_SOURCE_EASY", cls.easy).lower(),
+            medium=_env_str("TEST_CASE_SOURCE_MEDIUM", cls.medium).lower(),
+            hard=_env_str("TEST_CASE_SOURCE_HARD", cls.hard).lower(),
+        )
+
+
+@dataclass(frozen=True)
+class TestCaseGenerationSettings:
+    """LLM fan-out: requests above `chunk_size` cases are split and each request generates `max_concurrency` chunks at a time."""
+
+    chunk_size: int = 5
+    max_concurrency: int = 4
+    max_test_cases: int = 50
+
+    @classmethod
+    def from_env(cls) -> "TestCaseGenerationSettings":
+        return cls(
+            chunk_size=_env_int("TEST_CASE_CHUNK_SIZE", cls.chunk_size),
+            max_concurrency=_env_int("TEST_CASE_MAX_CONCURRENCY", cls.max_concurrency),
+            max_test_cases=_env_int("TEST_CASE_MAX_COUNT", cls.max_test_cases),
+        )
+
+
+@dataclass(frozen=True)
+class BatchSettings:
+    """Limits of `POST /batch`: items per request and items processed at once."""
+
+    max_items: int = 500
+    max_concurrency: int = 8
+
+    @classmethod
+    def from_env(cls) -> "BatchSettings":
+        return cls(
+            max_items=_env_int("BATCH_MAX_ITEMS", cls.max_items),
+            max_concurrency=_env_int("BATCH_MAX_CONCURRENCY", cls.max_concurrency),
+        )
+
+
+@dataclass(frozen=True)
+class JobQueueSettings:
+    """Background test case jobs: SQLite store, worker count, queue limit and how long finished jobs are kept."""
+
+    path: str = "data/jobs.db"
+    workers: int = 2
+    max_queued: int = 1000
+    retention_seconds: float = 7 * 24 * 60 * 60
+
+    @classmethod
+    def from_env(cls) -> "JobQueueSettings":
+        return cls(
+            path=_env_str("JOB_DB_PATH", cls.path),
+            workers=_env_int("JOB_WORKERS", cls.workers),
+            max_queued=_env_int("JOB_MAX_QUEUED", cls.max_queued),
+            retention_seconds=_env_float("JOB_RETENTION_SECONDS", cls.retention_seconds),
+        )
+
+
+@dataclass(frozen=True)
+class LLMSchedulerSettings:
+    """Shared OpenAI budget: requests and tokens per minute, and how many calls may wait for it."""
+
+    enabled: bool = True
+    requests_per_minute: int = 500
+    tokens_per_minute: int = 200_000
+    max_queue: int = 100
+    expected_output_tokens: int = 1024
+
+    @classmethod
+    def from_env(cls) -> "LLMSchedulerSettings":
+        return cls(
+            enabled=_env_bool("LLM_SCHEDULER_ENABLED", cls.enabled),
+            requests_per_minute=_env_int("LLM_REQUESTS_PER_MINUTE", cls.requests_per_minute),
+            tokens_per_minute=_env_int("LLM_TOKENS_PER_MINUTE", cls.tokens_per_minute),
+            max_queue=_env_int("LLM_MAX_QUEUE", cls.max_queue),
+            expected_output_tokens=_env_int("LLM_EXPECTED_OUTPUT_TOKENS", cls.expected_output_tokens),
+        )
+
+
+@dataclass(frozen=True)
+class LLMRetrySettings:
+    """Retries of transient OpenAI failures and the end-to-end deadline each feature gives its LLM calls."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    attempt_timeout: float = 60.0
+    explain_deadline: float = 90.0
+    test_case_deadline: float = 120.0
+
+    @classmethod
+    def from_env(cls) -> "LLMRetrySettings":
+        return cls(
+            max_attempts=_env_int("LLM_MAX_ATTEMPTS", cls.max_attempts),
+            base_delay=_env_float("LLM_RETRY_BASE_DELAY", cls.base_delay),
+            max_delay=_env_float("LLM_RETRY_MAX_DELAY", cls.max_delay),
+            attempt_timeout=_env_float("LLM_ATTEMPT_TIMEOUT", cls.attempt_timeout),
+            explain_deadline=_env_float("EXPLAIN_DEADLINE_SECONDS", cls.explain_deadline),
+            test_case_deadline=_env_float("TEST_CASE_DEADLINE_SECONDS", cls.test_case_deadline),
+        )
+
+
+@dataclass(frozen=True)
+class TracingSettings:
+    """Where finished spans go: "none", "jsonl" (appended to `path`) or "memory" (served at /traces)."""
+
+    exporter: str = "none"
+    path: str = "data/traces.jsonl"
+    max_spans: int = 10_000
+
+    @classmethod
+    def from_env(cls) -> "TracingSettings":
+        return cls(
+            exporter=_env_str("TRACE_EXPORTER", cls.exporter).lower(),
+            path=_env_str("TRACE_PATH", cls.path),
+            max_spans=_env_int("TRACE_MAX_SPANS", cls.max_spans),
+        )
+
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    """Queue size of the off-thread log pipeline and the share of DEBUG/INFO records that are kept."""
+
+    level: str = "INFO"
+    queue_size: int = 10_000
+    sample_debug: float = 1.0
+    sample_info: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "LoggingSettings":
+        return cls(
+            level=_env_str("LOG_LEVEL", cls.level).upper(),
+            queue_size=_env_int("LOG_QUEUE_SIZE", cls.queue_size),
+            sample_debug=_env_float("LOG_SAMPLE_DEBUG", cls.sample_debug),
+            sample_info=_env_float("LOG_SAMPLE_INFO", cls.sample_info),
+        )
@@ -1,41 +1,55 @@
 import logging
 import sys
-from logging import config as logging_config
+from typing import Optional
 
-from pythonjsonlogger import jsonlogger
+from app.infrastructure.config.config import LoggingSettings
+from app.infrastructure.observability.log_queue import (
+    BoundedQueueHandler,
+    BoundedQueueListener,
+    FastJsonFormatter,
+    SamplingFilter,
+)
+from app.infrastructure.observability.tracing import TraceContextFilter
 
+_listener: Optional[BoundedQueueListener] = None
 
-def configure_logging() -> None:
+
+def configure_logging(settings: Optional[LoggingSettings] = None) -> BoundedQueueHandler:
     """
     Configures logging for the application to output structured JSON logs.
+    Records carry the `trace_id` and `span_id` of the request being handled.
+
+    Callers only enqueue the record; formatting and the stdout write happen on a QueueListener
+    thread. Returns the queue handler, whose `dropped` counts records lost to a full queue.
     """
-    logging_config.dictConfig(
-        {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "json": {
-                    "()": jsonlogger.JsonFormatter,
-                    "format": "%(asctime)s %(name)s %(levelname)s %(message)s %(context)s",
-                },
-            },
-            "handlers": {
-                "stdout": {
-                    "class": "logging.StreamHandler",
-                    "stream": sys.stdout,
-                    "formatter": "json",
-                },
-            },
-            "loggers": {
-                "app": {
-                    "handlers": ["stdout"],
-                    "level": "INFO",
-                    "propagate": False,
-                },
-                "": {
-                    "handlers": ["stdout"],
-                    "level": "WARNING",
-                },
-            },
-        }
-    )
+    global _listener
+    settings = settings if settings is not None else LoggingSettings.from_env()
+    shutdown_logging()
+
+    stdout = logging.StreamHandler(sys.stdout)
+    stdout.setFormatter(FastJsonFormatter())
+
+    handler = BoundedQueueHandler(settings.queue_size)
+    handler.addFilter(SamplingFilter({logging.DEBUG: settings.sample_debug, logging.INFO: settings.sample_info}))
+    handler.addFilter(TraceContextFilter())
+
+    app_logger = logging.getLogger("app")
+    app_logger.handlers = [handler]
+    app_logger.setLevel(settings.level)
+    app_logger.propagate = False
+
+    root_logger = logging.getLogger()
+    root_logger.handlers = [handler]
+    root_logger.setLevel(logging.WARNING)
+
+    _listener = BoundedQueueListener(handler.queue, stdout)
+    _listener.start()
+    return handler
+
+
+def shutdown_logging() -> None:
+    """Writes out the records still queued and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,40 +1,323 @@
 
 import os
+from typing import Callable, Dict, Optional, Union
 
 from openai import AsyncOpenAI
+from app.application.testcase.dedup import TestCaseDeduplicator
 from app.application.testcase.generator import TestCaseGenerator
+from app.application.testcase.jobs import TestCaseJobQueue
+from app.application.testcase.local_generator import LocalTestCaseGenerator
 from app.application.testcase.service import TestCaseService
+from app.application.testcase.validation import TestCaseValidator
 from app.application.explain.service import ExplanationService
+from app.application.shared.statement import StatementCompactor
+from app.domain.ports.api.leetcode import GetProblemDetailsPort
+from app.infrastructure.adapters.api.catalog import SqliteCatalogGetProblemDetailsAdapter, SqliteProblemCatalog
+from app.infrastructure.adapters.api.metered import MeteredGetProblemDetailsAdapter, MeteredQuestionSlugExtractorAdapter
+from app.infrastructure.adapters.api.http_client import PooledAsyncHttpClient
 from app.infrastructure.adapters.api.leetcode import AlfaLCGetProblemDetailsAdapter, SimpleQuestionSlugExtractorAdapter
-from app.infrastructure.adapters.llm.openai import OpenAIAdapter, OpenAITemperatureConfigurableAdapter
+from app.infrastructure.adapters.llm.cassette import CassetteLLMAdapter, CassetteStore
+from app.infrastructure.adapters.llm.openai import (
+    BaseOpenAIAdapter,
+    LLMModelSpec,
+    OpenAIAdapter,
+    OpenAITemperatureConfigurableAdapter,
+)
+from app.infrastructure.adapters.llm.retry import Retrier, RetryPolicy
+from app.infrastructure.adapters.llm.scheduler import LLMScheduler, NullLLMScheduler
 from app.application.explain.generator import ProblemStatementExplainer
+from app.infrastructure.adapters.repository.job_repo import SqliteTestCaseJobRepository
+from app.infrastructure.adapters.repository.test_case_repo import NullTestCaseRepository, SqliteTestCaseRepository
+from app.infrastructure.cache.llm_response import InMemoryLLMResponseCache, LLMResponseCache, SqliteLLMResponseCache
+from app.infrastructure.observability.metrics import CACHE_HIT_RATIO, JOB_QUEUE_DEPTH
+from app.infrastructure.observability.tracing import InMemorySpanCollector, JsonlSpanExporter
+from app.infrastructure.observability.usage import UsageTracker
+from app.application.shared.tracing import SpanExporter, set_span_exporter
+from app.infrastructure.cache.problem_details import CachingGetProblemDetailsAdapter, ProblemDetailsCache
+from app.infrastructure.config.config import (
+    HttpClientSettings,
+    JobQueueSettings,
+    LLMCacheSettings,
+    LLMModeSettings,
+    LLMRetrySettings,
+    LLMSchedulerSettings,
+    ProblemCacheSettings,
+    ProblemCatalogSettings,
+    TestCasePoolSettings,
+    TestCaseGenerationSettings,
+    TestCaseSourceSettings,
+    TracingSettings,
+)
+from app.domain.ports.repository.test_case_repo import TestCaseRepositoryPort
+from app.domain.testcase.models.models import Difficulty, TestCaseSource
 
 
 class ServiceFactory:
 
-    @staticmethod
-    def create_test_case_service() -> TestCaseService:
-        return TestCaseService(
-            slug_extractor=SimpleQuestionSlugExtractorAdapter(),
-            problem_fetcher=AlfaLCGetProblemDetailsAdapter(),
-            test_case_generator=TestCaseGenerator(
-                llm_port=OpenAITemperatureConfigurableAdapter(
-                    client=AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")),
-                    model_name="gpt-4o-mini",
-                    temperature=0.7
+    TEST_CASE_LLM = LLMModelSpec("gpt-4o-mini", {"temperature": 0.7})
+    EXPLAIN_LLM = LLMModelSpec("o3-mini")
+
+    _http_client: Optional[PooledAsyncHttpClient] = None
+    _problem_details_port: Optional[CachingGetProblemDetailsAdapter] = None
+    _problem_catalog: Optional[SqliteProblemCatalog] = None
+    _test_case_repository: Optional[TestCaseRepositoryPort] = None
+    _llm_response_cache: Optional[LLMResponseCache] = None
+    _openai_client: Optional[AsyncOpenAI] = None
+    _llm_scheduler: Optional[LLMScheduler] = None
+    _llm_retrier: Optional[Retrier] = None
+    _statement_compactor: Optional[StatementCompactor] = None
+    _usage_tracker: Optional[UsageTracker] = None
+    _span_exporter: Optional[SpanExporter] = None
+    _cassette_store: Optional[CassetteStore] = None
+    _test_case_service: Optional[TestCaseService] = None
+    _explanation_service: Optional[ExplanationService] = None
+    _job_queue: Optional[TestCaseJobQueue] = None
+
+    @classmethod
+    def get_http_client(cls) -> PooledAsyncHttpClient:
+        if cls._http_client is None:
+            cls._http_client = PooledAsyncHttpClient(HttpClientSettings.from_env())
+        return cls._http_client
+
+    @classmethod
+    def get_problem_details_port(cls) -> CachingGetProblemDetailsAdapter:
+        """Returns the process-wide cached problem fetcher shared by every feature."""
+        if cls._problem_details_port is None:
+            upstream: GetProblemDetailsPort = AlfaLCGetProblemDetailsAdapter(http_client=cls.get_http_client())
+            catalog = cls.get_problem_catalog()
+            if catalog is not None:
+                upstream = SqliteCatalogGetProblemDetailsAdapter(catalog=catalog, fallback=upstream)
+            cls._problem_details_port = CachingGetProblemDetailsAdapter(
+                delegate=upstream,
+                cache=ProblemDetailsCache(ProblemCacheSettings.from_env()),
+            )
+            port = cls._problem_details_port
+            CACHE_HIT_RATIO.labels("problem_details").set_function(lambda: port.stats().hit_ratio)
+        return cls._problem_details_port
+
+    @classmethod
+    def get_problem_catalog(cls) -> Optional[SqliteProblemCatalog]:
+        settings = ProblemCatalogSettings.from_env()
+        if cls._problem_catalog is None and settings.enabled:
+            cls._problem_catalog = SqliteProblemCatalog.open(settings.path)
+        return cls._problem_catalog
+
+    @classmethod
+    def get_test_case_repository(cls) -> TestCaseRepositoryPort:
+        if cls._test_case_repository is None:
+            settings = TestCasePoolSettings.from_env()
+            cls._test_case_repository = (
+                SqliteTestCaseRepository.open(settings.path) if settings.enabled else NullTestCaseRepository()
+            )
+        return cls._test_case_repository
+
+    @classmethod
+    def get_llm_response_cache(cls) -> Optional[LLMResponseCache]:
+        settings = LLMCacheSettings.from_env()
+        if cls._llm_response_cache is None and settings.backend != "none":
+            if settings.backend == "memory":
+                cls._llm_response_cache = InMemoryLLMResponseCache(settings.max_entries, settings.ttl_seconds)
+            else:
+                cls._llm_response_cache = SqliteLLMResponseCache.open(
+                    settings.path, settings.max_entries, settings.ttl_seconds
                 )
+            cache = cls._llm_response_cache
+            CACHE_HIT_RATIO.labels("llm_response").set_function(lambda: cache.stats().hit_ratio)
+        return cls._llm_response_cache
+
+    @classmethod
+    def get_openai_client(cls) -> AsyncOpenAI:
+        if cls._openai_client is None:
+            # Retries are done by the adapters' Retrier, under the request deadline.
+            cls._openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), max_retries=0)
+        return cls._openai_client
+
+    @classmethod
+    def get_llm_scheduler(cls) -> LLMScheduler:
+        """Returns the rate-limit scheduler every OpenAI adapter goes through."""
+        if cls._llm_scheduler is None:
+            settings = LLMSchedulerSettings.from_env()
+            cls._llm_scheduler = (
+                LLMScheduler(settings.requests_per_minute, settings.tokens_per_minute, settings.max_queue)
+                if settings.enabled else NullLLMScheduler()
             )
+        return cls._llm_scheduler
+
+    @classmethod
+    def get_llm_retrier(cls) -> Retrier:
+        if cls._llm_retrier is None:
+            settings = LLMRetrySettings.from_env()
+            cls._llm_retrier = Retrier(RetryPolicy(
+                max_attempts=settings.max_attempts,
+                base_delay=settings.base_delay,
+                max_delay=settings.max_delay,
+                attempt_timeout=settings.attempt_timeout,
+            ))
+        return cls._llm_retrier
+
+    @classmethod
+    def get_statement_compactor(cls) -> StatementCompactor:
+        """Returns the per-slug compact statement store shared by both prompts."""
+        if cls._statement_compactor is None:
+            cls._statement_compactor = StatementCompactor()
+        return cls._statement_compactor
+
+    @classmethod
+    def get_usage_tracker(cls) -> UsageTracker:
+        """Returns the token/cost totals every LLM adapter reports to."""
+        if cls._usage_tracker is None:
+            cls._usage_tracker = UsageTracker()
+        return cls._usage_tracker
+
+    @classmethod
+    def get_span_exporter(cls) -> Optional[SpanExporter]:
+        """Creates the configured span exporter and installs it for every span in the process."""
+        settings = TracingSettings.from_env()
+        if cls._span_exporter is None and settings.exporter != "none":
+            if settings.exporter == "memory":
+                cls._span_exporter = InMemorySpanCollector(settings.max_spans)
+            else:
+                cls._span_exporter = JsonlSpanExporter(settings.path)
+            set_span_exporter(cls._span_exporter)
+        return cls._span_exporter
+
+    @classmethod
+    def get_cassette_store(cls) -> CassetteStore:
+        if cls._cassette_store is None:
+            cls._cassette_store = CassetteStore.open(LLMModeSettings.from_env().cassette_path)
+        return cls._cassette_store
+
+    @classmethod
+    def create_llm_port(
+        cls,
+        spec: LLMModelSpec,
+        live: Callable[[LLMModelSpec], BaseOpenAIAdapter],
+    ) -> Union[BaseOpenAIAdapter, CassetteLLMAdapter]:
+        """Returns the OpenAI adapter `live` builds from `spec`, or a cassette adapter recording or replaying it (LLM_MODE).
+
+        Replay keys come from `spec` alone, so the live adapter has to match it exactly.
+        """
+        settings = LLMModeSettings.from_env()
+        if settings.mode == "replay":
+            return CassetteLLMAdapter(
+                cls.get_cassette_store(),
+                spec.model_name,
+                spec.generation_params,
+                latency_scale=settings.replay_latency_scale,
+            )
+        adapter = live(spec)
+        if adapter.spec != spec:
+            raise ValueError(f"LLM adapter was built as {adapter.spec}, expected {spec}")
+        if settings.mode == "record":
+            return CassetteLLMAdapter.recording(cls.get_cassette_store(), adapter)
+        return adapter
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Releases the shared resources; called from the application lifespan."""
+        if cls._job_queue is not None:
+            await cls._job_queue.stop()
+            if isinstance(cls._job_queue.repository, SqliteTestCaseJobRepository):
+                cls._job_queue.repository.close()
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+        if cls._problem_catalog is not None:
+            cls._problem_catalog.close()
+        if isinstance(cls._test_case_repository, SqliteTestCaseRepository):
+            cls._test_case_repository.close()
+        if isinstance(cls._llm_response_cache, SqliteLLMResponseCache):
+            cls._llm_response_cache.close()
+        if cls._openai_client is not None:
+            await cls._openai_client.close()
+        if cls._cassette_store is not None:
+            cls._cassette_store.close()
+        if isinstance(cls._span_exporter, JsonlSpanExporter):
+            set_span_exporter(None)
+            cls._span_exporter.close()
+
+    @classmethod
+    def get_test_case_service(cls) -> TestCaseService:
+        """Returns the process-wide test case service shared by the UI and the REST API."""
+        if cls._test_case_service is None:
+            cls._test_case_service = cls.create_test_case_service()
+        return cls._test_case_service
+
+    @classmethod
+    def get_explanation_service(cls) -> ExplanationService:
+        """Returns the process-wide explanation service shared by the UI and the REST API."""
+        if cls._explanation_service is None:
+            cls._explanation_service = cls.create_explanation_service()
+        return cls._explanation_service
+
+    @classmethod
+    def get_job_queue(cls) -> TestCaseJobQueue:
+        """Returns the background test case job queue; its workers are started by the application lifespan."""
+        if cls._job_queue is None:
+            settings = JobQueueSettings.from_env()
+            cls._job_queue = TestCaseJobQueue(
+                service=cls.get_test_case_service(),
+                repository=SqliteTestCaseJobRepository.open(settings.path),
+                workers=settings.workers,
+                max_queued=settings.max_queued,
+                retention_seconds=settings.retention_seconds,
+            )
+            queue = cls._job_queue
+            JOB_QUEUE_DEPTH.set_function(lambda: queue.depth)
+        return cls._job_queue
+
+    @classmethod
+    def create_test_case_service(cls) -> TestCaseService:
+        generation_settings = TestCaseGenerationSettings.from_env()
+        return TestCaseService(
+            slug_extractor=MeteredQuestionSlugExtractorAdapter(SimpleQuestionSlugExtractorAdapter(), "test_cases"),
+            problem_fetcher=MeteredGetProblemDetailsAdapter(cls.get_problem_details_port(), "test_cases"),
+            test_case_generator=TestCaseGenerator(
+                llm_port=cls.create_llm_port(cls.TEST_CASE_LLM, lambda spec: OpenAITemperatureConfigurableAdapter(
+                    client=cls.get_openai_client(),
+                    model_name=spec.model_name,
+                    temperature=spec.generation_params["temperature"],
+                    scheduler=cls.get_llm_scheduler(),
+                    expected_output_tokens=LLMSchedulerSettings.from_env().expected_output_tokens,
+                    retrier=cls.get_llm_retrier(),
+                    usage_tracker=cls.get_usage_tracker()
+                )),
+                chunk_size=generation_settings.chunk_size,
+                max_concurrency=generation_settings.max_concurrency,
+                compactor=cls.get_statement_compactor()
+            ),
+            test_case_repository=cls.get_test_case_repository(),
+            local_generator=LocalTestCaseGenerator(),
+            sources=cls.get_test_case_sources(),
+            validator=TestCaseValidator(),
+            deduplicator=TestCaseDeduplicator(),
+            deadline_seconds=LLMRetrySettings.from_env().test_case_deadline
         )
 
     @staticmethod
-    def create_explanation_service() -> ExplanationService:
+    def get_test_case_sources() -> Dict[Difficulty, TestCaseSource]:
+        settings = TestCaseSourceSettings.from_env()
+        return {
+            Difficulty.EASY: TestCaseSource(settings.easy),
+            Difficulty.MEDIUM: TestCaseSource(settings.medium),
+            Difficulty.HARD: TestCaseSource(settings.hard),
+        }
+
+    @classmethod
+    def create_explanation_service(cls) -> ExplanationService:
         return ExplanationService(
-            question_slug_extractor=SimpleQuestionSlugExtractorAdapter(),
-            problem_details_port=AlfaLCGetProblemDetailsAdapter(),
+            question_slug_extractor=MeteredQuestionSlugExtractorAdapter(SimpleQuestionSlugExtractorAdapter(), "explain"),
+            problem_details_port=MeteredGetProblemDetailsAdapter(cls.get_problem_details_port(), "explain"),
             problem_statement_explainer=ProblemStatementExplainer(
-                llm_port=OpenAIAdapter(
-                    client=AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")),
-                    model_name="o3-mini"
-                )
-            )
-        )
\ No newline at end of file
+                llm_port=cls.create_llm_port(cls.EXPLAIN_LLM, lambda spec: OpenAIAdapter(
+                    client=cls.get_openai_client(),
+                    model_name=spec.model_name,
+                    response_cache=cls.get_llm_response_cache(),
+                    scheduler=cls.get_llm_scheduler(),
+                    expected_output_tokens=LLMSchedulerSettings.from_env().expected_output_tokens,
+                    retrier=cls.get_llm_retrier(),
+                    usage_tracker=cls.get_usage_tracker()
+                )),
+                compactor=cls.get_statement_compactor()
+            ),
+            deadline_seconds=LLMRetrySettings.from_env().explain_deadline
+        )
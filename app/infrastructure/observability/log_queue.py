@@ -0,0 +1,90 @@
+import copy
+import logging
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from app.infrastructure.observability.metrics import REGISTRY
+
+try:
+    import orjson
+
+    def _dumps(document: Dict[str, Any]) -> str:
+        return orjson.dumps(document, default=str).decode("utf-8")
+except ImportError:  # orjson is optional; the standard encoder is slower but equivalent
+    import json
+
+    def _dumps(document: Dict[str, Any]) -> str:
+        return json.dumps(document, default=str, ensure_ascii=False, separators=(",", ":"))
+
+LOG_RECORDS_DROPPED = REGISTRY.counter("log_records_dropped", "Log records dropped because the log queue was full.")
+LOG_RECORDS_SAMPLED_OUT = REGISTRY.counter("log_records_sampled_out", "Log records skipped by sampling, per level.", ("level",))
+
+_FIELDS = ("context", "trace_id", "span_id")
+
+
+class FastJsonFormatter(logging.Formatter):
+    """One JSON object per record with the same keys the python-json-logger setup produced."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        document: Dict[str, Any] = {
+            "asctime": self.formatTime(record),
+            "name": record.name,
+            "levelname": record.levelname,
+            "message": record.getMessage(),
+        }
+        for name in _FIELDS:
+            document[name] = getattr(record, name, None)
+        if record.exc_info:
+            document["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            document["stack_info"] = self.formatStack(record.stack_info)
+        return _dumps(document)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Hands records to a QueueListener thread; when the queue is full the record is dropped and counted.
+
+    Only the message is resolved on the calling thread; tracebacks and JSON are rendered by the listener.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        super().__init__(queue.Queue(maxsize=maxsize))
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BoundedQueueListener(QueueListener):
+    """QueueListener whose stop sentinel waits for room instead of failing on a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps each record with the probability configured for its level (1.0 when the level is not listed)."""
+
+    def __init__(self, rates: Mapping[int, float], rng: Callable[[], float] = random.random):
+        super().__init__()
+        self.rates = {level: rate for level, rate in rates.items() if rate < 1.0}
+        self._rng = rng
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate: Optional[float] = self.rates.get(record.levelno)
+        if rate is None or self._rng() < rate:
+            return True
+        LOG_RECORDS_SAMPLED_OUT.labels(record.levelname).inc()
+        return False
@@ -0,0 +1,274 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format (version 0.0.4).
+
+Children are resolved once per label set and cached, so recording is a dict lookup plus an
+integer/float update; histograms locate their bucket with `bisect`. Updates rely on the GIL
+and take no lock: under heavy threading a concurrent increment can be lost, which is
+acceptable for monitoring.
+"""
+
+import math
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.domain.shared.exception.base import root_application_cause
+
+PREFIX = "leetcode_buddy_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+_Labels = Tuple[str, ...]
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value", "function")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Reads the value from `function` at scrape time instead of storing it."""
+        self.function = function
+
+    def get(self) -> float:
+        return self.function() if self.function is not None else self.value
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def time(self) -> "Timer":
+        return Timer(self)
+
+
+class Timer:
+    """Observes the seconds spent in a `with` block into a histogram child."""
+    __slots__ = ("_child", "_started")
+
+    def __init__(self, child: _HistogramChild):
+        self._child = child
+        self._started = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._child.observe(time.perf_counter() - self._started)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[_Labels, object] = {}
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> Iterable[Tuple[str, _Labels, Sequence[Tuple[str, str]], float]]:
+        raise NotImplementedError
+
+    def render(self, lines: List[str]) -> None:
+        lines.append(f"# HELP {self.name} {_escape_help(self.documentation)}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for suffix, values, extra, value in self._samples():
+            pairs = [f'{name}="{_escape_label(label)}"' for name, label in zip(self.labelnames, values)]
+            pairs += [f'{name}="{label}"' for name, label in extra]
+            labels = "{" + ",".join(pairs) + "}" if pairs else ""
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield "_total", values, (), child.value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.labels().set_function(function)
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield "", values, (), child.get()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(bound for bound in buckets if bound != math.inf))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.bounds)
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.bounds + (math.inf,), child.counts):
+                cumulative += count
+                yield "_bucket", values, (("le", _format_value(bound)),), cumulative
+            yield "_sum", values, (), child.sum
+            yield "_count", values, (), cumulative
+
+
+class MetricsRegistry:
+    """Named metrics; asking for an existing name returns the metric already registered."""
+
+    def __init__(self, prefix: str = PREFIX):
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.__register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.__register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.__register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            metric.render(lines)
+        return "\n".join(lines) + "\n"
+
+    def __register(self, kind, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        full_name = self.prefix + name
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = self._metrics[full_name] = kind(full_name, documentation, labelnames, **kwargs)
+        elif not isinstance(metric, kind) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {full_name} is already registered as a different metric")
+        return metric
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_DURATION = REGISTRY.histogram(
+    "stage_duration_seconds",
+    "Time spent per request stage (slug_extraction, problem_fetch, llm_call, render) and feature.",
+    ("stage", "feature"),
+)
+LLM_IN_FLIGHT = REGISTRY.gauge("llm_in_flight", "LLM calls currently running, per model.", ("model",))
+LLM_CALLS = REGISTRY.counter("llm_calls", "Finished LLM calls per feature, model and outcome.", ("feature", "model", "outcome"))
+ERRORS = REGISTRY.counter("errors", "Errors surfaced to users per feature and exception class.", ("feature", "exception"))
+CACHE_HIT_RATIO = REGISTRY.gauge("cache_hit_ratio", "Hit ratio since start per cache.", ("cache",))
+JOB_QUEUE_DEPTH = REGISTRY.gauge("job_queue_depth", "Background test case jobs waiting for a worker.")
+
+
+def stage_timer(stage: str, feature: str) -> Timer:
+    """`with stage_timer("problem_fetch", "explain"): ...` records the block into STAGE_DURATION."""
+    return STAGE_DURATION.labels(stage, feature).time()
+
+
+class LLMCallTimer:
+    """Counts an LLM call as in flight for the `with` block and records its duration and outcome."""
+    __slots__ = ("_feature", "_model", "_timer")
+
+    def __init__(self, feature: Optional[str], model: str):
+        self._feature = feature or "unknown"
+        self._model = model
+        self._timer = stage_timer("llm_call", self._feature)
+
+    def __enter__(self) -> "LLMCallTimer":
+        LLM_IN_FLIGHT.labels(self._model).inc()
+        self._timer.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._timer.__exit__(exc_type, exc_value, traceback)
+        LLM_IN_FLIGHT.labels(self._model).dec()
+        outcome = "ok" if exc_type is None else exc_type.__name__
+        LLM_CALLS.labels(self._feature, self._model, outcome).inc()
+
+
+def record_error(feature: str, error: BaseException) -> None:
+    """Counts the error under its domain exception class, unwrapping service-level wrappers."""
+    ERRORS.labels(feature, type(root_application_cause(error) or error).__name__).inc()
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
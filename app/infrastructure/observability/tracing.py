@@ -0,0 +1,103 @@
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from app.application.shared.tracing import Span, current_span
+
+
+def span_to_dict(span: Span) -> Dict[str, Any]:
+    return {
+        "trace_id": span.trace_id,
+        "span_id": span.span_id,
+        "parent_id": span.parent_id,
+        "name": span.name,
+        "start_ns": span.start_ns,
+        "end_ns": span.end_ns,
+        "duration_ms": round(span.duration_ms, 3),
+        "attributes": span.attributes,
+        "error": span.error,
+    }
+
+
+class JsonlSpanExporter:
+    """Appends one JSON object per finished span; the file is flushed whenever a trace's root span ends."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        self._file.write(json.dumps(span_to_dict(span), default=str, separators=(",", ":")) + "\n")
+        if span.parent_id is None:
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class InMemorySpanCollector:
+    """Keeps the most recent spans and returns them as an OTLP/JSON `ExportTraceServiceRequest`."""
+
+    def __init__(self, max_spans: int = 10_000, service_name: str = "leetcode-help-buddy"):
+        self.service_name = service_name
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        return [span for span in self._spans if trace_id is None or span.trace_id == trace_id]
+
+    def to_otlp(self, trace_id: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "app"},
+                    "spans": [_otlp_span(span) for span in self.spans(trace_id)],
+                }],
+            }]
+        }
+
+
+class TraceContextFilter(logging.Filter):
+    """Adds `trace_id` and `span_id` of the active span (or null) to every log record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        active = current_span()
+        record.trace_id = active.trace_id if active is not None else None
+        record.span_id = active.span_id if active is not None else None
+        return True
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    otlp = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_id is not None:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
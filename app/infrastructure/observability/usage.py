@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+from app.domain.ports.llm.models import LLMRequest, LLMUsage
+
+UNATTRIBUTED = "unknown"
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """USD per million tokens."""
+    prompt: float
+    cached_prompt: float
+    completion: float
+
+
+DEFAULT_PRICING: Dict[str, ModelPricing] = {
+    "gpt-4o-mini": ModelPricing(prompt=0.15, cached_prompt=0.075, completion=0.60),
+    "gpt-4o": ModelPricing(prompt=2.50, cached_prompt=1.25, completion=10.00),
+    "o3-mini": ModelPricing(prompt=1.10, cached_prompt=0.55, completion=4.40),
+}
+
+
+def usage_cost(
+    model_name: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0,
+    pricing: Optional[Mapping[str, ModelPricing]] = None,
+) -> float:
+    """Cost of a call in USD; 0 for models without a known price."""
+    price = (pricing if pricing is not None else DEFAULT_PRICING).get(model_name)
+    if price is None:
+        return 0.0
+    uncached = max(prompt_tokens - cached_tokens, 0)
+    return (uncached * price.prompt + cached_tokens * price.cached_prompt + completion_tokens * price.completion) / 1e6
+
+
+class _Totals:
+    __slots__ = ("calls", "cache_hits", "prompt_tokens", "completion_tokens", "cached_tokens", "cost_usd",
+                 "latency_ms", "max_latency_ms")
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cached_tokens = 0
+        self.cost_usd = 0.0
+        self.latency_ms = 0.0
+        self.max_latency_ms = 0.0
+
+    def add(self, usage: LLMUsage) -> None:
+        self.calls += 1
+        self.cache_hits += usage.cache_hit
+        self.prompt_tokens += usage.prompt_tokens
+        self.completion_tokens += usage.completion_tokens
+        self.cached_tokens += usage.cached_tokens
+        self.cost_usd += usage.cost_usd
+        self.latency_ms += usage.latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, usage.latency_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "avg_latency_ms": round(self.latency_ms / self.calls, 1) if self.calls else 0.0,
+            "max_latency_ms": round(self.max_latency_ms, 1),
+        }
+
+
+class UsageTracker:
+    """In-process token, cost and latency totals per feature, per model and per slug.
+
+    The number of slugs tracked is bounded; the least recently used ones are dropped first
+    (they still count towards the overall and per-feature/model totals).
+    """
+
+    def __init__(self, max_slugs: int = 1000):
+        self.max_slugs = max_slugs
+        self._total = _Totals()
+        self._by_feature: Dict[str, _Totals] = {}
+        self._by_model: Dict[str, _Totals] = {}
+        self._by_slug: "OrderedDict[str, _Totals]" = OrderedDict()
+
+    def record(self, request: LLMRequest, model_name: str, usage: LLMUsage) -> None:
+        self._total.add(usage)
+        self._by_feature.setdefault(request.feature or UNATTRIBUTED, _Totals()).add(usage)
+        self._by_model.setdefault(model_name, _Totals()).add(usage)
+        slug = request.question_slug or UNATTRIBUTED
+        totals = self._by_slug.get(slug)
+        if totals is None:
+            totals = self._by_slug[slug] = _Totals()
+            if len(self._by_slug) > self.max_slugs:
+                self._by_slug.popitem(last=False)
+        else:
+            self._by_slug.move_to_end(slug)
+        totals.add(usage)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-ready totals; slugs are listed most expensive first."""
+        by_slug = sorted(self._by_slug.items(), key=lambda item: item[1].cost_usd, reverse=True)
+        return {
+            "total": self._total.as_dict(),
+            "by_feature": {name: totals.as_dict() for name, totals in self._by_feature.items()},
+            "by_model": {name: totals.as_dict() for name, totals in self._by_model.items()},
+            "by_slug": {name: totals.as_dict() for name, totals in by_slug},
+        }
+
+
+class NullUsageTracker(UsageTracker):
+    """Tracker that records nothing."""
+
+    def record(self, request: LLMRequest, model_name: str, usage: LLMUsage) -> None:
+        pass
@@ -0,0 +1,48 @@
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class SqliteDatabase:
+    """A single SQLite connection guarded by a lock.
+
+    Blocking statements are executed in a worker thread through `run`, so callers on the
+    event loop never wait on disk I/O.
+    """
+
+    def __init__(self, path: str, schema: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._schema = schema
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def run_sync(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        with self._lock:
+            connection = self.__connect()
+            with connection:
+                return fn(connection)
+
+    async def run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        return await asyncio.to_thread(self.run_sync, fn)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            if self._schema:
+                connection.executescript(self._schema)
+            self._connection = connection
+        return self._connection
@@ -0,0 +1,41 @@
+from typing import AsyncIterator
+
+from app.application.shared.batch import map_bounded
+from app.application.shared.priority import llm_priority
+from app.application.shared.tracing import trace
+from app.domain.ports.llm.models import LLMPriority
+from app.infrastructure.factories.service_factory import ServiceFactory
+from app.infrastructure.rest.errors import error_response
+from app.infrastructure.rest.models import (
+    BatchFeature,
+    BatchItemResult,
+    BatchRequest,
+    ExplainResponse,
+    GenerateTestsResponse,
+)
+
+
+async def run_batch(body: BatchRequest, concurrency: int) -> AsyncIterator[str]:
+    """Yields one NDJSON line per item in completion order; failed items carry their error inline."""
+
+    async def run_item(index: int, user_input: str) -> BatchItemResult:
+        feature = body.feature.value
+        with trace(f"batch.{feature}", index=index), llm_priority(LLMPriority.BATCH):
+            try:
+                if body.feature is BatchFeature.EXPLAIN:
+                    result = ExplainResponse.of(
+                        await ServiceFactory.get_explanation_service().explain(user_input, body.mode)
+                    )
+                else:
+                    result = GenerateTestsResponse.of(
+                        await ServiceFactory.get_test_case_service().generate_test_cases(
+                            user_input, body.difficulty, body.count
+                        )
+                    )
+            except Exception as e:
+                status_code, error = error_response(feature, e)
+                return BatchItemResult(index=index, input=user_input, status=status_code, error=error)
+        return BatchItemResult(index=index, input=user_input, status=200, result=result)
+
+    async for _, line in map_bounded(body.items, run_item, concurrency):
+        yield line.model_dump_json(by_alias=True, exclude_none=True) + "\n"
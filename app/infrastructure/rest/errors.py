@@ -0,0 +1,53 @@
+import logging
+from typing import Tuple
+
+from app.domain.shared.exception.api.api_exception import (
+    LeetCodeApiError,
+    LeetCodeApiRequestError,
+    LeetCodeProblemNotFoundError,
+)
+from app.domain.shared.exception.base import BaseApplicationException, root_application_cause
+from app.domain.shared.exception.llm.llm_exception import (
+    LLMCapacityExceededException,
+    LLMDeadlineExceededException,
+    LLMException,
+)
+from app.domain.shared.exception.testcase.testcase_exception import TestCaseException, TestCaseJobQueueFullException
+from app.infrastructure.observability.metrics import record_error
+from app.infrastructure.rest.models import ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+
+def http_status(error: BaseApplicationException) -> int:
+    if isinstance(error, LeetCodeProblemNotFoundError):
+        return 404
+    if isinstance(error, LeetCodeApiRequestError) and error.context.get("status_code") == 404:
+        return 404
+    if isinstance(error, (LLMCapacityExceededException, TestCaseJobQueueFullException)):
+        return 503
+    if isinstance(error, LLMDeadlineExceededException):
+        return 504
+    if isinstance(error, (LeetCodeApiError, LLMException, TestCaseException)):
+        return 502
+    return 500
+
+
+def error_response(feature: str, error: BaseException) -> Tuple[int, ErrorResponse]:
+    """Records and logs a failed request and returns its status code and body.
+
+    The body and status describe the innermost application exception, so a queue-full or deadline
+    error wrapped by a service (e.g. in TestCaseNotGeneratedException) still maps to 503/504.
+    """
+    record_error(feature, error)
+    cause = root_application_cause(error)
+    if cause is None:
+        logger.critical("An unexpected error occurred: %s", error, exc_info=error)
+        return 500, ErrorResponse(error=type(error).__name__, message="Internal server error")
+    logger.error(
+        "An application error occurred: %s",
+        cause,
+        exc_info=error,
+        extra={"context": cause.context},
+    )
+    return http_status(cause), ErrorResponse(error=type(cause).__name__, message=cause.message, context=cause.context)
@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Annotated, Any, List, Optional, Union
+
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, model_validator
+from pydantic.alias_generators import to_camel
+
+from app.domain.explain.models.models import ExplainationMode, ExplainProblemStatementResponse
+from app.domain.testcase.models.models import Difficulty, JobStatus, TestCaseGenerationResponse, TestCaseJob
+from app.infrastructure.config.config import TestCaseGenerationSettings
+
+
+def _lower(value: Any) -> Any:
+    return value.lower() if isinstance(value, str) else value
+
+
+def _upper(value: Any) -> Any:
+    return value.upper() if isinstance(value, str) else value
+
+
+def _test_case_count(value: int) -> int:
+    max_test_cases = TestCaseGenerationSettings.from_env().max_test_cases
+    if value > max_test_cases:
+        raise ValueError(f"count must be at most {max_test_cases}")
+    return value
+
+
+# Enum fields accept any letter case ("medium", "MEDIUM").
+ModeField = Annotated[ExplainationMode, BeforeValidator(_lower)]
+DifficultyField = Annotated[Difficulty, BeforeValidator(_upper)]
+TestCaseCountField = Annotated[int, AfterValidator(_test_case_count)]
+
+
+class ApiModel(BaseModel):
+    """camelCase on the wire (as in the v1 spec), snake_case in Python; both spellings are accepted."""
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+class ExplainRequest(ApiModel):
+    statement_text: str = Field(..., min_length=1, description="Problem slug, title or pasted statement")
+    mode: ModeField = ExplainationMode.BEGINNER
+
+
+class ExplainResponse(ApiModel):
+    question_slug: str
+    explanation: str
+
+    @classmethod
+    def of(cls, response: ExplainProblemStatementResponse) -> "ExplainResponse":
+        return cls(question_slug=response.question_slug, explanation=response.explaination)
+
+
+class GenerateTestsRequest(ApiModel):
+    statement_text: str = Field(..., min_length=1, description="Problem slug, title or pasted statement")
+    difficulty: DifficultyField = Difficulty.EASY
+    count: TestCaseCountField = Field(default=5, ge=1, description="Number of test cases to generate")
+
+
+class GeneratedTestCase(ApiModel):
+    input: str
+    expected_result: str
+    is_edge_case: bool = False
+    tags: List[str] = Field(default_factory=list)
+
+
+class GenerateTestsResponse(ApiModel):
+    question_slug: str
+    cases: List[GeneratedTestCase]
+
+    @classmethod
+    def of(cls, response: TestCaseGenerationResponse) -> "GenerateTestsResponse":
+        return cls(
+            question_slug=response.question_slug,
+            cases=[
+                GeneratedTestCase(
+                    input=test_case.test_case_content,
+                    expected_result=test_case.expected_result,
+                    is_edge_case=test_case.is_edge_case,
+                    tags=test_case.tags,
+                )
+                for test_case in response.test_cases.test_cases
+            ],
+        )
+
+
+class ErrorResponse(ApiModel):
+    error: str
+    message: str
+    context: dict = Field(default_factory=dict)
+
+
+class BatchFeature(Enum):
+    EXPLAIN = "explain"
+    TEST_CASES = "test_cases"
+
+
+class BatchRequest(ApiModel):
+    items: List[str] = Field(..., min_length=1, description="Problem slugs, titles or statements")
+    feature: Annotated[BatchFeature, BeforeValidator(_lower)]
+    difficulty: DifficultyField = Difficulty.EASY
+    count: int = Field(default=5, ge=1, description="Test cases per item")
+    mode: ModeField = ExplainationMode.BEGINNER
+    concurrency: Optional[int] = Field(default=None, ge=1, description="Items processed at once")
+
+    @model_validator(mode="after")
+    def _check_count(self) -> "BatchRequest":
+        # `count` only matters, and is only limited, when the batch generates test cases.
+        if self.feature is BatchFeature.TEST_CASES:
+            _test_case_count(self.count)
+        return self
+
+
+class BatchItemResult(ApiModel):
+    """One NDJSON line: `result` when `status` is 200, otherwise `error`."""
+    index: int
+    input: str
+    status: int
+    result: Optional[Union[ExplainResponse, GenerateTestsResponse]] = None
+    error: Optional[ErrorResponse] = None
+
+
+class JobResponse(ApiModel):
+    """State of a background job; `position` is its place in the queue while it waits."""
+    job_id: str
+    status: JobStatus
+    position: Optional[int] = None
+    attempts: int = 0
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[GenerateTestsResponse] = None
+    error: Optional[ErrorResponse] = None
+
+    @classmethod
+    def of(cls, job: TestCaseJob, position: Optional[int] = None) -> "JobResponse":
+        return cls(
+            job_id=job.job_id,
+            status=job.status,
+            position=position,
+            attempts=job.attempts,
+            created_at=_timestamp(job.created_at),
+            started_at=_timestamp(job.started_at),
+            finished_at=_timestamp(job.finished_at),
+            result=GenerateTestsResponse.of(job.result) if job.result is not None else None,
+            error=ErrorResponse(**job.error) if job.error is not None else None,
+        )
+
+
+def _timestamp(seconds: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(seconds, timezone.utc) if seconds is not None else None
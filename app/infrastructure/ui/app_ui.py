@@ -1,15 +1,19 @@
 import asyncio
 import json
 import logging
+import time
 import traceback
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import gradio as gr
 
-from app.domain.testcase.models.models import Difficulty, difficulty_description
+from app.domain.testcase.models.models import Difficulty, JobStatus, TestCaseGenerationResponse, difficulty_description
 from app.domain.explain.models.models import ExplainationMode
+from app.infrastructure.config.config import TestCaseGenerationSettings
 from app.infrastructure.factories.service_factory import ServiceFactory
-from app.domain.shared.exception.base import BaseApplicationException
+from app.application.shared.tracing import span, trace
+from app.infrastructure.observability.metrics import record_error, stage_timer
+from app.domain.shared.exception.base import BaseApplicationException, root_application_cause
 
 logger = logging.getLogger(__name__)
 
@@ -17,86 +21,144 @@ logger = logging.getLogger(__name__)
 def create_gradio_interface() -> gr.Blocks:
     
     # Initialize the service
-    test_case_service = ServiceFactory.create_test_case_service()
-    explanation_service = ServiceFactory.create_explanation_service()
+    test_case_service = ServiceFactory.get_test_case_service()
+    explanation_service = ServiceFactory.get_explanation_service()
+    job_queue = ServiceFactory.get_job_queue()
+
+    def render_test_cases(response: TestCaseGenerationResponse) -> str:
+        parts = [f"## ✅ Test Cases Generated for: {response.question_slug}\n\n"]
+
+        for i, test_case in enumerate(response.test_cases.test_cases, 1):
+            edge_indicator = "🔥 **Edge Case**" if test_case.is_edge_case else "📝 **Test Case**"
+            tags = " ".join(f"`[{tag}]`" for tag in test_case.tags)
+            parts.append(
+                f"### {edge_indicator} #{i} {tags}\n"
+                f"**Input:**\n```\n{test_case.test_case_content}\n```\n"
+                f"**Expected Output:** `{test_case.expected_result or '—'}`\n\n"
+            )
+        return "".join(parts)
     
     async def handle_generate_test_cases(
         problem_text: str, 
-        difficulty_str: str
+        difficulty_str: str,
+        num_test_cases: int = 1
     ) -> str:
         """Handle test case generation with comprehensive error handling."""
-        try:
-            if not problem_text or problem_text.strip() == "":
-                return "❌ **Error**: Please enter a problem statement."
-            
+        with trace("ui.generate_test_cases"):
             try:
-                difficulty = Difficulty(difficulty_str)
-            except ValueError:
-                return f"❌ **Error**: Invalid difficulty level: {difficulty_str}"
-
-            response = await test_case_service.generate_test_cases(
-                user_input=problem_text,
-                difficulty=difficulty,
-                num_test_cases=1
-            )
+                if not problem_text or problem_text.strip() == "":
+                    return "❌ **Error**: Please enter a problem statement."
             
-            result = f"## ✅ Test Cases Generated for: {response.question_slug}\n\n"
+                try:
+                    difficulty = Difficulty(difficulty_str)
+                except ValueError:
+                    return f"❌ **Error**: Invalid difficulty level: {difficulty_str}"
+
+                response = await test_case_service.generate_test_cases(
+                    user_input=problem_text,
+                    difficulty=difficulty,
+                    num_test_cases=int(num_test_cases)
+                )
             
-            for i, test_case in enumerate(response.test_cases.test_cases, 1):
-                edge_indicator = "🔥 **Edge Case**" if test_case.is_edge_case else "📝 **Test Case**"
-                result += f"### {edge_indicator} #{i}\n"
-                result += f"**Input:** `{test_case.test_case_content}`\n"
-                result += f"**Expected Output:** `{test_case.expected_result}`\n\n"
+                with stage_timer("render", "test_cases"), span("ui.render"):
+                    result = render_test_cases(response)
             
-            return result
+                return result
             
-        except BaseApplicationException as e:
-            logger.error(
-                "An application error occurred: %s",
-                e,
-                exc_info=True,
-                extra={"context": e.context},
-            )
-            return f"❌ **Error**: {str(e)}"
-        except Exception as e:
-            logger.critical(
-                "An unexpected error occurred: %s", e, exc_info=True
-            )
-            error_details = traceback.format_exc()
-            return f"❌ **Unexpected Error**: {str(e)}\n\n```\n{error_details}\n```"
+            except BaseApplicationException as e:
+                record_error("test_cases", e)
+                logger.error(
+                    "An application error occurred: %s",
+                    e,
+                    exc_info=True,
+                    extra={"context": e.context},
+                )
+                return f"❌ **Error**: {str(e)}"
+            except Exception as e:
+                record_error("test_cases", e)
+                logger.critical(
+                    "An unexpected error occurred: %s", e, exc_info=True
+                )
+                error_details = traceback.format_exc()
+                return f"❌ **Unexpected Error**: {str(e)}\n\n```\n{error_details}\n```"
     
     async def handle_explain_problem(
         problem_text: str,
         explanation_mode_str: str
-    ) -> str:
+    ) -> AsyncIterator[str]:
         """Handle problem explanation with streaming and comprehensive error handling."""
-        try:
-            if not problem_text or problem_text.strip() == "":
-                return "❌ **Error**: Please enter a problem statement."
-            
+        with trace("ui.explain"):
             try:
-                explanation_mode = ExplainationMode(explanation_mode_str.lower())
-            except ValueError:
-                return f"❌ **Error**: Invalid explanation mode: {explanation_mode_str}"
+                if not problem_text or problem_text.strip() == "":
+                    yield "❌ **Error**: Please enter a problem statement."
+                    return
+            
+                try:
+                    explanation_mode = ExplainationMode(explanation_mode_str.lower())
+                except ValueError:
+                    yield f"❌ **Error**: Invalid explanation mode: {explanation_mode_str}"
+                    return
 
-            response = await explanation_service.explain(problem_text)
-            return response.explaination
+                explanation = ""
+                async for delta in explanation_service.stream_explain(problem_text, explanation_mode):
+                    explanation += delta
+                    yield explanation
             
-        except BaseApplicationException as e:
-            logger.error(
-                "An application error occurred during explanation: %s",
-                e,
-                exc_info=True,
-                extra={"context": e.context},
-            )
-            return f"❌ **Error**: {str(e)}"
-        except Exception as e:
-            logger.critical(
-                "An unexpected error occurred during explanation: %s", e, exc_info=True
-            )
-            error_details = traceback.format_exc()
-            return f"❌ **Unexpected Error**: {str(e)}\n\n```\n{error_details}\n```"
+            except Exception as e:
+                record_error("explain", e)
+                # stream_explain wraps every failure in ExplanationError; report the domain error underneath.
+                cause = root_application_cause(e)
+                if cause is not None:
+                    logger.error(
+                        "An application error occurred during explanation: %s",
+                        cause,
+                        exc_info=True,
+                        extra={"context": cause.context},
+                    )
+                    yield f"❌ **Error**: {str(cause)}"
+                    return
+                logger.critical(
+                    "An unexpected error occurred during explanation: %s", e, exc_info=True
+                )
+                error_details = traceback.format_exc()
+                yield f"❌ **Unexpected Error**: {str(e)}\n\n```\n{error_details}\n```"
     
+    async def handle_submit_job(
+        problem_text: str,
+        difficulty_str: str,
+        num_test_cases: int = 1
+    ) -> tuple[str, str, gr.Timer]:
+        """Queue test case generation in the background and start polling its status."""
+        if not problem_text or problem_text.strip() == "":
+            return "", "❌ **Error**: Please enter a problem statement.", gr.Timer(active=False)
+        try:
+            job = await job_queue.submit(problem_text, Difficulty(difficulty_str), int(num_test_cases))
+        except ValueError:
+            return "", f"❌ **Error**: Invalid difficulty level: {difficulty_str}", gr.Timer(active=False)
+        except BaseApplicationException as e:
+            record_error("test_cases", e)
+            logger.error("Could not submit test case job: %s", e, extra={"context": e.context})
+            return "", f"❌ **Error**: {str(e)}", gr.Timer(active=False)
+        return job.job_id, "⏳ **Queued** — waiting for a worker", gr.Timer(active=True)
+
+    async def handle_poll_job(job_id: str) -> tuple[str, gr.Timer]:
+        """Render a background job's status; polling stops once it has finished."""
+        job_id = (job_id or "").strip()
+        if not job_id:
+            return "", gr.Timer(active=False)
+        job = await job_queue.get(job_id)
+        if job is None:
+            return f"❌ **Error**: Job `{job_id}` not found.", gr.Timer(active=False)
+        if job.status is JobStatus.QUEUED:
+            position = job_queue.position(job_id)
+            waiting = f"position {position + 1} in the queue" if position is not None else "waiting for a worker"
+            return f"⏳ **Queued** — {waiting}", gr.Timer(active=True)
+        if job.status is JobStatus.RUNNING:
+            return f"⚙️ **Running** — {time.time() - (job.started_at or job.created_at):.0f}s elapsed", gr.Timer(active=True)
+        if job.status is JobStatus.FAILED:
+            return f"❌ **Error**: {(job.error or {}).get('message', 'The job failed.')}", gr.Timer(active=False)
+        return render_test_cases(job.result), gr.Timer(active=False)
+
     def handle_clear() -> tuple[str, str]:
         """Clear all inputs and outputs."""
         return "", ""
@@ -193,6 +255,15 @@ def create_gradio_interface() -> gr.Blocks:
                     visible=True
                 )
                 
+                num_test_cases_slider = gr.Slider(
+                    label="Number of Test Cases",
+                    minimum=1,
+                    maximum=TestCaseGenerationSettings.from_env().max_test_cases,
+                    value=5,
+                    step=1,
+                    visible=True
+                )
+
                 # Explanation mode selector
                 explanation_mode_choices = [mode.value.upper() for mode in ExplainationMode]
                 explanation_mode_radio = gr.Radio(
@@ -213,40 +284,82 @@ def create_gradio_interface() -> gr.Blocks:
                             max_lines=20,
                             interactive=False
                         )
+
+                with gr.Column(elem_classes=["results-container"]):
+                    gr.Markdown("### Background Jobs")
+
+                    with gr.Row():
+                        job_id_box = gr.Textbox(
+                            label="Job ID",
+                            placeholder="Run a generation in the background, or paste a job ID and press Enter",
+                            scale=3,
+                        )
+                        submit_job_btn = gr.Button(
+                            "⏳ Run in Background",
+                            size="lg",
+                            scale=1,
+                        )
+                    job_status = gr.Markdown()
+                    job_timer = gr.Timer(2.0, active=False)
         
         # Function to handle operation selection
         def on_operation_change(operation: str):
             if operation == "GENERATE TEST CASES":
-                return gr.update(visible=True), gr.update(visible=False)
+                return gr.update(visible=True), gr.update(visible=True), gr.update(visible=False)
             elif operation == "EXPLAIN PROBLEM":
-                return gr.update(visible=False), gr.update(visible=True)
-            return gr.update(visible=True), gr.update(visible=False)
+                return gr.update(visible=False), gr.update(visible=False), gr.update(visible=True)
+            return gr.update(visible=True), gr.update(visible=True), gr.update(visible=False)
         
         # Wire up event handlers
         options_dropdown.change(
             fn=on_operation_change,
             inputs=[options_dropdown],
-            outputs=[difficulty_radio, explanation_mode_radio]
+            outputs=[difficulty_radio, num_test_cases_slider, explanation_mode_radio]
         )
         
         # Separate click handlers for different operations
         def create_send_handler():
-            async def handler(problem_text: str, operation: str, difficulty: str, explanation_mode: str):
-                """Dispatch to the appropriate async handler and await its result."""
+            async def handler(
+                problem_text: str, operation: str, difficulty: str, num_test_cases: int, explanation_mode: str
+            ):
+                """Dispatch to the appropriate async handler, streaming partial output to the textbox."""
                 if operation == "GENERATE TEST CASES":
-                    return await handle_generate_test_cases(problem_text, difficulty)
+                    yield await handle_generate_test_cases(problem_text, difficulty, num_test_cases)
                 elif operation == "EXPLAIN PROBLEM":
-                    return await handle_explain_problem(problem_text, explanation_mode)
-                return "❌ **Error**: Unknown operation"
+                    async for partial in handle_explain_problem(problem_text, explanation_mode):
+                        yield partial
+                else:
+                    yield "❌ **Error**: Unknown operation"
             return handler
 
         send_btn.click(
             fn=create_send_handler(),
-            inputs=[problem_input, options_dropdown, difficulty_radio, explanation_mode_radio],
+            inputs=[problem_input, options_dropdown, difficulty_radio, num_test_cases_slider, explanation_mode_radio],
             outputs=[test_results],
             show_progress=True
         )
         
+        submit_job_btn.click(
+            fn=handle_submit_job,
+            inputs=[problem_input, difficulty_radio, num_test_cases_slider],
+            outputs=[job_id_box, job_status, job_timer],
+            show_progress=False
+        )
+
+        job_timer.tick(
+            fn=handle_poll_job,
+            inputs=[job_id_box],
+            outputs=[job_status, job_timer],
+            show_progress=False
+        )
+
+        job_id_box.submit(
+            fn=handle_poll_job,
+            inputs=[job_id_box],
+            outputs=[job_status, job_timer],
+            show_progress=False
+        )
+
         clear_btn.click(
             fn=handle_clear,
             inputs=[],
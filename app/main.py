@@ -13,10 +13,27 @@ from typing import AsyncGenerator
 
 from dotenv import load_dotenv
 import gradio as gr
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.infrastructure.config.logging_config import configure_logging
+from app.application.shared.tracing import trace
+from app.infrastructure.config.config import BatchSettings
+from app.infrastructure.config.logging_config import configure_logging, shutdown_logging
+from app.infrastructure.factories.service_factory import ServiceFactory
+from app.infrastructure.observability.metrics import CONTENT_TYPE, REGISTRY
+from app.infrastructure.observability.tracing import InMemorySpanCollector
+from app.infrastructure.rest.batch import run_batch
+from app.infrastructure.rest.errors import error_response
+from app.infrastructure.rest.models import (
+    BatchRequest,
+    ErrorResponse,
+    ExplainRequest,
+    ExplainResponse,
+    GenerateTestsRequest,
+    GenerateTestsResponse,
+    JobResponse,
+)
 from app.infrastructure.ui.app_ui import create_gradio_interface
 
 
@@ -24,9 +41,11 @@ from app.infrastructure.ui.app_ui import create_gradio_interface
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
     # Startup
+    load_dotenv()
     configure_logging()
     print("Starting LeetCode Help Buddy...")
-    load_dotenv()
+    ServiceFactory.get_span_exporter()
+    await ServiceFactory.get_job_queue().start()
     
     # Verify OpenAI API key is configured
     if not os.getenv("OPENAI_API_KEY"):
@@ -36,6 +55,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     
     # Shutdown
     print("Shutting down LeetCode Help Buddy...")
+    await ServiceFactory.aclose()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -56,6 +77,17 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    @app.middleware("http")
+    async def trace_requests(request: Request, call_next):
+        """Starts a trace per API request; Gradio requests are traced by their handlers instead."""
+        if request.url.path.startswith("/app"):
+            return await call_next(request)
+        with trace(f"{request.method} {request.url.path}") as root:
+            response = await call_next(request)
+            root.set_attribute("http.status_code", response.status_code)
+        response.headers["X-Trace-Id"] = root.trace_id
+        return response
+
     # Create and mount Gradio interface
     gradio_app = create_gradio_interface()
     app = gr.mount_gradio_app(app, gradio_app, path="/app")
@@ -69,6 +101,83 @@ def create_app() -> FastAPI:
     async def health():
         """Health check endpoint."""
         return {"status": "healthy"}
+
+    error_responses = {status: {"model": ErrorResponse} for status in (404, 422, 500, 502, 503, 504)}
+
+    @app.post("/explain", response_model=ExplainResponse, responses=error_responses)
+    async def explain(body: ExplainRequest):
+        """Explains a problem without giving away a solution."""
+        try:
+            response = await ServiceFactory.get_explanation_service().explain(body.statement_text, body.mode)
+        except Exception as e:
+            status_code, error = error_response("explain", e)
+            return JSONResponse(status_code=status_code, content=error.model_dump(by_alias=True))
+        return ExplainResponse.of(response)
+
+    @app.post("/generate-tests", response_model=GenerateTestsResponse, responses=error_responses)
+    async def generate_tests(body: GenerateTestsRequest):
+        """Generates test case inputs for a problem at the requested difficulty."""
+        try:
+            response = await ServiceFactory.get_test_case_service().generate_test_cases(
+                user_input=body.statement_text,
+                difficulty=body.difficulty,
+                num_test_cases=body.count,
+            )
+        except Exception as e:
+            status_code, error = error_response("test_cases", e)
+            return JSONResponse(status_code=status_code, content=error.model_dump(by_alias=True))
+        return GenerateTestsResponse.of(response)
+
+    @app.post("/batch", response_class=StreamingResponse)
+    async def batch(body: BatchRequest):
+        """Runs many explain or test case requests; each result is streamed as an NDJSON line when it completes."""
+        settings = BatchSettings.from_env()
+        if len(body.items) > settings.max_items:
+            raise HTTPException(status_code=422, detail=f"items must contain at most {settings.max_items} entries")
+        concurrency = min(body.concurrency or settings.max_concurrency, settings.max_concurrency)
+        return StreamingResponse(run_batch(body, concurrency), media_type="application/x-ndjson")
+
+    @app.post("/jobs/test-cases", response_model=JobResponse, status_code=202, responses=error_responses)
+    async def submit_test_case_job(body: GenerateTestsRequest):
+        """Queues test case generation and returns the job immediately; poll `GET /jobs/{jobId}` for the result."""
+        queue = ServiceFactory.get_job_queue()
+        try:
+            job = await queue.submit(body.statement_text, body.difficulty, body.count)
+        except Exception as e:
+            status_code, error = error_response("test_cases", e)
+            return JSONResponse(status_code=status_code, content=error.model_dump(by_alias=True))
+        return JSONResponse(
+            status_code=202,
+            content=JobResponse.of(job, queue.position(job.job_id)).model_dump(mode="json", by_alias=True),
+            headers={"Location": f"/jobs/{job.job_id}"},
+        )
+
+    @app.get("/jobs/{job_id}", response_model=JobResponse)
+    async def get_job(job_id: str):
+        """Status of a background job, with its test cases or error once it has finished."""
+        queue = ServiceFactory.get_job_queue()
+        job = await queue.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return JobResponse.of(job, queue.position(job_id))
+
+    @app.get("/stats/usage")
+    async def usage_stats():
+        """LLM token, cost and latency totals per feature, model and problem slug."""
+        return ServiceFactory.get_usage_tracker().snapshot()
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        """Prometheus scrape endpoint."""
+        return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+    @app.get("/traces")
+    async def traces(trace_id: str | None = None):
+        """Recent spans in OTLP/JSON form; available when TRACE_EXPORTER=memory."""
+        collector = ServiceFactory.get_span_exporter()
+        if not isinstance(collector, InMemorySpanCollector):
+            raise HTTPException(status_code=404, detail="In-memory trace collection is not enabled")
+        return collector.to_otlp(trace_id)
     
     return app
 
@@ -0,0 +1,234 @@
+"""
+Network-free stand-ins for the benchmark suite: a fake LLM port with configurable latency and
+an ASGI app that answers like the Alfa LeetCode API's `/select` endpoint.
+"""
+
+import asyncio
+import json
+import random
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Type, TypeVar
+from urllib.parse import parse_qs
+
+from pydantic import BaseModel
+
+from app.application.testcase.constraints import parse_problem_constraints
+from app.application.testcase.local_generator import LocalTestCaseGenerator
+from app.domain.ports.llm.models import LLMRequest, LLMResponse, LLMUsage
+from app.domain.shared.leetcode.models import LeetCodeProblemDetails
+from app.domain.testcase.models.models import Difficulty, ProblemTestCases
+
+T = TypeVar("T", bound=BaseModel)
+
+_REQUESTED_COUNT = re.compile(r"Generate (\d+) test cases")
+
+
+@dataclass(frozen=True)
+class Latency:
+    """A latency distribution in seconds: `fixed:0.2`, `uniform:0.1:0.4` or `lognormal:0.3:0.5` (median, sigma)."""
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, *values = spec.split(":")
+        if kind not in ("fixed", "uniform", "lognormal") or not 1 <= len(values) <= 2:
+            raise ValueError(f"Unsupported latency spec: {spec}")
+        numbers = [float(value) for value in values]
+        return cls(kind, numbers[0], numbers[1] if len(numbers) > 1 else 0.0)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return self.a * rng.lognormvariate(0.0, self.b) if self.a > 0 else 0.0
+        return self.a
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.a}:{self.b}" if self.kind != "fixed" else f"fixed:{self.a}"
+
+
+async def _pause(seconds: float) -> None:
+    # sleep(0) still yields to the loop, like a real await on I/O.
+    await asyncio.sleep(seconds)
+
+
+class FakeLLM:
+    """Implements TextLLMPort and StructuredOutputLLMPort without a network.
+
+    Structured requests for ProblemTestCases are answered with valid inputs built by the local
+    generator from the problem's parsed schema (looked up by `LLMRequest.question_slug`).
+    """
+
+    def __init__(
+        self,
+        problems: Dict[str, LeetCodeProblemDetails],
+        latency: Latency = Latency(),
+        stream_chunks: int = 20,
+        seed: Optional[int] = None,
+    ):
+        self.problems = problems
+        self.latency = latency
+        self.stream_chunks = stream_chunks
+        self._rng = random.Random(seed)
+        self._local = LocalTestCaseGenerator(seed=seed)
+        self.calls = 0
+
+    async def generate_text_output(self, request: LLMRequest) -> LLMResponse[str]:
+        self.calls += 1
+        await _pause(self.latency.sample(self._rng))
+        return LLMResponse(content=self.__explanation(request), model_name="fake", provider="FAKE", usage=self.__usage(request))
+
+    async def stream_text_output(self, request: LLMRequest) -> AsyncIterator[str]:
+        self.calls += 1
+        total = self.latency.sample(self._rng)
+        await _pause(total / 2)  # time to first token
+        text = self.__explanation(request)
+        step = max(1, len(text) // self.stream_chunks)
+        for start in range(0, len(text), step):
+            await _pause(total / 2 / self.stream_chunks)
+            yield text[start:start + step]
+
+    async def generate_structured_output(self, request: LLMRequest, response_format: Type[T]) -> LLMResponse[T]:
+        self.calls += 1
+        await _pause(self.latency.sample(self._rng))
+        if response_format is not ProblemTestCases:
+            raise TypeError(f"FakeLLM cannot produce {response_format.__name__}")
+        match = _REQUESTED_COUNT.search(request.user_prompt)
+        count = int(match.group(1)) if match else 5
+        details = self.problems[request.question_slug]
+        test_cases = self._local.generate(parse_problem_constraints(details), Difficulty.MEDIUM, count)
+        for test_case in test_cases:
+            test_case.expected_result = "0"
+            test_case.is_edge_case = False
+        return LLMResponse(
+            content=ProblemTestCases(test_cases=test_cases), model_name="fake", provider="FAKE", usage=self.__usage(request)
+        )
+
+    @staticmethod
+    def __explanation(request: LLMRequest) -> str:
+        return ("This problem asks you to reason carefully about the input. " * 30).strip()
+
+    @staticmethod
+    def __usage(request: LLMRequest) -> LLMUsage:
+        prompt = len(request.user_prompt) + len(request.system_prompt or "")
+        return LLMUsage(prompt_tokens=prompt // 4, completion_tokens=400)
+
+
+class AlfaStandIn:
+    """ASGI app serving `GET /select?titleSlug=<slug>` from an in-memory problem set."""
+
+    def __init__(self, problems: Dict[str, LeetCodeProblemDetails], latency: Latency = Latency(), seed: Optional[int] = None):
+        self.payloads = {slug: alfa_payload(details) for slug, details in problems.items()}
+        self.latency = latency
+        self._rng = random.Random(seed)
+        self.requests = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        self.requests += 1
+        await _pause(self.latency.sample(self._rng))
+        slug = parse_qs(scope.get("query_string", b"").decode()).get("titleSlug", [""])[0]
+        payload = self.payloads.get(slug) if scope["path"] == "/select" else None
+        status, body = (200, payload) if payload is not None else (404, {"error": "not found"})
+        encoded = json.dumps(body).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(encoded)).encode())],
+        })
+        await send({"type": "http.response.body", "body": encoded})
+
+
+def alfa_payload(details: LeetCodeProblemDetails) -> Dict[str, str]:
+    """The subset of the Alfa `/select` response the adapter reads."""
+    return {
+        "titleSlug": details.question_slug,
+        "questionTitle": details.question_title,
+        "question": details.question_content,
+        "exampleTestcases": details.example_testcases,
+        "difficulty": details.difficulty,
+    }
+
+
+PROBLEMS: Dict[str, LeetCodeProblemDetails] = {
+    "two-sum": LeetCodeProblemDetails(
+        question_slug="two-sum",
+        question_title="Two Sum",
+        question_content=(
+            "<p>Given an array of integers <code>nums</code>&nbsp;and an integer <code>target</code>, return "
+            "<em>indices of the two numbers such that they add up to <code>target</code></em>.</p>\n"
+            "<p>You may assume that each input would have <strong><em>exactly</em> one solution</strong>, and you "
+            "may not use the <em>same</em> element twice.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [2,7,11,15], "
+            "target = 9\n<strong>Output:</strong> [0,1]\n<strong>Explanation:</strong> Because nums[0] + nums[1] == 9, "
+            "we return [0, 1].\n</pre>\n"
+            "<p><strong class=\"example\">Example 2:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [3,2,4], "
+            "target = 6\n<strong>Output:</strong> [1,2]\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>2 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>-10<sup>9</sup> &lt;= nums[i] &lt;= 10<sup>9</sup></code></li>\n"
+            "\t<li><code>-10<sup>9</sup> &lt;= target &lt;= 10<sup>9</sup></code></li>\n"
+            "\t<li><strong>Only one valid answer exists.</strong></li>\n</ul>\n"
+        ),
+        example_testcases="[2,7,11,15]\n9\n[3,2,4]\n6",
+        difficulty="Easy",
+    ),
+    "valid-parentheses": LeetCodeProblemDetails(
+        question_slug="valid-parentheses",
+        question_title="Valid Parentheses",
+        question_content=(
+            "<p>Given a string <code>s</code> containing just the characters <code>'('</code>, <code>')'</code>, "
+            "<code>'{'</code>, <code>'}'</code>, <code>'['</code> and <code>']'</code>, determine if the input "
+            "string is valid.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> s = \"()\"\n"
+            "<strong>Output:</strong> true\n</pre>\n"
+            "<p><strong class=\"example\">Example 2:</strong></p>\n<pre>\n<strong>Input:</strong> s = \"(]\"\n"
+            "<strong>Output:</strong> false\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>1 &lt;= s.length &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>s</code> consists of parentheses only <code>'()[]{}'</code>.</li>\n</ul>\n"
+        ),
+        example_testcases="\"()\"\n\"(]\"",
+        difficulty="Easy",
+    ),
+    "search-insert-position": LeetCodeProblemDetails(
+        question_slug="search-insert-position",
+        question_title="Search Insert Position",
+        question_content=(
+            "<p>Given a sorted array of distinct integers and a target value, return the index if the target is "
+            "found. If not, return the index where it would be if it were inserted in order.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [1,3,5,6], "
+            "target = 5\n<strong>Output:</strong> 2\n</pre>\n"
+            "<p><strong class=\"example\">Example 2:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [1,3,5,6], "
+            "target = 2\n<strong>Output:</strong> 1\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>1 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>-10<sup>4</sup> &lt;= nums[i] &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>nums</code> contains <strong>distinct</strong> values sorted in <strong>ascending</strong> "
+            "order.</li>\n"
+            "\t<li><code>-10<sup>4</sup> &lt;= target &lt;= 10<sup>4</sup></code></li>\n</ul>\n"
+        ),
+        example_testcases="[1,3,5,6]\n5\n[1,3,5,6]\n2",
+        difficulty="Easy",
+    ),
+    "number-of-islands": LeetCodeProblemDetails(
+        question_slug="number-of-islands",
+        question_title="Number of Islands",
+        question_content=(
+            "<p>Given an <code>m x n</code> 2D binary grid <code>grid</code> which represents a map of "
+            "<code>'1'</code>s (land) and <code>'0'</code>s (water), return <em>the number of islands</em>.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> grid = [\n"
+            "  [\"1\",\"1\",\"0\"],\n  [\"0\",\"0\",\"1\"]\n]\n<strong>Output:</strong> 2\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>m == grid.length</code></li>\n\t<li><code>n == grid[i].length</code></li>\n"
+            "\t<li><code>1 &lt;= m, n &lt;= 300</code></li>\n"
+            "\t<li><code>grid[i][j]</code> is <code>'0'</code> or <code>'1'</code>.</li>\n</ul>\n"
+        ),
+        example_testcases="[[\"1\",\"1\",\"0\"],[\"0\",\"0\",\"1\"]]",
+        difficulty="Medium",
+    ),
+}
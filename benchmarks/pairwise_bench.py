@@ -0,0 +1,81 @@
+"""
+Compares the IPOG covering-array engine with allpairspy on multi-parameter inputs.
+
+Reports the number of rows (against the full Cartesian product), wall time, and whether
+each result really covers every value pair.
+
+Run with: python -m benchmarks.pairwise_bench [--repeat 3]
+"""
+
+import argparse
+import math
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from app.application.testcase.pairwise import covering_array, covers_all_interactions
+
+try:
+    from allpairspy import AllPairs
+except ImportError:  # allpairspy is optional
+    AllPairs = None
+
+# (label, domain size per parameter)
+SHAPES: List[Tuple[str, List[int]]] = [
+    ("3^4", [3] * 4),
+    ("3^13", [3] * 13),
+    ("4^10", [4] * 10),
+    ("2..7 mixed", [2, 3, 4, 5, 6, 7]),
+    ("5^15", [5] * 15),
+    ("10^20", [10] * 20),
+]
+
+
+def _timed(build: Callable[[], List[Tuple[Any, ...]]], repeat: int) -> Tuple[List[Tuple[Any, ...]], float]:
+    best = math.inf
+    rows: List[Tuple[Any, ...]] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = build()
+        best = min(best, time.perf_counter() - started)
+    return rows, best * 1000
+
+
+def _allpairs(domains: Sequence[Sequence[Any]]) -> List[Tuple[Any, ...]]:
+    return [tuple(row) for row in AllPairs(domains)]
+
+
+def run(repeat: int, skip_allpairs_above: Optional[int]) -> None:
+    header = f"{'shape':<12}{'product':>14}{'ipog rows':>11}{'ipog ms':>10}{'allpairs rows':>15}{'allpairs ms':>13}"
+    print(header)
+    print("-" * len(header))
+    for label, sizes in SHAPES:
+        domains = [list(range(size)) for size in sizes]
+        rows, elapsed = _timed(lambda: covering_array(domains), repeat)
+        assert covers_all_interactions(rows, domains), f"IPOG missed pairs for {label}"
+        line = f"{label:<12}{math.prod(sizes):>14.3g}{len(rows):>11}{elapsed:>10.1f}"
+
+        if AllPairs is None or (skip_allpairs_above is not None and len(sizes) * max(sizes) > skip_allpairs_above):
+            line += f"{'-':>15}{'-':>13}"
+        else:
+            reference, reference_elapsed = _timed(lambda: _allpairs(domains), repeat)
+            assert covers_all_interactions(reference, domains), f"allpairspy missed pairs for {label}"
+            line += f"{len(reference):>15}{reference_elapsed:>13.1f}"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the best one is reported")
+    parser.add_argument(
+        "--skip-allpairs-above",
+        type=int,
+        default=None,
+        help="skip allpairspy when parameters x values exceeds this (it gets slow on large shapes)",
+    )
+    args = parser.parse_args(argv)
+    run(args.repeat, args.skip_allpairs_above)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
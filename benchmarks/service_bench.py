@@ -0,0 +1,245 @@
+"""
+Offline throughput and latency benchmarks for the explanation and test case services.
+
+Micro-benchmarks time slug extraction, decoding the Alfa response and prompt building.
+End-to-end runs drive ExplanationService and TestCaseService through the real LeetCode
+adapter, which talks to an in-process ASGI stand-in, with a fake LLM in place of OpenAI.
+They report requests/sec and p50/p95/p99 latency at each concurrency level. Results are
+printed as JSON (or written with --output) so runs on different commits can be compared
+with --compare.
+
+Run with: python -m benchmarks.service_bench [--llm-latency lognormal:0.3:0.5] [--output run.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from app.application.explain.generator import ProblemStatementExplainer
+from app.application.explain.service import ExplanationService
+from app.application.shared.statement import StatementCompactor
+from app.application.testcase.generator import TestCaseGenerator
+from app.application.testcase.service import TestCaseService
+from app.domain.explain.models.models import ExplainProblemStatementRequest, ExplainationMode
+from app.domain.shared.leetcode.models import LeetCodeProblemDetails
+from app.domain.testcase.models.models import Difficulty, TestCaseGenerationRequest
+from app.infrastructure.adapters.api.http_client import PooledAsyncHttpClient
+from app.infrastructure.adapters.api.leetcode import (
+    AlfaLCGetProblemDetailsAdapter,
+    SimpleQuestionSlugExtractorAdapter,
+)
+from app.infrastructure.adapters.repository.test_case_repo import NullTestCaseRepository
+from app.infrastructure.cache.problem_details import CachingGetProblemDetailsAdapter
+from benchmarks.fakes import PROBLEMS, AlfaStandIn, FakeLLM, Latency, alfa_payload
+
+os.environ.setdefault("ALFA_LEETCODE_API_URL", "http://alfa.local")
+
+USER_INPUTS = ["1. Two Sum", "valid parentheses", "LeetCode 35. Search Insert Position", "number of islands problem"]
+
+
+def _time_sync(fn: Callable[[], Any], number: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter_ns() - started) / number)
+    return best
+
+
+async def _time_async(fn: Callable[[], Awaitable[Any]], number: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            await fn()
+        best = min(best, (time.perf_counter_ns() - started) / number)
+    return best
+
+
+async def micro(number: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Best-of-`repeat` nanoseconds per operation; LLM latency is zero so only our own code is timed."""
+    extractor = SimpleQuestionSlugExtractorAdapter()
+    adapter = AlfaLCGetProblemDetailsAdapter(http_client=PooledAsyncHttpClient())
+    details = PROBLEMS["two-sum"]
+    payload = alfa_payload(details)
+    cold, warm = StatementCompactor(max_slugs=0), StatementCompactor()
+    llm = FakeLLM(PROBLEMS)
+    explainer = ProblemStatementExplainer(llm, compactor=warm)
+    generator = TestCaseGenerator(llm, compactor=warm)
+    explain_request = ExplainProblemStatementRequest(problem_statement=details, mode=ExplainationMode.BEGINNER)
+    test_case_request = TestCaseGenerationRequest(
+        user_message="two sum", problem_details=details, difficulty=Difficulty.MEDIUM, num_test_cases=5
+    )
+
+    results = {
+        "slug_extraction": _time_sync(lambda: extractor.extract_question_slug("LeetCode 1. Two Sum problem"), number, repeat),
+        "decode_problem_details": _time_sync(lambda: adapter.converter.structure(payload, LeetCodeProblemDetails), number, repeat),
+        "compact_statement_cold": _time_sync(lambda: cold.compact(details), number, repeat),
+        "compact_statement_warm": _time_sync(lambda: warm.compact(details), number, repeat),
+        "explain_prompt_and_call": await _time_async(
+            lambda: explainer.explain_problem_statement(explain_request), number, repeat
+        ),
+        "test_case_prompt_and_call": await _time_async(
+            lambda: generator.generate_test_cases(test_case_request), max(1, number // 10), repeat
+        ),
+    }
+    return {name: {"ns_per_op": round(value, 1)} for name, value in results.items()}
+
+
+def _services(llm_latency: Latency, alfa_latency: Latency, seed: Optional[int]):
+    alfa = AlfaStandIn(PROBLEMS, alfa_latency, seed=seed)
+    http_client = PooledAsyncHttpClient(transport=httpx.ASGITransport(app=alfa))
+    fetcher = CachingGetProblemDetailsAdapter(AlfaLCGetProblemDetailsAdapter(http_client=http_client))
+    llm = FakeLLM(PROBLEMS, llm_latency, seed=seed)
+    explain = ExplanationService(SimpleQuestionSlugExtractorAdapter(), fetcher, ProblemStatementExplainer(llm))
+    test_cases = TestCaseService(
+        SimpleQuestionSlugExtractorAdapter(), fetcher, TestCaseGenerator(llm), NullTestCaseRepository()
+    )
+    return explain, test_cases, http_client
+
+
+async def _drain(stream) -> None:
+    async for _ in stream:
+        pass
+
+
+async def _load(call: Callable[[int], Awaitable[Any]], requests: int, concurrency: int) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await call(index)
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    p50, p95, p99 = (np.percentile(latencies, [50, 95, 99]) * 1000).tolist() if latencies else (0.0, 0.0, 0.0)
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(p50, 2),
+        "p95_ms": round(p95, 2),
+        "p99_ms": round(p99, 2),
+        "errors": errors,
+    }
+
+
+async def end_to_end(
+    concurrency_levels: List[int], requests: int, llm_latency: Latency, alfa_latency: Latency, seed: Optional[int]
+) -> List[Dict[str, Any]]:
+    explain, test_cases, http_client = _services(llm_latency, alfa_latency, seed)
+    scenarios = {
+        "explain": lambda index: explain.explain(USER_INPUTS[index % len(USER_INPUTS)]),
+        "explain_stream": lambda index: _drain(explain.stream_explain(USER_INPUTS[index % len(USER_INPUTS)])),
+        "test_cases": lambda index: test_cases.generate_test_cases(
+            USER_INPUTS[index % len(USER_INPUTS)], Difficulty.MEDIUM, 10
+        ),
+    }
+    results = []
+    try:
+        for scenario, call in scenarios.items():
+            for concurrency in concurrency_levels:
+                results.append({"scenario": scenario, **await _load(call, requests, concurrency)})
+    finally:
+        await http_client.aclose()
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Prints current/baseline ratios; below 1.0 is faster for ns_per_op and latencies, above 1.0 for rps."""
+    for name, value in current["micro"].items():
+        before = baseline.get("micro", {}).get(name)
+        if before and before["ns_per_op"]:
+            print(f"{name:<28} ns/op x{value['ns_per_op'] / before['ns_per_op']:.2f}", file=sys.stderr)
+    previous = {(run["scenario"], run["concurrency"]): run for run in baseline.get("e2e", [])}
+    for run in current["e2e"]:
+        before = previous.get((run["scenario"], run["concurrency"]))
+        if before and before["rps"] and before["p99_ms"]:
+            print(
+                f"{run['scenario']:<16}c={run['concurrency']:<4} rps x{run['rps'] / before['rps']:.2f}"
+                f"  p99 x{run['p99_ms'] / before['p99_ms']:.2f}",
+                file=sys.stderr,
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", default="1,8,32,128", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=256, help="requests per scenario and concurrency level")
+    parser.add_argument("--llm-latency", type=Latency.parse, default=Latency.parse("lognormal:0.05:0.5"))
+    parser.add_argument("--alfa-latency", type=Latency.parse, default=Latency.parse("fixed:0.02"))
+    parser.add_argument("--micro-number", type=int, default=2000, help="operations per micro-benchmark run")
+    parser.add_argument("--repeat", type=int, default=3, help="micro-benchmark runs; the best one is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-e2e", action="store_true")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON report to compare against (ratios go to stderr)")
+    args = parser.parse_args(argv)
+
+    async def run() -> Dict[str, Any]:
+        return {
+            "meta": {
+                "commit": _git_commit(),
+                "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "llm_latency": str(args.llm_latency),
+                "alfa_latency": str(args.alfa_latency),
+                "seed": args.seed,
+            },
+            "micro": await micro(args.micro_number, args.repeat),
+            "e2e": [] if args.skip_e2e else await end_to_end(
+                [int(level) for level in args.concurrency.split(",")],
+                args.requests,
+                args.llm_latency,
+                args.alfa_latency,
+                args.seed,
+            ),
+        }
+
+    report = asyncio.run(run())
+    document = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(document + "\n")
+    else:
+        print(document)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            _compare(report, json.load(baseline))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Import a LeetCode problem snapshot into the local problem catalog.
+
+Run with: python import_catalog.py problems.ndjson [--db data/problem_catalog.db]
+"""
+
+import sys
+
+from app.infrastructure.cli.import_catalog import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Pre-warm the problem catalog, explanation cache and test case pool for popular problems.
+
+Run with: python prewarm.py top_problems.txt [--top 100] [--concurrency 4] [--requests-per-minute 100]
+"""
+
+import sys
+
+from app.infrastructure.cli.prewarm import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Problem statements shared by the test case engine tests, trimmed from real LeetCode payloads.
+"""
+
+from typing import Dict
+
+from app.domain.shared.leetcode.models import LeetCodeProblemDetails
+
+
+PROBLEMS: Dict[str, LeetCodeProblemDetails] = {
+    "two-sum": LeetCodeProblemDetails(
+        question_slug="two-sum",
+        question_title="Two Sum",
+        question_content=(
+            "<p>Given an array of integers <code>nums</code>&nbsp;and an integer <code>target</code>, return "
+            "<em>indices of the two numbers such that they add up to <code>target</code></em>.</p>\n"
+            "<p>You may assume that each input would have <strong><em>exactly</em> one solution</strong>, and you "
+            "may not use the <em>same</em> element twice.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [2,7,11,15], "
+            "target = 9\n<strong>Output:</strong> [0,1]\n<strong>Explanation:</strong> Because nums[0] + nums[1] == 9, "
+            "we return [0, 1].\n</pre>\n"
+            "<p><strong class=\"example\">Example 2:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [3,2,4], "
+            "target = 6\n<strong>Output:</strong> [1,2]\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>2 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>-10<sup>9</sup> &lt;= nums[i] &lt;= 10<sup>9</sup></code></li>\n"
+            "\t<li><code>-10<sup>9</sup> &lt;= target &lt;= 10<sup>9</sup></code></li>\n"
+            "\t<li><strong>Only one valid answer exists.</strong></li>\n</ul>\n"
+        ),
+        example_testcases="[2,7,11,15]\n9\n[3,2,4]\n6",
+        difficulty="Easy",
+    ),
+    "valid-parentheses": LeetCodeProblemDetails(
+        question_slug="valid-parentheses",
+        question_title="Valid Parentheses",
+        question_content=(
+            "<p>Given a string <code>s</code> containing just the characters <code>'('</code>, <code>')'</code>, "
+            "<code>'{'</code>, <code>'}'</code>, <code>'['</code> and <code>']'</code>, determine if the input "
+            "string is valid.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> s = \"()\"\n"
+            "<strong>Output:</strong> true\n</pre>\n"
+            "<p><strong class=\"example\">Example 2:</strong></p>\n<pre>\n<strong>Input:</strong> s = \"(]\"\n"
+            "<strong>Output:</strong> false\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>1 &lt;= s.length &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>s</code> consists of parentheses only <code>'()[]{}'</code>.</li>\n</ul>\n"
+        ),
+        example_testcases="\"()\"\n\"(]\"",
+        difficulty="Easy",
+    ),
+    "search-insert-position": LeetCodeProblemDetails(
+        question_slug="search-insert-position",
+        question_title="Search Insert Position",
+        question_content=(
+            "<p>Given a sorted array of distinct integers and a target value, return the index if the target is "
+            "found. If not, return the index where it would be if it were inserted in order.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [1,3,5,6], "
+            "target = 5\n<strong>Output:</strong> 2\n</pre>\n"
+            "<p><strong class=\"example\">Example 2:</strong></p>\n<pre>\n<strong>Input:</strong> nums = [1,3,5,6], "
+            "target = 2\n<strong>Output:</strong> 1\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>1 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>-10<sup>4</sup> &lt;= nums[i] &lt;= 10<sup>4</sup></code></li>\n"
+            "\t<li><code>nums</code> contains <strong>distinct</strong> values sorted in <strong>ascending</strong> "
+            "order.</li>\n"
+            "\t<li><code>-10<sup>4</sup> &lt;= target &lt;= 10<sup>4</sup></code></li>\n</ul>\n"
+        ),
+        example_testcases="[1,3,5,6]\n5\n[1,3,5,6]\n2",
+        difficulty="Easy",
+    ),
+    "number-of-islands": LeetCodeProblemDetails(
+        question_slug="number-of-islands",
+        question_title="Number of Islands",
+        question_content=(
+            "<p>Given an <code>m x n</code> 2D binary grid <code>grid</code> which represents a map of "
+            "<code>'1'</code>s (land) and <code>'0'</code>s (water), return <em>the number of islands</em>.</p>\n"
+            "<p><strong class=\"example\">Example 1:</strong></p>\n<pre>\n<strong>Input:</strong> grid = [\n"
+            "  [\"1\",\"1\",\"0\"],\n  [\"0\",\"0\",\"1\"]\n]\n<strong>Output:</strong> 2\n</pre>\n"
+            "<p>&nbsp;</p>\n<p><strong>Constraints:</strong></p>\n<ul>\n"
+            "\t<li><code>m == grid.length</code></li>\n\t<li><code>n == grid[i].length</code></li>\n"
+            "\t<li><code>1 &lt;= m, n &lt;= 300</code></li>\n"
+            "\t<li><code>grid[i][j]</code> is <code>'0'</code> or <code>'1'</code>.</li>\n</ul>\n"
+        ),
+        example_testcases="[[\"1\",\"1\",\"0\"],[\"0\",\"0\",\"1\"]]",
+        difficulty="Medium",
+    ),
+}
@@ -0,0 +1,74 @@
+import pytest
+
+from app.application.testcase.constraints import evaluate_number, parse_problem_constraints
+from app.domain.shared.leetcode.models import LeetCodeProblemDetails
+from tests.application.testcase.problems import PROBLEMS
+
+
+def test_parses_array_and_scalar_bounds():
+    input_schema = parse_problem_constraints(PROBLEMS["two-sum"])
+
+    assert input_schema.parameters == ("nums", "target")
+    assert input_schema.parameter_schema("nums") == {
+        "type": "array",
+        "items": {"type": "integer", "minimum": -10 ** 9, "maximum": 10 ** 9},
+        "minItems": 2,
+        "maxItems": 10 ** 4,
+    }
+    assert input_schema.parameter_schema("target") == {"type": "integer", "minimum": -10 ** 9, "maximum": 10 ** 9}
+    assert input_schema.examples == (([2, 7, 11, 15], 9), ([3, 2, 4], 6))
+    assert input_schema.warnings == ()
+
+
+def test_parses_string_length_and_alphabet():
+    schema = parse_problem_constraints(PROBLEMS["valid-parentheses"]).parameter_schema("s")
+
+    assert schema["type"] == "string"
+    assert (schema["minLength"], schema["maxLength"]) == (1, 10 ** 4)
+    assert schema["pattern"] == r"^[()\[\]{}]*$"
+
+
+def test_parses_distinct_sorted_values():
+    schema = parse_problem_constraints(PROBLEMS["search-insert-position"]).parameter_schema("nums")
+
+    assert schema["uniqueItems"] is True
+    assert schema["x-sorted"] == "non-decreasing"
+
+
+def test_parses_a_grid_of_enumerated_cells():
+    schema = parse_problem_constraints(PROBLEMS["number-of-islands"]).parameter_schema("grid")
+
+    assert (schema["minItems"], schema["maxItems"]) == (1, 300)
+    assert schema["items"]["type"] == "array"
+    assert (schema["items"]["minItems"], schema["items"]["maxItems"]) == (1, 300)
+    assert schema["items"]["items"] == {"type": "string", "enum": ["0", "1"]}
+
+
+def test_schema_hash_follows_the_constraints():
+    two_sum = PROBLEMS["two-sum"]
+    looser = LeetCodeProblemDetails(
+        question_slug=two_sum.question_slug,
+        question_title=two_sum.question_title,
+        question_content=two_sum.question_content.replace("10<sup>4</sup>", "10<sup>5</sup>"),
+        example_testcases=two_sum.example_testcases,
+        difficulty=two_sum.difficulty,
+    )
+
+    assert parse_problem_constraints(two_sum).schema_hash == parse_problem_constraints(two_sum).schema_hash
+    assert parse_problem_constraints(looser).schema_hash != parse_problem_constraints(two_sum).schema_hash
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("10^4", 10_000),
+        ("-2^31", -(2 ** 31)),
+        ("2^31 - 1", 2 ** 31 - 1),
+        ("1e5", 100_000),
+        ("2 * 10^4", 20_000),
+        ("n", None),
+        ("", None),
+    ],
+)
+def test_evaluate_number(expression, expected):
+    assert evaluate_number(expression) == expected
@@ -0,0 +1,88 @@
+from app.application.testcase.constraints import parse_problem_constraints
+from app.application.testcase.dedup import TestCaseDeduplicator
+from app.application.testcase.dedup import test_case_fingerprint as fingerprint
+from app.domain.testcase.models.models import TestCase
+from tests.application.testcase.problems import PROBLEMS
+
+PARAMETERS = ("nums", "target")
+
+
+def _cases(*contents: str):
+    return [TestCase(test_case_content=content, expected_result="") for content in contents]
+
+
+def _contents(test_cases):
+    return [test_case.test_case_content for test_case in test_cases]
+
+
+def test_fingerprint_ignores_layout_and_number_spelling():
+    canonical = fingerprint("[1,2]\n3", PARAMETERS)
+
+    assert fingerprint("[1, 2]\n\n3.0", PARAMETERS) == canonical
+    assert fingerprint("nums = [1,2], target = 3e0", PARAMETERS) == canonical
+    assert fingerprint('{"target": 3, "nums": [1, 2]}', PARAMETERS) == canonical
+    assert fingerprint("[2,1]\n3", PARAMETERS) != canonical
+
+
+def test_batch_drops_examples_and_repeats():
+    input_schema = parse_problem_constraints(PROBLEMS["two-sum"])
+    batch = TestCaseDeduplicator().batch("two-sum", input_schema)
+
+    admitted = batch.admit(_cases("[2,7,11,15]\n9", "[1,2]\n3", "[1, 2]\n3", "[4,5]\n9"))
+
+    assert _contents(admitted) == ["[1,2]\n3", "[4,5]\n9"]
+    assert batch.dropped == {"example": 1, "batch": 1}
+
+
+def test_reserved_pool_cases_cannot_be_admitted_again():
+    input_schema = parse_problem_constraints(PROBLEMS["two-sum"])
+    batch = TestCaseDeduplicator().batch("two-sum", input_schema)
+
+    pooled = batch.reserve(_cases("[1,2]\n3"))
+    admitted = batch.admit(_cases("[1,2]\n3", "[5,6]\n11"))
+
+    assert _contents(pooled) == ["[1,2]\n3"]
+    assert _contents(admitted) == ["[5,6]\n11"]
+    assert batch.dropped == {"batch": 1}
+
+
+def test_committed_cases_are_not_served_again_for_the_same_slug():
+    input_schema = parse_problem_constraints(PROBLEMS["two-sum"])
+    deduplicator = TestCaseDeduplicator()
+    first = deduplicator.batch("two-sum", input_schema)
+    first.reserve(_cases("[1,2]\n3"))
+    first.admit(_cases("[5,6]\n11"))
+    first.commit()
+
+    second = deduplicator.batch("two-sum", input_schema)
+    admitted = second.admit(_cases("[1,2]\n3", "[5,6]\n11", "[7,8]\n15"))
+    other_slug = deduplicator.batch("three-sum", input_schema).admit(_cases("[1,2]\n3"))
+
+    assert _contents(admitted) == ["[7,8]\n15"]
+    assert second.dropped == {"history": 2}
+    assert _contents(other_slug) == ["[1,2]\n3"]
+
+
+def test_history_keeps_the_newest_cases_per_slug():
+    deduplicator = TestCaseDeduplicator(history_per_slug=2)
+    oldest, middle, newest = (fingerprint(f"[{n}]\n{n}", PARAMETERS) for n in range(3))
+
+    deduplicator.remember("two-sum", [oldest, middle, newest])
+
+    assert not deduplicator.was_served("two-sum", oldest)
+    assert deduplicator.was_served("two-sum", middle)
+    assert deduplicator.was_served("two-sum", newest)
+
+
+def test_history_forgets_the_least_recently_used_slug():
+    deduplicator = TestCaseDeduplicator(max_slugs=2)
+    served = fingerprint("[1]\n1", PARAMETERS)
+
+    deduplicator.remember("a", [served])
+    deduplicator.remember("b", [served])
+    deduplicator.remember("a", [])
+    deduplicator.remember("c", [served])
+
+    assert deduplicator.was_served("a", served)
+    assert not deduplicator.was_served("b", served)
+    assert deduplicator.was_served("c", served)
@@ -0,0 +1,68 @@
+import pytest
+
+from app.application.testcase.constraints import parse_problem_constraints
+from app.application.testcase.local_generator import LocalTestCaseGenerator
+from app.application.testcase.validation import TestCaseValidator
+from app.domain.shared.exception.testcase.testcase_exception import TestCaseNotGeneratedException
+from app.domain.testcase.models.models import Difficulty, ProblemInputSchema
+from tests.application.testcase.problems import PROBLEMS
+
+
+def _schema(**properties) -> ProblemInputSchema:
+    schema = {"type": "object", "properties": properties, "required": list(properties)}
+    return ProblemInputSchema(parameters=tuple(properties), schema=schema, schema_hash="-".join(properties))
+
+
+@pytest.mark.parametrize("slug", sorted(PROBLEMS))
+@pytest.mark.parametrize("difficulty", [Difficulty.EASY, Difficulty.MEDIUM])
+def test_generated_cases_pass_the_validator(slug, difficulty):
+    input_schema = parse_problem_constraints(PROBLEMS[slug])
+
+    test_cases = LocalTestCaseGenerator(seed=7).generate(input_schema, difficulty, 20)
+    report = TestCaseValidator().validate(input_schema, test_cases)
+
+    assert test_cases
+    assert report.rejected == []
+    assert report.repaired == 0
+
+
+def test_unique_string_arrays_keep_their_minimum_length():
+    input_schema = _schema(words={
+        "type": "array",
+        "minItems": 3,
+        "maxItems": 5,
+        "uniqueItems": True,
+        "items": {"type": "string", "minLength": 1, "maxLength": 1, "pattern": "^[a-f]*$"},
+    })
+
+    test_cases = LocalTestCaseGenerator(seed=1).generate(input_schema, Difficulty.EASY, 30)
+
+    assert TestCaseValidator().validate(input_schema, test_cases).rejected == []
+
+
+def test_boundary_cases_hit_the_length_limits():
+    input_schema = parse_problem_constraints(PROBLEMS["valid-parentheses"])
+
+    test_cases = LocalTestCaseGenerator(seed=3).generate(input_schema, Difficulty.EASY, 20)
+    lengths = {tuple(test_case.tags): len(test_case.test_case_content) - 2 for test_case in test_cases}
+
+    assert lengths[("boundary", "min-length", "s")] == 1
+    assert lengths[("boundary", "max-length", "s")] == 10
+    assert all(test_case.is_edge_case == ("boundary" in test_case.tags) for test_case in test_cases)
+
+
+def test_same_seed_gives_the_same_cases():
+    input_schema = parse_problem_constraints(PROBLEMS["two-sum"])
+
+    first = LocalTestCaseGenerator(seed=11).generate(input_schema, Difficulty.MEDIUM, 15)
+    second = LocalTestCaseGenerator(seed=11).generate(input_schema, Difficulty.MEDIUM, 15)
+
+    assert [case.test_case_content for case in first] == [case.test_case_content for case in second]
+    assert len({case.test_case_content for case in first}) == len(first)
+
+
+def test_schema_without_parameters_is_rejected():
+    empty = ProblemInputSchema(parameters=(), schema={"type": "object", "properties": {}}, schema_hash="empty")
+
+    with pytest.raises(TestCaseNotGeneratedException):
+        LocalTestCaseGenerator(seed=0).generate(empty, Difficulty.EASY, 5)
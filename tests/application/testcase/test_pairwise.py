@@ -0,0 +1,52 @@
+from itertools import product
+from math import prod
+
+import pytest
+
+from app.application.testcase.pairwise import covering_array, covers_all_interactions, missing_interactions
+
+
+@pytest.mark.parametrize(
+    "domains, strength",
+    [
+        ([[0, 1]] * 4, 2),
+        ([[0, 1]] * 10, 2),
+        ([["a", "b", "c"], [1, 2], [True, False, None, 0], ["x", "y"], [0.5, 1.5, 2.5]], 2),
+        ([[0, 1, 2]] * 6, 2),
+        ([[0, 1]] * 5, 3),
+        ([[0, 1, 2], [0, 1], [0, 1, 2, 3], [0, 1]], 3),
+    ],
+)
+def test_covering_array_covers_every_interaction(domains, strength):
+    rows = covering_array(domains, strength)
+
+    assert covers_all_interactions(rows, domains, strength)
+    assert all(row[parameter] in domains[parameter] for row in rows for parameter in range(len(domains)))
+    assert len(rows) < prod(len(domain) for domain in domains)
+
+
+def test_covering_array_is_the_product_when_strength_reaches_the_parameter_count():
+    domains = [[0, 1, 2], ["a", "b"]]
+
+    rows = covering_array(domains, strength=3)
+
+    assert sorted(rows) == sorted(product(*domains))
+
+
+def test_covering_array_handles_degenerate_domains():
+    assert covering_array([]) == []
+    assert covering_array([[1, 2], []]) == []
+    assert sorted(covering_array([[1, 2, 3]])) == [(1,), (2,), (3,)]
+
+
+def test_covering_array_rejects_strength_below_one():
+    with pytest.raises(ValueError):
+        covering_array([[0, 1]], strength=0)
+
+
+def test_missing_interactions_reports_the_uncovered_pair():
+    domains = [[0, 1], [0, 1]]
+
+    missing = missing_interactions([(0, 0), (0, 1), (1, 0)], domains)
+
+    assert missing == [((0, 1), (1, 1))]
@@ -0,0 +1,56 @@
+from app.application.testcase.constraints import parse_problem_constraints
+from app.application.testcase.validation import TestCaseValidator
+from app.domain.testcase.models.models import ProblemInputSchema, TestCase
+from tests.application.testcase.problems import PROBLEMS
+
+
+def _case(content: str) -> TestCase:
+    return TestCase(test_case_content=content, expected_result="[0,1]")
+
+
+def test_accepts_valid_cases_and_rejects_the_rest_with_a_reason():
+    input_schema = parse_problem_constraints(PROBLEMS["two-sum"])
+
+    report = TestCaseValidator().validate(input_schema, [
+        _case("[1,2,3]\n5"),
+        _case("[1]\n5"),
+        _case("[1,2]\n10000000000"),
+        _case("[1,2]"),
+    ])
+
+    assert [case.test_case_content for case in report.valid] == ["[1,2,3]\n5"]
+    reasons = [reason for _, reason in report.rejected]
+    assert reasons[0].startswith("nums")
+    assert reasons[1].startswith("target")
+    assert reasons[2] == "expected 2 argument(s)"
+
+
+def test_repairs_other_layouts_into_one_value_per_line():
+    input_schema = parse_problem_constraints(PROBLEMS["two-sum"])
+
+    report = TestCaseValidator().validate(input_schema, [
+        _case("nums = [3, 2, 4], target = 6"),
+        _case('{"target": 6, "nums": [3,2,4]}'),
+    ])
+
+    assert report.repaired == 2
+    assert [case.test_case_content for case in report.valid] == ["[3,2,4]\n6", "[3,2,4]\n6"]
+    assert all(case.expected_result == "[0,1]" for case in report.valid)
+
+
+def test_checks_sorted_distinct_arrays():
+    input_schema = parse_problem_constraints(PROBLEMS["search-insert-position"])
+
+    report = TestCaseValidator().validate(input_schema, [_case("[1,3,5]\n2"), _case("[3,1,5]\n2"), _case("[1,1,5]\n2")])
+
+    assert [case.test_case_content for case in report.valid] == ["[1,3,5]\n2"]
+    assert len(report.rejected) == 2
+
+
+def test_skips_validation_without_parameters():
+    empty = ProblemInputSchema(parameters=(), schema={"type": "object", "properties": {}}, schema_hash="empty")
+
+    report = TestCaseValidator().validate(empty, [_case("anything")])
+
+    assert report.skipped
+    assert len(report.valid) == 1